@@ -1,6 +1,9 @@
+from typing import Union
+
 import numpy as np
 
 from .DualQuaternion import DualQuaternion
+from .DualQuaternionArray import DualQuaternionArray
 from .PointHomogeneous import PointHomogeneous
 from .RationalCurve import RationalCurve
 
@@ -147,6 +150,76 @@ class AffineMetric:
         ab = a12 - b12
         return ab @ self.pose_distance_matrix @ ab
 
+    def squared_distance_12d(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """
+        Squared distances between poses given as 12D vectors, vectorized
+
+        The inputs broadcast against each other, see
+        :meth:`.DualQuaternion.as_12d_vector` for the 12D representation.
+
+        :param np.ndarray a: poses as 12D vectors of shape (..., 12)
+        :param np.ndarray b: poses as 12D vectors of shape (..., 12)
+
+        :return: squared distances of shape (...)
+        :rtype: np.ndarray
+        """
+        ab = np.asarray(a, dtype='float64') - np.asarray(b, dtype='float64')
+        return np.einsum('...i,ij,...j->...', ab, self.pose_distance_matrix, ab)
+
+    def distance_matrix(self,
+                        poses_a: Union[DualQuaternionArray, list[DualQuaternion],
+                                       np.ndarray],
+                        poses_b: Union[DualQuaternionArray, list[DualQuaternion],
+                                       np.ndarray] = None,
+                        squared: bool = False) -> np.ndarray:
+        """
+        Pairwise distances between two sets of poses
+
+        :param poses_a: N poses as DualQuaternionArray, list of DualQuaternions,
+            (N, 8) array of Study parameters or (N, 12) array of 12D vectors
+        :param poses_b: M poses in any of the forms of poses_a; if None, the
+            distances among poses_a are computed
+        :param bool squared: if True, squared distances are returned
+
+        :return: (N, M) array of distances
+        :rtype: np.ndarray
+        """
+        a12 = self.as_12d_vectors(poses_a)
+        b12 = a12 if poses_b is None else self.as_12d_vectors(poses_b)
+
+        a_metric = a12 @ self.pose_distance_matrix
+        sq_dist = (np.sum(a_metric * a12, axis=1)[:, np.newaxis]
+                   + np.sum((b12 @ self.pose_distance_matrix) * b12, axis=1)
+                   - 2 * a_metric @ b12.T)
+        # remove negative round-off errors
+        sq_dist = np.maximum(sq_dist, 0.)
+
+        return sq_dist if squared else np.sqrt(sq_dist)
+
+    @staticmethod
+    def as_12d_vectors(poses: Union[DualQuaternionArray, list[DualQuaternion],
+                                    np.ndarray]) -> np.ndarray:
+        """
+        Convert poses to an array of 12D vectors
+
+        :param poses: poses as DualQuaternionArray, list of DualQuaternions, (N, 8)
+            array of Study parameters or (N, 12) array of 12D vectors
+
+        :return: (N, 12) array of 12D vectors
+        :rtype: np.ndarray
+
+        :raises ValueError: if the poses array is neither of shape (N, 8) nor (N, 12)
+        """
+        if isinstance(poses, DualQuaternionArray):
+            return poses.as_12d_vectors()
+        elif isinstance(poses, np.ndarray):
+            if poses.ndim == 2 and poses.shape[1] == 12:
+                return np.asarray(poses, dtype='float64')
+            elif poses.ndim == 2 and poses.shape[1] == 8:
+                return DualQuaternionArray(poses).as_12d_vectors()
+            raise ValueError("Poses have to be of shape (N, 8) or (N, 12)")
+        return DualQuaternionArray.from_dual_quaternions(poses).as_12d_vectors()
+
     def distance(self, a: DualQuaternion, b: DualQuaternion) -> float:
         """
         Distance between two affine displacements
@@ -179,7 +252,9 @@ class AffineMetric:
         Inner product of two DualQuaternions in the affine space
 
         It is calculated as the sum of usual dot products of acted points, after the two
-        dual quaternions act on the points that define the metric.
+        dual quaternions act on the points that define the metric. For numeric dual
+        quaternions, the same quadratic form is evaluated on their 12D vectors using
+        the precomputed pose distance matrix.
 
         :param DualQuaternion a: displacement
         :param DualQuaternion b: displacement
@@ -187,6 +262,9 @@ class AffineMetric:
         :return: inner product of dq_a and dq_b
         :rtype: float
         """
+        if a.array().dtype.kind in 'fiu' and b.array().dtype.kind in 'fiu':
+            return self.squared_distance_12d(a.as_12d_vector(), b.as_12d_vector())
+
         inner_product = 0
         for i in range(self.number_of_points):
             a_point = a.act(self.points[i])
@@ -0,0 +1,147 @@
+from typing import Iterator
+
+import numpy as np
+
+
+class BoundingBallHierarchy:
+    """
+    Bounding volume hierarchy of a set of balls in 3D space.
+
+    The balls are stored in packed arrays and sorted so that every node of the
+    hierarchy covers a contiguous range of them. Every node stores the axis-aligned
+    box enclosing its balls. Two hierarchies are traversed simultaneously and only
+    the pairs of leaves with overlapping boxes are reported, the exact test of the
+    balls is left to the caller.
+
+    :ivar np.ndarray centers: (K, 3) array of ball centers, in the hierarchy order
+    :ivar np.ndarray radii: (K,) array of ball radii, in the hierarchy order
+    :ivar np.ndarray indices: (K,) array of the original indices of the balls
+
+    :examples:
+
+    .. testcode:: [ballhierarchy_example1]
+
+        # Find the candidate pairs of overlapping balls
+
+        import numpy as np
+        from rational_linkages.BoundingBallHierarchy import BoundingBallHierarchy
+
+        tree0 = BoundingBallHierarchy(np.random.rand(100, 3), np.full(100, 0.01))
+        tree1 = BoundingBallHierarchy(np.random.rand(100, 3) + 0.5, np.full(100, 0.01))
+
+        for idx0, idx1 in tree0.candidate_pairs(tree1):
+            pass
+
+    .. testcleanup:: [ballhierarchy_example1]
+
+        del np, BoundingBallHierarchy, tree0, tree1
+    """
+
+    def __init__(self,
+                 centers: np.ndarray,
+                 radii: np.ndarray,
+                 leaf_size: int = 16):
+        """
+        Build the hierarchy by median splits along the longest axis
+
+        :param np.ndarray centers: (K, 3) array of ball centers
+        :param np.ndarray radii: (K,) array of ball radii
+        :param int leaf_size: maximal number of balls in a leaf
+        """
+        centers = np.asarray(centers, dtype='float64').reshape(-1, 3)
+        radii = np.asarray(radii, dtype='float64').reshape(-1)
+
+        self.indices = np.arange(len(radii))
+
+        lower, upper, ranges, children = [], [], [], []
+        stack = [(0, len(radii), -1, 0)]
+        while stack:
+            start, end, parent, side = stack.pop()
+            node = len(ranges)
+            if parent >= 0:
+                children[parent][side] = node
+
+            idx = self.indices[start:end]
+            lower.append(np.min(centers[idx] - radii[idx, np.newaxis], axis=0,
+                                initial=np.inf))
+            upper.append(np.max(centers[idx] + radii[idx, np.newaxis], axis=0,
+                                initial=-np.inf))
+            ranges.append((start, end))
+            children.append([-1, -1])
+
+            if end - start > leaf_size:
+                axis = np.argmax(np.ptp(centers[idx], axis=0))
+                mid = (end - start) // 2
+                order = np.argpartition(centers[idx, axis], mid)
+                self.indices[start:end] = idx[order]
+
+                stack.append((start + mid, end, node, 1))
+                stack.append((start, start + mid, node, 0))
+
+        self.centers = centers[self.indices]
+        self.radii = radii[self.indices]
+
+        self._lower = np.array(lower).reshape(-1, 3)
+        self._upper = np.array(upper).reshape(-1, 3)
+        self._ranges = np.array(ranges, dtype=int).reshape(-1, 2)
+        self._children = np.array(children, dtype=int).reshape(-1, 2)
+
+    def __len__(self) -> int:
+        """
+        Number of balls in the hierarchy
+
+        :return: number of balls
+        :rtype: int
+        """
+        return len(self.radii)
+
+    def _boxes_overlap(self, node: int, other: "BoundingBallHierarchy",
+                       other_node: int) -> bool:
+        """
+        Check if the boxes of two nodes overlap
+
+        :param int node: node of this hierarchy
+        :param BoundingBallHierarchy other: other hierarchy
+        :param int other_node: node of the other hierarchy
+
+        :return: True if the boxes overlap, False otherwise
+        :rtype: bool
+        """
+        return bool(np.all(self._lower[node] <= other._upper[other_node])
+                    and np.all(other._lower[other_node] <= self._upper[node]))
+
+    def candidate_pairs(self, other: "BoundingBallHierarchy"
+                        ) -> Iterator[tuple[slice, slice]]:
+        """
+        Traverse both hierarchies and yield the leaves whose boxes overlap
+
+        The pairs are generated lazily, so the traversal stops as soon as the caller
+        stops iterating.
+
+        :param BoundingBallHierarchy other: other hierarchy
+
+        :return: iterator of pairs of slices into :attr:`centers` and :attr:`radii`
+            of this and the other hierarchy
+        :rtype: Iterator[tuple[slice, slice]]
+        """
+        if len(self) == 0 or len(other) == 0:
+            return
+
+        stack = [(0, 0)]
+        while stack:
+            node, other_node = stack.pop()
+            if not self._boxes_overlap(node, other, other_node):
+                continue
+
+            leaf = self._children[node, 0] < 0
+            other_leaf = other._children[other_node, 0] < 0
+
+            if leaf and other_leaf:
+                yield (slice(*self._ranges[node]),
+                       slice(*other._ranges[other_node]))
+            elif leaf or (not other_leaf
+                          and np.diff(other._ranges[other_node])[0]
+                          > np.diff(self._ranges[node])[0]):
+                stack.extend((node, child) for child in other._children[other_node])
+            else:
+                stack.extend((child, other_node) for child in self._children[node])
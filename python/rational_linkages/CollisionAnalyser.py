@@ -2,30 +2,61 @@ import numpy
 
 from sympy import symbols, Poly
 
+from .BoundingBallHierarchy import BoundingBallHierarchy
 from .Linkage import LineSegment
 from .DualQuaternion import DualQuaternion
 from .NormalizedLine import NormalizedLine
 from .PointHomogeneous import PointHomogeneous, PointOrbit
-from .RationalBezier import RationalSoo
+from .RationalBezier import BezierSegment, RationalSoo
 from .RationalCurve import RationalCurve
 from .RationalMechanism import RationalMechanism
 
 
 class CollisionAnalyser:
-    def __init__(self, mechanism: RationalMechanism):
+    def __init__(self, mechanism: RationalMechanism, min_splits: int = 20):
         self.mechanism = mechanism
         self.mechanism_points = mechanism.points_at_parameter(0,
                                                               inverted_part=True,
                                                               only_links=False)
         self.metric = mechanism.metric
 
-        self.segment_orbits = {}
+        self.segment_orbit_arrays = {}
+        self.segment_hierarchies = {}
         self.segments = {}
         for segment in mechanism.segments:
             self.segments[segment.id] = segment
 
+        self.min_splits = min_splits
         self.motions = self.get_motions()
-        self.bezier_splits = self.get_bezier_splits(20)
+        self.bezier_splits = self.get_bezier_splits(min_splits)
+
+    def update_points(self):
+        """
+        Update the analyser after the design of the mechanism changed.
+
+        The motions and their Bezier splits do not depend on the joint connection
+        points, so they are kept unless the metric of the mechanism changed. The
+        orbits of the segments are recomputed only if the connection points moved.
+        """
+        mechanism_points = self.mechanism.points_at_parameter(0,
+                                                              inverted_part=True,
+                                                              only_links=False)
+
+        # the segments are recreated by RationalMechanism.update_segments()
+        self.segments = {segment.id: segment for segment in self.mechanism.segments}
+
+        if self.metric is not self.mechanism.metric:
+            self.metric = self.mechanism.metric
+            self.motions = self.get_motions()
+            self.bezier_splits = self.get_bezier_splits(self.min_splits)
+        elif (len(mechanism_points) == len(self.mechanism_points)
+              and all(numpy.array_equal(p.coordinates, q.coordinates)
+                      for p, q in zip(mechanism_points, self.mechanism_points))):
+            return
+
+        self.mechanism_points = mechanism_points
+        self.segment_orbit_arrays = {}
+        self.segment_hierarchies = {}
 
     def get_bezier_splits(self, min_splits: int = 0) -> list:
         """
@@ -66,146 +97,710 @@ class CollisionAnalyser:
     def get_segment_orbit(self, segment_id: str):
         """
         Get the orbit of a segment.
+
+        The orbit is created from the packed arrays of
+        :meth:`.CollisionAnalyser.get_segment_orbit_arrays`.
+
+        :param str segment_id: ID of the segment
+
+        :return: list of orbits for every parameter interval, in the form
+            [t_interval, orbit0, interpolated balls, ..., orbit1]
+        :rtype: list[list]
         """
-        segment = self.segments[segment_id]
+        return self.orbits_from_arrays(*self.get_segment_orbit_arrays(segment_id))
 
-        if segment.type == 'l':
-            if segment.factorization_idx == 0:
-                split_idx = segment.idx - 1
-                p0_idx = 2 * segment.idx - 1
-                p1_idx = 2 * segment.idx
-            else:
-                split_idx = -1 * segment.idx
-                p0_idx = -2 * segment.idx - 1
-                p1_idx = -2 * segment.idx
-        else:  # type == 'j'
-            if segment.factorization_idx == 0:
-                split_idx = segment.idx - 1
-                p0_idx = 2 * segment.idx
-                p1_idx = 2 * segment.idx + 1
+    def get_segment_orbit_arrays(self, segment_id: str) -> tuple:
+        """
+        Get the balls of the orbit of a segment as packed arrays.
+
+        The arrays are computed once per segment. The balls of every orbit are ordered
+        as in :meth:`.CollisionAnalyser.get_segment_orbit`, i.e. the orbit of the first
+        point, the interpolated balls and the orbit of the second point.
+
+        :param str segment_id: ID of the segment
+
+        :return: tuple (centers of shape (K, 3), radii of shape (K,), orbit indices of
+            shape (K,), parameter intervals of the orbits)
+        :rtype: tuple
+        """
+        if segment_id not in self.segment_orbit_arrays:
+            p0, p1, splits = self.get_segment_points_and_splits(segment_id)
+
+            if splits is not None:
+                orbit_arrays = self.get_splits_orbit_arrays(p0, p1, splits)
+                t_intervals = [split.t_param_of_motion_curve for split in splits]
             else:
-                split_idx = -1 * segment.idx
-                p0_idx = -2 * segment.idx - 1
-                p1_idx = -2 * segment.idx - 2
+                diff = p0.coordinates - p1.coordinates
+                radius = numpy.sqrt(numpy.dot(diff, diff) / 10)
+                orbit_arrays = self.connect_orbit_arrays(
+                    p0.normalized_in_3d()[numpy.newaxis], numpy.array([radius]),
+                    p1.normalized_in_3d()[numpy.newaxis], numpy.array([radius]))
+                t_intervals = [(None, [-1, 1])]
+
+            self.segment_orbit_arrays[segment_id] = (*orbit_arrays, t_intervals)
+
+        return self.segment_orbit_arrays[segment_id]
+
+    def get_segment_points_and_splits(self, segment_id: str) -> tuple:
+        """
+        Get the end points of a segment and the Bezier splits of its motion.
+
+        :param str segment_id: ID of the segment
+
+        :return: tuple (point0, point1, splits); splits are None for the base, which
+            does not move
+        :rtype: tuple
+        """
+        segment = self.segments[segment_id]
+        split_idx, p0_idx, p1_idx = self.get_split_and_point_indices(segment)
 
         p0 = self.mechanism_points[p0_idx]
         p1 = self.mechanism_points[p1_idx]
+        splits = self.bezier_splits[split_idx] if segment.type != 'b' else None
 
-        if segment.type != 'b':
-            rel_bezier_splits = self.bezier_splits[split_idx]
-
-            orbits0 = [PointOrbit(*p0.get_point_orbit(acting_center=split.ball.center,
-                                                      acting_radius=split.ball.radius_squared,
-                                                      metric=self.metric),
-                                  t_interval=split.t_param_of_motion_curve)
-                       for split in rel_bezier_splits]
-            orbits1 = [PointOrbit(*p1.get_point_orbit(acting_center=split.ball.center,
-                                                      acting_radius=split.ball.radius_squared,
-                                                      metric=self.metric),
-                                  t_interval=split.t_param_of_motion_curve)
-                       for split in rel_bezier_splits]
-        else:
-            diff = p0.coordinates - p1.coordinates
-            radius_sq = numpy.dot(diff, diff) / 10
-            orbits0 = [PointOrbit(point_center=p0, radius_squared=radius_sq, t_interval=(None, [-1,1]))]
-            orbits1 = [PointOrbit(point_center=p1, radius_squared=radius_sq, t_interval=(None, [-1,1]))]
+        return p0, p1, splits
 
-        all_orbits = []
-        for i in range(len(orbits0)):
-            orbits_for_t = [orbits0[i].t_interval, orbits0[i]]
-            dist = numpy.linalg.norm(orbits0[i].center.normalized_in_3d() - orbits1[i].center.normalized_in_3d())
-            radius_sum = orbits0[i].radius + orbits1[i].radius
-            if dist > radius_sum:
-                add_balls = dist / radius_sum
-                num_steps = int(add_balls) * 2 + 1
-
-                # linear interpolation from smaller ball to bigger ball
-                radii = 0
-                radius_diff = orbits1[i].radius - orbits0[i].radius
-                center_diff = orbits1[i].center - orbits0[i].center
-                for j in range(1, num_steps):
-                    new_radius = orbits0[i].radius + j * radius_diff / num_steps
-                    radii += new_radius
-                    new_center = orbits0[i].center + 2 * radii * center_diff / (dist * 2)
-                    orbits_for_t.append(PointOrbit(new_center, new_radius ** 2, orbits0[i].t_interval))
-            orbits_for_t.append(orbits1[i])
-            all_orbits.append(orbits_for_t)
+    def get_splits_orbits(self,
+                          p0: PointHomogeneous,
+                          p1: PointHomogeneous,
+                          splits: list[BezierSegment]) -> list[list]:
+        """
+        Get the orbits of a segment for the Bezier splits of its motion.
+
+        :param PointHomogeneous p0: first point of the segment
+        :param PointHomogeneous p1: second point of the segment
+        :param list[BezierSegment] splits: Bezier splits of the motion of the segment
+
+        :return: list of orbits for every split, in the form
+            [t_interval, orbit0, interpolated balls, ..., orbit1]
+        :rtype: list[list]
+        """
+        return self.orbits_from_arrays(*self.get_splits_orbit_arrays(p0, p1, splits),
+                                       [split.t_param_of_motion_curve
+                                        for split in splits])
+
+    def get_splits_orbit_arrays(self,
+                                p0: PointHomogeneous,
+                                p1: PointHomogeneous,
+                                splits: list[BezierSegment]) -> tuple:
+        """
+        Get the balls of the orbits of a segment for Bezier splits as packed arrays.
+
+        The orbits of both points for all splits are computed at once by
+        :meth:`.PointHomogeneous.get_points_orbits`.
+
+        :param PointHomogeneous p0: first point of the segment
+        :param PointHomogeneous p1: second point of the segment
+        :param list[BezierSegment] splits: Bezier splits of the motion of the segment
+
+        :return: tuple (centers of shape (K, 3), radii of shape (K,), orbit indices of
+            shape (K,)), see :meth:`.CollisionAnalyser.connect_orbit_arrays`
+        :rtype: tuple
+        """
+        acting_centers = numpy.array([split.ball.center.coordinates
+                                      for split in splits], dtype='float64')
+        acting_radii = numpy.array([split.ball.radius_squared for split in splits],
+                                   dtype='float64')
+
+        centers, radii_squared = PointHomogeneous.get_points_orbits(
+            numpy.array([p0.coordinates, p1.coordinates], dtype='float64'),
+            acting_centers, acting_radii, self.metric)
+        radii = numpy.sqrt(radii_squared)
+
+        return self.connect_orbit_arrays(centers[:, 0, 1:], radii[:, 0],
+                                         centers[:, 1, 1:], radii[:, 1])
+
+    @staticmethod
+    def connect_orbits(orbits0: list[PointOrbit],
+                       orbits1: list[PointOrbit]) -> list[list]:
+        """
+        Connect the orbits of the two points of a segment by interpolated balls.
+
+        :param list[PointOrbit] orbits0: orbits of the first point
+        :param list[PointOrbit] orbits1: orbits of the second point
+
+        :return: list of orbits for every parameter interval, in the form
+            [t_interval, orbit0, interpolated balls, ..., orbit1]
+        :rtype: list[list]
+        """
+        centers0, radii0 = CollisionAnalyser.pack_balls(orbits0)
+        centers1, radii1 = CollisionAnalyser.pack_balls(orbits1)
+
+        return CollisionAnalyser.orbits_from_arrays(
+            *CollisionAnalyser.connect_orbit_arrays(centers0, radii0, centers1, radii1),
+            [orbit.t_interval for orbit in orbits0])
 
+    @staticmethod
+    def connect_orbit_arrays(centers0: numpy.ndarray,
+                             radii0: numpy.ndarray,
+                             centers1: numpy.ndarray,
+                             radii1: numpy.ndarray) -> tuple:
+        """
+        Connect many pairs of orbits of the two points of a segment at once.
+
+        If two orbits do not overlap, the gap between them is filled by balls with
+        linearly interpolated radii.
+
+        :param numpy.ndarray centers0: (S, 3) array of centers of the first orbits
+        :param numpy.ndarray radii0: (S,) array of radii of the first orbits
+        :param numpy.ndarray centers1: (S, 3) array of centers of the second orbits
+        :param numpy.ndarray radii1: (S,) array of radii of the second orbits
+
+        :return: tuple (centers of shape (K, 3), radii of shape (K,), orbit indices of
+            shape (K,)); the balls of every orbit are the first orbit, the interpolated
+            balls and the second orbit
+        :rtype: tuple
+        """
+        centers0 = numpy.asarray(centers0, dtype='float64').reshape(-1, 3)
+        centers1 = numpy.asarray(centers1, dtype='float64').reshape(-1, 3)
+        radii0 = numpy.asarray(radii0, dtype='float64').reshape(-1)
+        radii1 = numpy.asarray(radii1, dtype='float64').reshape(-1)
+
+        dist = numpy.linalg.norm(centers1 - centers0, axis=1)
+        radius_sum = radii0 + radii1
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            num_steps = numpy.where(dist > radius_sum,
+                                    (dist / radius_sum).astype(int) * 2 + 1, 1)
+
+        # every orbit has num_steps - 1 interpolated balls and the two end balls
+        num_balls = num_steps + 1
+        offsets = numpy.cumsum(num_balls) - num_balls
+        orbit_indices = numpy.repeat(numpy.arange(len(num_balls)), num_balls)
+        step = numpy.arange(len(orbit_indices)) - offsets[orbit_indices]
+
+        # linear interpolation from smaller ball to bigger ball
+        steps_of_orbits = num_steps[orbit_indices]
+        interpolated = (step > 0) & (step < steps_of_orbits)
+        radii = numpy.where(step == 0, radii0[orbit_indices], radii1[orbit_indices])
+        radii[interpolated] = (radii0[orbit_indices]
+                               + step * (radii1 - radii0)[orbit_indices]
+                               / steps_of_orbits)[interpolated]
+
+        # centers are shifted by the sum of the radii of the interpolated balls
+        shift = numpy.cumsum(numpy.where(interpolated, radii, 0.0))
+        shift -= shift[offsets][orbit_indices]
+        centers = numpy.where((step < steps_of_orbits)[:, numpy.newaxis],
+                              centers0[orbit_indices], centers1[orbit_indices])
+        centers[interpolated] += (
+            2 * shift[:, numpy.newaxis]
+            * (centers1 - centers0)[orbit_indices]
+            / (dist[orbit_indices, numpy.newaxis] * 2))[interpolated]
+
+        return centers, radii, orbit_indices
+
+    @staticmethod
+    def orbits_from_arrays(centers: numpy.ndarray,
+                           radii: numpy.ndarray,
+                           orbit_indices: numpy.ndarray,
+                           t_intervals: list) -> list[list]:
+        """
+        Create the orbit objects from packed arrays.
+
+        :param numpy.ndarray centers: (K, 3) array of ball centers
+        :param numpy.ndarray radii: (K,) array of ball radii
+        :param numpy.ndarray orbit_indices: (K,) array of orbit indices of the balls
+        :param list t_intervals: parameter intervals of the orbits
+
+        :return: list of orbits for every parameter interval, in the form
+            [t_interval, orbit0, interpolated balls, ..., orbit1]
+        :rtype: list[list]
+        """
+        all_orbits = [[t_interval] for t_interval in t_intervals]
+        for center, radius, orbit_idx in zip(centers, radii, orbit_indices):
+            all_orbits[orbit_idx].append(
+                PointOrbit(PointHomogeneous.from_3d_point(center),
+                           radius ** 2,
+                           t_intervals[orbit_idx]))
         return all_orbits
 
     def check_two_segments(self, segment0: str, segment1: str, t_interval=None):
         """
         Check if two segments collide.
-        """
-        if not segment0 in self.segment_orbits:
-            self.segment_orbits[segment0] = self.get_segment_orbit(segment0)
 
-        if not segment1 in self.segment_orbits:
-            self.segment_orbits[segment1] = self.get_segment_orbit(segment1)
+        The balls of the segment orbits are queried through their bounding volume
+        hierarchies and the check returns on the first colliding pair of balls.
+
+        :param str segment0: ID of the first segment
+        :param str segment1: ID of the second segment
+        :param tuple t_interval: if given, only the balls of the Bezier split
+            containing the parameter are checked, in the form (inverted_part, t)
 
-        seg_orb0 = self.segment_orbits[segment0]
-        seg_orb1 = self.segment_orbits[segment1]
+        :return: True if any balls of the segments collide, False otherwise
+        :rtype: bool
 
+        :raises ValueError: if no Bezier split contains the given parameter
+        """
         if t_interval is None:  # check for all t
-            link_balls_0 = []
-            for ball in seg_orb0:
-                link_balls_0 += ball[1:]
-
-            link_balls_1 = []
-            for ball in seg_orb1:
-                link_balls_1 += ball[1:]
-
-            import time
-            start_time = time.time()
-
-            num_checked_balls = 0
-            num_of_collisions = 0
-            it_collides = False
-            for ball0 in link_balls_0:
-                for ball1 in link_balls_1:
-                    num_checked_balls += 1
-                    if self.check_two_miniballs(ball0, ball1):
-                        num_of_collisions += 1
-                        it_collides = True
-
-            print(f'Number of checked balls: {num_checked_balls}')
-            print(f'time for checking balls: {time.time() - start_time}')
-
-        elif isinstance(t_interval[1], float):
-            for i, interval in enumerate(seg_orb0):
-                start, end = interval[0][1][0], interval[0][1][1]
-                if start <= t_interval[1] <= end and (t_interval[0] == interval[0][0] or interval[0][0] is None):  # None for base
-                    link_balls_0 = seg_orb0[i][1:]
-                else:
-                    ValueError('Given interval is not valid')
+            hierarchy0 = self.get_segment_hierarchy(segment0, from_orbits=True)
+            hierarchy1 = self.get_segment_hierarchy(segment1, from_orbits=True)
+
+            for idx0, idx1 in hierarchy0.candidate_pairs(hierarchy1):
+                if numpy.any(self.check_miniballs_arrays(hierarchy0.centers[idx0],
+                                                         hierarchy0.radii[idx0],
+                                                         hierarchy1.centers[idx1],
+                                                         hierarchy1.radii[idx1])):
+                    return True
+            return False
+
+        link_balls = []
+        for segment_id in (segment0, segment1):
+            centers, radii, orbit_indices, t_intervals = self.get_segment_orbit_arrays(
+                segment_id)
+            orbits = [i for i, (inverted_part, interval) in enumerate(t_intervals)
+                      if interval[0] <= t_interval[1] <= interval[1]
+                      and (t_interval[0] == inverted_part
+                           or inverted_part is None)]  # None for base
+            if not orbits:
+                raise ValueError('Given interval is not valid')
+            in_orbit = orbit_indices == orbits[-1]
+            link_balls.append((centers[in_orbit], radii[in_orbit]))
+
+        return bool(numpy.any(self.check_miniballs_arrays(*link_balls[0],
+                                                          *link_balls[1])))
+
+    @staticmethod
+    def pack_balls(balls: list[PointOrbit]) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Pack balls into arrays of centers and radii.
+
+        :param list[PointOrbit] balls: balls to pack
+
+        :return: tuple (centers of shape (K, 3), radii of shape (K,))
+        :rtype: tuple[numpy.ndarray, numpy.ndarray]
+        """
+        centers = numpy.array([ball.center.normalized_in_3d() for ball in balls],
+                              dtype='float64').reshape(-1, 3)
+        radii = numpy.array([ball.radius for ball in balls], dtype='float64')
+        return centers, radii
+
+    @staticmethod
+    def check_miniballs_arrays(centers0: numpy.ndarray,
+                               radii0: numpy.ndarray,
+                               centers1: numpy.ndarray,
+                               radii1: numpy.ndarray) -> numpy.ndarray:
+        """
+        Check all pairs of two sets of miniballs for collisions.
+
+        Vectorized version of :meth:`.CollisionAnalyser.check_two_miniballs`.
+
+        :param numpy.ndarray centers0: (K, 3) array of centers of the first set
+        :param numpy.ndarray radii0: (K,) array of radii of the first set
+        :param numpy.ndarray centers1: (L, 3) array of centers of the second set
+        :param numpy.ndarray radii1: (L,) array of radii of the second set
+
+        :return: (K, L) boolean array, True for colliding pairs
+        :rtype: numpy.ndarray
+        """
+        diff = centers0[:, numpy.newaxis, :] - centers1[numpy.newaxis, :, :]
+        center_dist = numpy.sqrt(numpy.einsum('ijk,ijk->ij', diff, diff))
+        return center_dist <= radii0[:, numpy.newaxis] + radii1[numpy.newaxis, :]
+
+    def get_segment_hierarchy(self,
+                              segment_id: str,
+                              from_orbits: bool = False) -> BoundingBallHierarchy:
+        """
+        Get the bounding volume hierarchy of the balls of a segment.
+
+        The hierarchy is built once per segment.
+
+        :param str segment_id: ID of the segment
+        :param bool from_orbits: if True, all balls of the segment orbit (see
+            :meth:`.CollisionAnalyser.get_segment_orbit`) are used, otherwise the
+            balls of :meth:`.CollisionAnalyser.get_segment_balls`
+
+        :return: hierarchy of the bounding balls
+        :rtype: BoundingBallHierarchy
+        """
+        key = (segment_id, from_orbits)
+        if key not in self.segment_hierarchies:
+            if from_orbits:
+                balls = self.get_segment_orbit_arrays(segment_id)[:2]
+            else:
+                balls = self.get_segment_balls(segment_id)
+            self.segment_hierarchies[key] = BoundingBallHierarchy(*balls)
+        return self.segment_hierarchies[key]
+
+    def get_segment_balls(self, segment_id: str) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Get the bounding balls of the volume swept by a segment as arrays.
+
+        Moving segments are covered by their orbits (see
+        :meth:`.CollisionAnalyser.get_segment_orbit`), static segments by a single
+        ball around the segment.
+
+        :param str segment_id: ID of the segment
+
+        :return: tuple (centers of shape (K, 3), radii of shape (K,))
+        :rtype: tuple[numpy.ndarray, numpy.ndarray]
+        """
+        segment = self.segments[segment_id]
 
-            for i, interval in enumerate(seg_orb1):
-                start, end = interval[0][1][0], interval[0][1][1]
-                if start <= t_interval[1] <= end and (t_interval[0] == interval[0][0] or interval[0][0] is None):
-                    link_balls_1 = seg_orb1[i][1:]
+        if segment.points_coeffs.shape[2] == 1:  # static segment
+            p0, p1 = segment.evaluate_points(numpy.zeros(1))
+            centers = (p0 + p1) / 2
+            radii = numpy.linalg.norm(p1 - p0, axis=1) / 2
+        else:
+            centers, radii = self.get_segment_orbit_arrays(segment_id)[:2]
+
+        return centers, radii
+
+    def segments_may_collide(self, segment0: str, segment1: str) -> bool:
+        """
+        Broad-phase check if the volumes swept by two segments may overlap.
+
+        The bounding balls are queried through their bounding volume hierarchies
+        and the check returns as soon as an overlapping pair is found. If False is
+        returned, the segments do not collide during the whole motion and no root
+        finding is needed.
+
+        :param str segment0: ID of the first segment
+        :param str segment1: ID of the second segment
+
+        :return: True if any bounding balls of the segments overlap, False otherwise
+        :rtype: bool
+        """
+        hierarchy0 = self.get_segment_hierarchy(segment0)
+        hierarchy1 = self.get_segment_hierarchy(segment1)
+
+        # degenerated orbits cannot exclude the collision
+        if not all(numpy.all(numpy.isfinite(arr))
+                   for arr in (hierarchy0.centers, hierarchy0.radii,
+                               hierarchy1.centers, hierarchy1.radii)):
+            return True
+
+        for idx0, idx1 in hierarchy0.candidate_pairs(hierarchy1):
+            diff = (hierarchy0.centers[idx0, numpy.newaxis, :]
+                    - hierarchy1.centers[numpy.newaxis, idx1, :])
+            dist = numpy.linalg.norm(diff, axis=2)
+            if numpy.any(dist <= hierarchy0.radii[idx0, numpy.newaxis]
+                         + hierarchy1.radii[numpy.newaxis, idx1]):
+                return True
+
+        return False
+
+    def get_segment_ball_intervals(self, segment_id: str
+                                   ) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Get the parameter intervals of the balls of a segment orbit.
+
+        The balls are ordered as in :meth:`.CollisionAnalyser.get_segment_hierarchy`
+        with ``from_orbits=True``.
+
+        :param str segment_id: ID of the segment
+
+        :return: tuple (branches of shape (K,), bounds of shape (K, 2)); the branch
+            is 0 for the curve, 1 for its inverse part and -1 for balls valid for all
+            parameters (static segments), whose bounds are infinite
+        :rtype: tuple[numpy.ndarray, numpy.ndarray]
+        """
+        orbit_indices, t_intervals = self.get_segment_orbit_arrays(segment_id)[2:]
+
+        branches = numpy.array([-1 if inverted_part is None else int(inverted_part)
+                                for inverted_part, _ in t_intervals], dtype=int)
+        bounds = numpy.array([interval for _, interval in t_intervals],
+                             dtype='float64').reshape(-1, 2)
+        bounds[branches < 0] = (-numpy.inf, numpy.inf)
+
+        return branches[orbit_indices], bounds[orbit_indices]
+
+    def colliding_intervals(self,
+                            segment0: str,
+                            segment1: str,
+                            tolerance: float = None) -> list[tuple]:
+        """
+        Find the parameter intervals in which two segments may collide.
+
+        The balls of both segment orbits are compared through their bounding volume
+        hierarchies, and a pair of colliding balls counts only if their parameter
+        intervals overlap. The result is conservative: the segments do not collide
+        outside the returned intervals.
+
+        If the tolerance is given, the Bezier splits of the colliding orbits are
+        subdivided recursively, see :meth:`.CollisionAnalyser.refine_orbit_pair`.
+        Only the near-contact parameter ranges are refined, so an analyser with few
+        initial splits (``min_splits``) is sufficient.
+
+        :param str segment0: ID of the first segment
+        :param str segment1: ID of the second segment
+        :param float tolerance: if given, the colliding orbits are refined until
+            their common parameter interval is not longer than the tolerance
+
+        :return: sorted list of disjoint intervals in the form of
+            :attr:`.BezierSegment.t_param_of_motion_curve`, i.e.
+            (inverted_part, [t_start, t_end]); (None, [-1.0, 1.0]) stands for all
+            parameter values
+        :rtype: list[tuple]
+
+        :raises ValueError: if the tolerance is not positive
+        """
+        if tolerance is not None and tolerance <= 0:
+            raise ValueError('Tolerance has to be positive')
+
+        hierarchy0 = self.get_segment_hierarchy(segment0, from_orbits=True)
+        hierarchy1 = self.get_segment_hierarchy(segment1, from_orbits=True)
+        branches0, bounds0 = self.get_segment_ball_intervals(segment0)
+        branches1, bounds1 = self.get_segment_ball_intervals(segment1)
+
+        found_balls0 = []
+        found_balls1 = []
+        for idx0, idx1 in hierarchy0.candidate_pairs(hierarchy1):
+            collide = self.check_miniballs_arrays(hierarchy0.centers[idx0],
+                                                  hierarchy0.radii[idx0],
+                                                  hierarchy1.centers[idx1],
+                                                  hierarchy1.radii[idx1])
+            i, j = numpy.nonzero(collide)
+            balls0 = hierarchy0.indices[idx0][i]
+            balls1 = hierarchy1.indices[idx1][j]
+
+            br0, br1 = branches0[balls0], branches1[balls1]
+            start = numpy.maximum(bounds0[balls0, 0], bounds1[balls1, 0])
+            end = numpy.minimum(bounds0[balls0, 1], bounds1[balls1, 1])
+            # touching intervals are skipped, a collision at their common end is
+            # covered by the neighbouring intervals
+            valid = (((br0 == br1) | (br0 < 0) | (br1 < 0))
+                     & (start < end))
+
+            found_balls0.append(balls0[valid])
+            found_balls1.append(balls1[valid])
+
+        if not found_balls0:
+            return []
+
+        found_balls0 = numpy.concatenate(found_balls0)
+        found_balls1 = numpy.concatenate(found_balls1)
+
+        # overlapping leaves without any valid pair of balls
+        if found_balls0.size == 0:
+            return []
+
+        if tolerance is None:
+            found_branches = numpy.maximum(branches0[found_balls0],
+                                           branches1[found_balls1])
+            found_bounds = numpy.column_stack(
+                (numpy.maximum(bounds0[found_balls0, 0], bounds1[found_balls1, 0]),
+                 numpy.minimum(bounds0[found_balls0, 1], bounds1[found_balls1, 1])))
+            return self.merge_intervals(found_branches, found_bounds)
+
+        # colliding pairs of orbits, i.e. of Bezier splits
+        orbit_pairs = numpy.unique(
+            numpy.column_stack((self.get_segment_ball_orbits(segment0)[found_balls0],
+                                self.get_segment_ball_orbits(segment1)[found_balls1])),
+            axis=0)
+
+        found_branches = []
+        found_bounds = []
+        for orbit0, orbit1 in orbit_pairs:
+            branches, bounds = self.refine_orbit_pair(segment0, int(orbit0),
+                                                      segment1, int(orbit1),
+                                                      tolerance)
+            found_branches.append(branches)
+            found_bounds.append(bounds)
+
+        return self.merge_intervals(numpy.concatenate(found_branches),
+                                    numpy.concatenate(found_bounds))
+
+    @staticmethod
+    def merge_intervals(branches: numpy.ndarray, bounds: numpy.ndarray) -> list[tuple]:
+        """
+        Merge overlapping parameter intervals of the same branch.
+
+        :param numpy.ndarray branches: (K,) array of branches of the intervals, 0 for
+            the curve, 1 for its inverse part and -1 for all parameter values
+        :param numpy.ndarray bounds: (K, 2) array of the interval bounds
+
+        :return: sorted list of disjoint intervals in the form
+            (inverted_part, [t_start, t_end])
+        :rtype: list[tuple]
+        """
+        if len(branches) == 0:
+            return []
+
+        if numpy.any(branches < 0):  # both segments are static
+            return [(None, [-1.0, 1.0])]
+
+        intervals = []
+        for branch in (0, 1):
+            branch_bounds = bounds[branches == branch]
+            branch_bounds = branch_bounds[numpy.argsort(branch_bounds[:, 0])]
+
+            # merge the overlapping intervals
+            merged = []
+            for start, end in branch_bounds:
+                if merged and start <= merged[-1][1]:
+                    merged[-1][1] = max(merged[-1][1], end)
                 else:
-                    ValueError('Given interval is not valid')
+                    merged.append([start, end])
+            intervals += [(bool(branch), [float(start), float(end)])
+                          for start, end in merged]
+
+        return intervals
+
+    def get_segment_ball_orbits(self, segment_id: str) -> numpy.ndarray:
+        """
+        Get the indices of the orbits the balls of a segment belong to.
+
+        The balls are ordered as in :meth:`.CollisionAnalyser.get_segment_hierarchy`
+        with ``from_orbits=True``, the orbits as in
+        :meth:`.CollisionAnalyser.get_segment_orbit`.
+
+        :param str segment_id: ID of the segment
+
+        :return: (K,) array of orbit indices
+        :rtype: numpy.ndarray
+        """
+        return self.get_segment_orbit_arrays(segment_id)[2]
+
+    def refine_orbit_pair(self,
+                          segment0: str,
+                          orbit0: int,
+                          segment1: str,
+                          orbit1: int,
+                          tolerance: float) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Refine the colliding orbits of two segments by subdividing their splits.
+
+        The Bezier split with the longer parameter interval is halved by
+        :meth:`.BezierSegment.split_de_casteljau` and only the halves whose orbits
+        still collide with the other orbit (see
+        :meth:`.CollisionAnalyser.check_miniballs_arrays`) are refined further, until
+        the common parameter interval is not longer than the tolerance. The orbits of
+        the base are not subdivided.
+
+        :param str segment0: ID of the first segment
+        :param int orbit0: index of the orbit of the first segment
+        :param str segment1: ID of the second segment
+        :param int orbit1: index of the orbit of the second segment
+        :param float tolerance: maximal length of the resulting intervals
+
+        :return: tuple (branches of shape (K,), bounds of shape (K, 2)) of the
+            colliding intervals, see :meth:`.CollisionAnalyser.merge_intervals`
+        :rtype: tuple[numpy.ndarray, numpy.ndarray]
+        """
+        points = []
+        nodes = []
+        for segment_id, orbit_idx in ((segment0, orbit0), (segment1, orbit1)):
+            p0, p1, splits = self.get_segment_points_and_splits(segment_id)
+            points.append((p0, p1))
+            split = splits[orbit_idx] if splits is not None else None
+            centers, radii, orbit_indices = self.get_segment_orbit_arrays(
+                segment_id)[:3]
+            in_orbit = orbit_indices == orbit_idx
+            nodes.append(self._orbit_node(split, centers[in_orbit], radii[in_orbit]))
+
+        found_branches = []
+        found_bounds = []
+        stack = [tuple(nodes)]
+        while stack:
+            pair = stack.pop()
+            branch, start, end = self._common_interval(*pair)
+
+            lengths = [node[2] - node[1] if node[0] is not None else -numpy.inf
+                       for node in pair]
+            if end - start <= tolerance or max(lengths) == -numpy.inf:
+                found_branches.append(branch)
+                found_bounds.append((start, end))
+                continue
+
+            # subdivide the longer split
+            side = int(numpy.argmax(lengths))
+            other = pair[1 - side]
+            for split in pair[side][0].split_de_casteljau():
+                child = self._orbit_node(
+                    split, *self.get_splits_orbit_arrays(*points[side], [split])[:2])
+
+                child_pair = (child, other) if side == 0 else (other, child)
+                if self._common_interval(*child_pair) is None:
+                    continue
+                if numpy.any(self.check_miniballs_arrays(child[3], child[4],
+                                                         other[3], other[4])):
+                    stack.append(child_pair)
+
+        return (numpy.array(found_branches, dtype=int),
+                numpy.array(found_bounds, dtype='float64').reshape(-1, 2))
+
+    @staticmethod
+    def _orbit_node(split: BezierSegment,
+                    centers: numpy.ndarray,
+                    radii: numpy.ndarray) -> tuple:
+        """
+        Pack an orbit of a Bezier split for the refinement.
+
+        :param BezierSegment split: Bezier split, None for the base
+        :param numpy.ndarray centers: (K, 3) array of centers of the orbit balls
+        :param numpy.ndarray radii: (K,) array of radii of the orbit balls
+
+        :return: tuple (split, start, end, centers, radii); the base is valid for all
+            parameters, i.e. its bounds are infinite
+        :rtype: tuple
+        """
+        if split is None:
+            return split, -numpy.inf, numpy.inf, centers, radii
+
+        start, end = split.t_param_of_motion_curve[1]
+        return split, start, end, centers, radii
+
+    @staticmethod
+    def _common_interval(node0: tuple, node1: tuple) -> tuple:
+        """
+        Get the common parameter interval of two orbit nodes.
 
-            num_of_collisions = 0
-            it_collides = False
-            for ball0 in link_balls_0:
-                for ball1 in link_balls_1:
-                    if self.check_two_miniballs(ball0, ball1):
-                        num_of_collisions += 1
-                        it_collides = True
+        :param tuple node0: first node, see :meth:`.CollisionAnalyser._orbit_node`
+        :param tuple node1: second node
 
-        print(f'Number of colliding balls: {num_of_collisions}')
+        :return: tuple (branch, start, end), None if the intervals do not overlap
+        :rtype: tuple
+        """
+        branches = [int(node[0].t_param_of_motion_curve[0])
+                    if node[0] is not None else -1 for node in (node0, node1)]
+        if branches[0] >= 0 and branches[1] >= 0 and branches[0] != branches[1]:
+            return None
+
+        start = max(node0[1], node1[1])
+        end = min(node0[2], node1[2])
+        if not start < end:
+            return None
+
+        return max(branches), start, end
+
+    def check_all_segments(self,
+                           pairs: list[tuple[str, str]] = None,
+                           only_links: bool = False,
+                           tolerance: float = None) -> dict[tuple[str, str], list]:
+        """
+        Guaranteed collision detection of all pairs of segments of the mechanism.
+
+        The orbit hierarchies of the segments are built once and every pair is swept
+        over the parameter intervals of the Bezier splits, see
+        :meth:`.CollisionAnalyser.colliding_intervals`. The pairs are independent of
+        each other, so they can be distributed over processes.
+
+        :param list[tuple[str, str]] pairs: pairs of segment IDs to check; if None,
+            the pairs of :meth:`.RationalMechanism.collision_check_pairs` are used
+        :param bool only_links: if True and pairs are not given, only link-link pairs
+            are checked
+        :param float tolerance: if given, the colliding intervals are refined
+            adaptively up to the tolerance
+
+        :return: dictionary of the pairs of segment IDs and their colliding intervals;
+            an empty list means that the pair does not collide
+        :rtype: dict[tuple[str, str], list]
+        """
+        if pairs is None:
+            segment_ids = [segment.id for segment in self.mechanism.segments]
+            pairs = [(segment_ids[ii], segment_ids[jj])
+                     for ii, jj in self.mechanism.collision_check_pairs(only_links)]
 
-        return it_collides
+        return {(segment0, segment1): self.colliding_intervals(segment0, segment1,
+                                                               tolerance)
+                for segment0, segment1 in pairs}
 
     @staticmethod
     def check_two_miniballs(ball0, ball1):
         """
         Check if two miniballs collide.
         """
-        diff = ball0.center.coordinates - ball1.center.coordinates
-        center_dist_squared = numpy.dot(diff, diff)
-        return center_dist_squared < ball0.radius_squared + ball1.radius_squared
+        diff = ball0.center.normalized_in_3d() - ball1.center.normalized_in_3d()
+        return numpy.linalg.norm(diff) <= ball0.radius + ball1.radius
 
     def get_split_and_point_indices(self, segment):
         """
@@ -234,9 +829,19 @@ class CollisionAnalyser:
     def optimize_curved_link(self,
                              segment_id: str,
                              min_splits: int = 20,
-                             curve_degree: int = 3):
+                             curve_degree: int = 3,
+                             use_kdtree: bool = False):
         """
         Optimize the curved link to avoid collisions.
+
+        :param str segment_id: ID of the link to optimize
+        :param int min_splits: minimal number of Bezier splits of the relative motions
+        :param int curve_degree: degree of the curved link
+        :param bool use_kdtree: if True, only the orbit balls near the control points
+            are evaluated, see :meth:`.CollisionAnalyser.optimize_control_points`
+
+        :return: curved link
+        :rtype: RationalSoo
         """
         if segment_id.startswith('j'):
             raise ValueError('Joints cannot be optimized as curved lines, only links.')
@@ -284,7 +889,8 @@ class CollisionAnalyser:
         init_control_points = link_cps[1:-1]  # remove the first and last control points
 
         new_cps = self.optimize_control_points(init_control_points,
-                                               bounding_balls)
+                                               bounding_balls,
+                                               use_kdtree=use_kdtree)
         new_cps.insert(0, pt0)
         new_cps.append(pt1)
 
@@ -292,52 +898,84 @@ class CollisionAnalyser:
 
     @staticmethod
     def optimize_control_points(init_points: list[PointHomogeneous],
-                                bounding_orbits: list[list[PointOrbit]]):
+                                bounding_orbits: list[list[PointOrbit]],
+                                use_kdtree: bool = False):
         """
         Optimize the link control points to avoid collisions with the bounding orbits.
+
+        The penalty of the control points lying in the orbit balls (enlarged by a
+        margin) and its analytic gradient are evaluated on packed arrays of the ball
+        centers and radii.
+
+        :param list[PointHomogeneous] init_points: initial control points
+        :param list[list[PointOrbit]] bounding_orbits: orbits of the other links, see
+            :meth:`.CollisionAnalyser.obtain_global_bounding_balls`
+        :param bool use_kdtree: if True, only the balls near the control points are
+            evaluated, found by a KD-tree of the ball centers; faster for many balls
+
+        :return: optimized control points
+        :rtype: list[PointHomogeneous]
+
+        :raises RuntimeError: if Scipy is not available or the optimization fails
         """
         try:
             from scipy.optimize import minimize  # lazy import
+            from scipy.spatial import cKDTree  # lazy import
         except ImportError:
             raise RuntimeError("Scipy import failed. Check its installation.")
 
-        def flatten_cps(cps):
-            return numpy.array([cp.normalized_in_3d() for cp in cps]).flatten()
+        orbit_centers, orbit_radii = CollisionAnalyser.pack_balls(
+            [ball for link_orbits in bounding_orbits
+             for orbits in link_orbits for ball in orbits[1:]])
 
-        def unflatten_cps(cps_flat):
-            return [PointHomogeneous([1, cps_flat[i], cps_flat[i + 1], cps_flat[i + 2]])
-                    for i in range(0, len(cps_flat), 3)]
+        init_cps = numpy.array([cp.normalized_in_3d() for cp in init_points],
+                               dtype='float64').flatten()
+        num_cps = len(init_points)
+        lambda_reg = 0.1
+        margin = 0.01
+        reach = orbit_radii + margin
 
-        flattened_orbits = []
-        for i in range(len(bounding_orbits)):
-            for j in range(len(bounding_orbits[i])):
-                flattened_orbits.extend(bounding_orbits[i][j][1:])
+        tree = cKDTree(orbit_centers) if use_kdtree else None
+        max_reach = numpy.max(reach, initial=0.0)
 
-        orbit_centers = [orbit.center.normalized_in_3d() for orbit in flattened_orbits]
-        orbit_radii = [orbit.radius for orbit in flattened_orbits]
+        def loss(params):
+            cps = params.reshape(-1, 3)
 
-        init_cps = flatten_cps(init_points)
-        lambda_reg = 0.1
+            # pairs of control points and balls that may overlap
+            if tree is None:
+                cp_idx, ball_idx = numpy.divmod(numpy.arange(num_cps * len(reach)),
+                                                len(reach))
+            else:
+                near = tree.query_ball_point(cps, max_reach)
+                cp_idx = numpy.repeat(numpy.arange(num_cps), [len(n) for n in near])
+                ball_idx = numpy.array([i for n in near for i in n], dtype=int)
+
+            diff = cps[cp_idx] - orbit_centers[ball_idx]
+            dist = numpy.linalg.norm(diff, axis=1)
+            depth = reach[ball_idx] - dist
+            inside = depth > 0
+
+            penalty = numpy.sum(depth[inside] ** 2)
+
+            # d(depth ** 2) / d(cp) = -2 * depth * diff / dist
+            factor = numpy.divide(-2 * depth, dist, out=numpy.zeros_like(dist),
+                                  where=inside & (dist > 0))
+            grad = numpy.zeros_like(cps)
+            numpy.add.at(grad, cp_idx, factor[:, numpy.newaxis] * diff)
 
-        def loss(params):
-            cps = unflatten_cps(params)
-            margin = 0.01
-            penalty = 0.0
-            for cp in cps:
-                for i, orbit in enumerate(flattened_orbits):
-                    dist = numpy.linalg.norm(cp.normalized_in_3d() - orbit_centers[i])
-                    if dist < orbit_radii[i] + margin:
-                        penalty += (orbit_radii[i] + margin - dist) ** 2
             # Regularization: keep cps close to initial guess
             penalty += lambda_reg * numpy.sum((params - init_cps) ** 2)
-            return penalty
+            grad = grad.flatten() + 2 * lambda_reg * (params - init_cps)
+
+            return penalty, grad
 
-        res = minimize(loss, init_cps)
+        res = minimize(loss, init_cps, jac=True)
 
         if not res.success:
             raise RuntimeError(f'Optimization failed: {res.message}')
         else:
-            new_control_points = unflatten_cps(res.x)
+            new_control_points = [PointHomogeneous.from_3d_point(cp)
+                                  for cp in res.x.reshape(-1, 3)]
 
         return new_control_points
 
@@ -359,7 +997,7 @@ class CollisionAnalyser:
             rel_motion = self.mechanism.relative_motion(segment_id_number, idx)
             motions.append(RationalCurve([Poly(c, t, greedy=False)
                                           for c in rel_motion],
-                                          metric=self.metric))
+                                         metric=self.metric))
 
         bezier_splits = [motion.split_in_beziers(min_splits) for motion in motions]
 
@@ -370,46 +1008,10 @@ class CollisionAnalyser:
             p0_idx = segment_idx - 1
             p1_idx = segment_idx
 
-            rel_bezier_splits = bezier_splits[split_idx]
-
             p0 = self.mechanism_points[p0_idx]
             p1 = self.mechanism_points[p1_idx]
 
-            orbits0 = [PointOrbit(*p0.get_point_orbit(acting_center=split.ball.center,
-                                                      acting_radius=split.ball.radius_squared,
-                                                      metric=self.metric),
-                                  t_interval=split.t_param_of_motion_curve)
-                       for split in rel_bezier_splits]
-            orbits1 = [PointOrbit(*p1.get_point_orbit(acting_center=split.ball.center,
-                                                      acting_radius=split.ball.radius_squared,
-                                                      metric=self.metric),
-                                  t_interval=split.t_param_of_motion_curve)
-                       for split in rel_bezier_splits]
-
-            all_orbits_of_a_link = []
-            for i in range(len(orbits0)):
-                orbits_for_t = [orbits0[i].t_interval, orbits0[i]]
-                dist = numpy.linalg.norm(orbits0[i].center.normalized_in_3d() - orbits1[
-                    i].center.normalized_in_3d())
-                radius_sum = orbits0[i].radius + orbits1[i].radius
-                if dist > radius_sum:
-                    add_balls = dist / radius_sum
-                    num_steps = int(add_balls) * 2 + 1
-
-                    # linear interpolation from smaller ball to bigger ball
-                    radii = 0
-                    radius_diff = orbits1[i].radius - orbits0[i].radius
-                    center_diff = orbits1[i].center - orbits0[i].center
-                    for j in range(1, num_steps):
-                        new_radius = orbits0[i].radius + j * radius_diff / num_steps
-                        radii += new_radius
-                        new_center = orbits0[i].center + 2 * radii * center_diff / (
-                                    dist * 2)
-                        orbits_for_t.append(PointOrbit(new_center, new_radius ** 2,
-                                                       orbits0[i].t_interval))
-                orbits_for_t.append(orbits1[i])
-                all_orbits_of_a_link.append(orbits_for_t)
-            all_orbits.append(all_orbits_of_a_link)
+            all_orbits.append(self.get_splits_orbits(p0, p1, bezier_splits[split_idx]))
 
         return all_orbits
 
@@ -0,0 +1,147 @@
+from os import cpu_count
+
+from .Linkage import LineSegment, NumericLineSegment
+from .RationalMechanism import RationalMechanism
+
+
+class CollisionCheckPool:
+    """
+    Persistent pool of worker processes for parallel collision checks.
+
+    The pool is reused across the calls of
+    :meth:`.RationalMechanism.collision_check`. Instead of pickling the whole
+    mechanism with its symbolic equations for every task, only the compact numeric
+    representation of the line segments (:class:`.NumericLineSegment`) is sent, once
+    per worker and update of the segments (see :meth:`.CollisionCheckPool.update`).
+    The workers keep the segments, keyed by a version counter, and the tasks carry
+    only the indices of the segment pairs to check.
+
+    :ivar int max_workers: number of worker processes
+
+    :examples:
+
+    .. code-block:: python
+
+        from rational_linkages import CollisionCheckPool
+        from rational_linkages.models import collisions_free_6r
+
+        m = collisions_free_6r()
+
+        with CollisionCheckPool(max_workers=4) as pool:
+            for i in range(3):
+                m.collision_check(parallel=True, pool=pool)
+    """
+    def __init__(self, max_workers: int = None):
+        """
+        Initialize the pool of worker processes.
+
+        :param int max_workers: number of worker processes, defaults to the number
+            of processors
+        """
+        from concurrent.futures import ProcessPoolExecutor  # lazy import
+
+        self.max_workers = max_workers if max_workers is not None else cpu_count()
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+
+        # segments sent to the workers on demand, see update()
+        self._source_segments = None
+        self._numeric_segments = None
+        self._version = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+    def shutdown(self):
+        """
+        Shut down the worker processes.
+        """
+        self._executor.shutdown()
+
+    def update(self, segments: list[LineSegment]):
+        """
+        Set the line segments to be checked by the workers.
+
+        The segments are sent to every worker once, with its first task after the
+        update.
+
+        :param list[LineSegment] segments: line segments of the mechanism
+        """
+        self._source_segments = segments
+        self._numeric_segments = [segment.numeric for segment in segments]
+        self._version += 1
+
+    def check_pairs(self,
+                    segments: list[LineSegment],
+                    iters: list[tuple[int, int]]) -> list:
+        """
+        Perform collision check of the given pairs of line segments.
+
+        The pool is updated if the list of segments differs from the last one, see
+        :meth:`.CollisionCheckPool.update`.
+
+        :param list[LineSegment] segments: line segments of the mechanism
+        :param list iters: list of tuples of indices of the line segments to be checked
+
+        :return: list of collision check results, in the order of iters
+        :rtype: list
+        """
+        if segments is not self._source_segments:
+            self.update(segments)
+
+        # one chunk of pairs per worker
+        num_chunks = min(self.max_workers, len(iters))
+        chunks = [iters[i::num_chunks] for i in range(num_chunks)]
+
+        futures = [self._executor.submit(_check_pairs_chunk, self._version, chunk)
+                   for chunk in chunks]
+        chunk_results = [future.result() for future in futures]
+
+        # resend the chunks to the workers without the current segments
+        missing = [i for i, res in enumerate(chunk_results) if res is None]
+        futures = [self._executor.submit(_check_pairs_chunk, self._version, chunks[i],
+                                         self._numeric_segments)
+                   for i in missing]
+        for i, future in zip(missing, futures):
+            chunk_results[i] = future.result()
+
+        results = [None] * len(iters)
+        for i, res in enumerate(chunk_results):
+            results[i::num_chunks] = res
+
+        return results
+
+
+# worker state, the segments of the last update of the pool
+_worker_segments = None
+_worker_version = None
+
+
+def _check_pairs_chunk(version: int,
+                       pairs: list[tuple[int, int]],
+                       segments: list[NumericLineSegment] = None) -> list:
+    """
+    Perform collision check of a chunk of segment pairs in a worker process.
+
+    :param int version: version of the segments of the pool
+    :param list pairs: list of tuples of indices of the line segments to be checked
+    :param list[NumericLineSegment] segments: numeric line segments of the given
+        version, if None, the segments stored in the worker are used
+
+    :return: list of collision check results, None if the worker does not have
+        the segments of the given version
+    :rtype: list
+    """
+    global _worker_segments, _worker_version
+
+    if segments is not None:
+        _worker_segments = segments
+        _worker_version = version
+    elif _worker_version != version:
+        return None
+
+    return [RationalMechanism.check_segments_pair(_worker_segments[i],
+                                                  _worker_segments[j])
+            for i, j in pairs]
@@ -1,4 +1,5 @@
 from itertools import product
+from typing import Callable
 
 import numpy as np
 
@@ -143,25 +144,41 @@ class CombinatorialSearch:
         iter_end = kwargs.get('end_iteration', self.max_iters)
         comb_links = kwargs.get('combinations_links', None)
         comb_joints = kwargs.get('combinations_joints', None)
+        parallel = kwargs.get('parallel', False)
+        max_workers = kwargs.get('max_workers', None)
+        progress_callback = kwargs.get('progress_callback', None)
+        broad_phase = kwargs.get('broad_phase', False)
 
         if comb_links is None:
             # check design for collisions
             init_collisions = self.mechanism.collision_check(only_links=False,
-                                                             terminate_on_first=True)
+                                                             terminate_on_first=True,
+                                                             broad_phase=broad_phase)
         else:
             # skip initial collision check if combinations are provided
             init_collisions = []
 
         if init_collisions is not None:
             for i in range(iter_start, iter_end):
-                coll_free_links_params = self.search_links(i, combinations=comb_links)
+                coll_free_links_params = self.search_links(
+                    i,
+                    combinations=comb_links,
+                    parallel=parallel,
+                    max_workers=max_workers,
+                    progress_callback=progress_callback,
+                    broad_phase=broad_phase)
 
                 if coll_free_links_params is not None:
                     print("")
                     print("Collision-free solution for links found, "
                           "starting joint search...")
-                    coll_free_params = self.search_mechanism(coll_free_links_params,
-                                                             combinations=comb_joints)
+                    coll_free_params = self.search_mechanism(
+                        coll_free_links_params,
+                        combinations=comb_joints,
+                        parallel=parallel,
+                        max_workers=max_workers,
+                        progress_callback=progress_callback,
+                        broad_phase=broad_phase)
 
                     if coll_free_params is not None:
                         print("Search was successful, collision-free solution found.")
@@ -170,14 +187,37 @@ class CombinatorialSearch:
             print("Search was unsuccessful, collisions found.")
             return None
 
-    def search_links(self, iteration: int, combinations: list = None):
+    def search_links(self,
+                     iteration: int,
+                     combinations: list = None,
+                     parallel: bool = False,
+                     max_workers: int = None,
+                     chunk_size: int = 4,
+                     progress_callback: Callable[[int, int], None] = None,
+                     broad_phase: bool = False):
         """
         Search for the solution of the combinatorial search algorithm, links only.
 
         Searches for the smallest polyline that is collision free (only links).
 
+        In parallel mode, the combinations are split into chunks that are evaluated
+        by a pool of processes, each with its own copy of the mechanism. Once
+        a collision-free combination is found, the chunks with higher sequence indices
+        are cancelled; the result is the same as in the sequential search, i.e. the
+        collision-free combination with the lowest sequence index.
+
         :param iteration: iteration index
         :param list combinations: list of combinations to search links
+        :param bool parallel: if True, evaluate the combinations in parallel using
+            multiprocessing
+        :param int max_workers: maximum number of worker processes, defaults to the
+            number of processors
+        :param int chunk_size: number of combinations evaluated by a worker at once
+        :param Callable progress_callback: function called with the number of checked
+            combinations and the total number of combinations; replaces the printed
+            progress
+        :param bool broad_phase: if True, the segment pairs with non-overlapping
+            bounding balls are skipped, see :meth:`.RationalMechanism.collision_check`
 
         :return: list of collision-free points parameters
         :rtype: list
@@ -189,36 +229,131 @@ class CombinatorialSearch:
         else:
             combs = combinations
 
-        # TODO: parallelize the search
-        for i, sequence in enumerate(combs):
-            print("--- iteration: {}, shift_value: {}, sequence {} of {}: {}"
-                  .format(iteration, shift_val, i + 1, len(combs), sequence))
-            points_params = shift_val * np.asarray(sequence)
-            points_params = [[param] for param in points_params]
+        candidates = [[[param] for param in shift_val * np.asarray(sequence)]
+                      for sequence in combs]
+
+        if parallel:
+            if progress_callback is None:
+                print("--- iteration: {}, shift_value: {}, parallel search of {} "
+                      "sequences".format(iteration, shift_val, len(combs)))
+            idx = self._search_parallel(candidates,
+                                        only_links=True,
+                                        max_workers=max_workers,
+                                        chunk_size=chunk_size,
+                                        progress_callback=progress_callback,
+                                        broad_phase=broad_phase)
+            if idx is not None:
+                # update the design of the mechanism to the found solution
+                _set_points_params(self.mechanism, candidates[idx])
+                return candidates[idx]
+        else:
+            for i, sequence in enumerate(combs):
+                if progress_callback is None:
+                    print("--- iteration: {}, shift_value: {}, sequence {} of {}: {}"
+                          .format(iteration, shift_val, i + 1, len(combs), sequence))
+                points_params = candidates[i]
+
+                # update the design of the mechanism
+                _set_points_params(self.mechanism, points_params)
 
-            # update the design of the mechanism
-            self.mechanism.factorizations[0].set_joint_connection_points_by_parameters(
-                points_params[:len(self.mechanism.factorizations[0].dq_axes)])
-            self.mechanism.factorizations[1].set_joint_connection_points_by_parameters(
-                points_params[len(self.mechanism.factorizations[1].dq_axes):][::-1])
+                colls = self.mechanism.collision_check(only_links=True,
+                                                       terminate_on_first=True,
+                                                       broad_phase=broad_phase)
 
-            colls = self.mechanism.collision_check(only_links=True,
-                                                   terminate_on_first=True)
+                if progress_callback is not None:
+                    progress_callback(i + 1, len(combs))
 
-            if colls is None:
-                return points_params
+                if colls is None:
+                    return points_params
 
-        print("No collision-free solution found for iteration: {}".format(iter))
+        print("No collision-free solution found for iteration: {}".format(iteration))
         return None
 
-    def search_mechanism(self, coll_free_links_params: list, combinations: list = None):
+    def _search_parallel(self,
+                         candidates: list,
+                         only_links: bool,
+                         max_workers: int = None,
+                         chunk_size: int = 4,
+                         progress_callback: Callable[[int, int], None] = None,
+                         broad_phase: bool = False):
+        """
+        Find the first collision-free design among candidates using a process pool.
+
+        :param list candidates: list of points parameters of the designs to check
+        :param bool only_links: if True, only link-link collisions are checked
+        :param int max_workers: maximum number of worker processes
+        :param int chunk_size: number of candidates evaluated by a worker at once
+        :param Callable progress_callback: function called with the number of checked
+            candidates and the total number of candidates after each finished chunk
+        :param bool broad_phase: if True, the broad phase of the collision check is
+            used
+
+        :return: index of the first collision-free candidate, None if there is none
+        :rtype: int
+        """
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        # index of the best solution found so far, shared with the workers
+        found_idx = multiprocessing.Value('q', len(candidates))
+
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 initializer=_init_search_worker,
+                                 initargs=(self.mechanism, found_idx)) as executor:
+            futures = {executor.submit(_search_chunk,
+                                       start,
+                                       candidates[start:start + chunk_size],
+                                       only_links,
+                                       broad_phase): start
+                       for start in range(0, len(candidates), chunk_size)}
+
+            num_checked = 0
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+
+                idx, num_chunk_checked = future.result()
+
+                num_checked += num_chunk_checked
+                if progress_callback is not None:
+                    progress_callback(num_checked, len(candidates))
+
+                if idx is not None:
+                    # cancel the chunks that cannot contain a better solution
+                    for other, start in futures.items():
+                        if start > found_idx.value:
+                            other.cancel()
+
+        return found_idx.value if found_idx.value < len(candidates) else None
+
+    def search_mechanism(self,
+                         coll_free_links_params: list,
+                         combinations: list = None,
+                         parallel: bool = False,
+                         max_workers: int = None,
+                         chunk_size: int = 16,
+                         progress_callback: Callable[[int, int], None] = None,
+                         broad_phase: bool = False):
         """
         Search for the solution of the combinatorial search algorithm, including joints.
 
         Searches for the mechanism that is collision free (including joint segments).
 
+        In parallel mode, the combinations are dispatched in chunks to a pool of
+        processes, see :meth:`.CombinatorialSearch.search_links`.
+
         :param list coll_free_links_params: list of collision-free points parameters
         :param list combinations: list of combinations to search mechanism design
+        :param bool parallel: if True, evaluate the combinations in parallel using
+            multiprocessing
+        :param int max_workers: maximum number of worker processes, defaults to the
+            number of processors
+        :param int chunk_size: number of combinations evaluated by a worker at once
+        :param Callable progress_callback: function called with the number of checked
+            combinations and the total number of combinations; replaces the printed
+            progress
+        :param bool broad_phase: if True, the segment pairs with non-overlapping
+            bounding balls are skipped, see :meth:`.RationalMechanism.collision_check`
 
         :return: list of collision-free points parameters
         :rtype: list
@@ -232,28 +367,48 @@ class CombinatorialSearch:
 
         coll_free_links_params = [item * 2 for item in coll_free_links_params]
 
-        for i, sequence in enumerate(combs):
-            print("--- joint search. Shift_value: {}, sequence {} of {}: {}"
-                  .format(shift_val, i + 1, len(combs), sequence))
+        candidates = []
+        for sequence in combs:
             shift_seq = shift_val * np.asarray(sequence)
+            candidates.append([[params[0] + shift_seq[ii * 2],
+                                params[1] + shift_seq[ii * 2 + 1]]
+                               for ii, params in enumerate(coll_free_links_params)])
+
+        if parallel:
+            if progress_callback is None:
+                print("--- joint search. Shift_value: {}, parallel search of {} "
+                      "sequences".format(shift_val, len(combs)))
+            idx = self._search_parallel(candidates,
+                                        only_links=False,
+                                        max_workers=max_workers,
+                                        chunk_size=chunk_size,
+                                        progress_callback=progress_callback,
+                                        broad_phase=broad_phase)
+            if idx is not None:
+                # update the design of the mechanism to the found solution
+                _set_points_params(self.mechanism, candidates[idx])
+                return candidates[idx]
+        else:
+            for i, sequence in enumerate(combs):
+                if progress_callback is None:
+                    print("--- joint search. Shift_value: {}, sequence {} of {}: {}"
+                          .format(shift_val, i + 1, len(combs), sequence))
+                points_params = candidates[i]
 
-            points_params = [[params[0] + shift_seq[ii * 2],
-                              params[1] + shift_seq[ii * 2 + 1]]
-                             for ii, params in enumerate(coll_free_links_params)]
+                # update the design of the mechanism
+                _set_points_params(self.mechanism, points_params)
 
-            # update the design of the mechanism
-            self.mechanism.factorizations[0].set_joint_connection_points_by_parameters(
-                points_params[:len(self.mechanism.factorizations[0].dq_axes)])
-            self.mechanism.factorizations[1].set_joint_connection_points_by_parameters(
-                points_params[len(self.mechanism.factorizations[1].dq_axes):][::-1])
+                colls = self.mechanism.collision_check(only_links=False,
+                                                       terminate_on_first=True,
+                                                       broad_phase=broad_phase)
 
-            colls = self.mechanism.collision_check(only_links=False,
-                                                   terminate_on_first=True)
+                if progress_callback is not None:
+                    progress_callback(i + 1, len(combs))
 
-            if colls is None:
-                return points_params
+                if colls is None:
+                    return points_params
 
-        print("No collision-free solution found for iteration: {}".format(iter))
+        print("No collision-free solution found for the joint search.")
         return None
 
     def _get_combinations_sequences(self, joints: bool = False):
@@ -298,3 +453,71 @@ class CombinatorialSearch:
             combs.insert(0, tup2)
 
             return combs
+
+
+# worker state of the parallel combinatorial search, one mechanism copy per process
+_worker_mechanism = None
+_worker_found_idx = None
+
+
+def _set_points_params(mechanism: RationalMechanism, points_params: list):
+    """
+    Update the design of the mechanism by the parameters of the connection points.
+
+    :param RationalMechanism mechanism: mechanism to update
+    :param list points_params: parameters of the joint connection points
+    """
+    mechanism.factorizations[0].set_joint_connection_points_by_parameters(
+        points_params[:len(mechanism.factorizations[0].dq_axes)])
+    mechanism.factorizations[1].set_joint_connection_points_by_parameters(
+        points_params[len(mechanism.factorizations[1].dq_axes):][::-1])
+
+
+def _init_search_worker(mechanism: RationalMechanism, found_idx):
+    """
+    Initialize a worker process of the parallel combinatorial search.
+
+    :param RationalMechanism mechanism: mechanism, copied to the worker process
+    :param multiprocessing.Value found_idx: shared index of the best solution
+    """
+    global _worker_mechanism, _worker_found_idx
+    _worker_mechanism = mechanism
+    _worker_found_idx = found_idx
+
+
+def _search_chunk(start: int,
+                  candidates: list,
+                  only_links: bool,
+                  broad_phase: bool = False):
+    """
+    Check a chunk of candidate designs in a worker process.
+
+    The check stops when a solution with a lower index was found by another worker.
+
+    :param int start: sequence index of the first candidate in the chunk
+    :param list candidates: points parameters of the designs to check
+    :param bool only_links: if True, only link-link collisions are checked
+    :param bool broad_phase: if True, the broad phase of the collision check is used
+
+    :return: tuple (index of the first collision-free candidate or None, number of
+        checked candidates)
+    :rtype: tuple
+    """
+    for i, points_params in enumerate(candidates):
+        idx = start + i
+        if _worker_found_idx.value < idx:
+            return None, i
+
+        _set_points_params(_worker_mechanism, points_params)
+        colls = _worker_mechanism.collision_check(only_links=only_links,
+                                                  terminate_on_first=True,
+                                                  pretty_print=False,
+                                                  broad_phase=broad_phase)
+
+        if colls is None:
+            with _worker_found_idx.get_lock():
+                if idx < _worker_found_idx.value:
+                    _worker_found_idx.value = idx
+            return idx, i + 1
+
+    return None, len(candidates)
@@ -5,6 +5,7 @@ import numpy as np
 from sympy import Expr, Poly, simplify
 
 from .Quaternion import Quaternion
+from .utils import dq_array2matrix
 
 # Forward declarations for class names
 NormalizedLine = "NormalizedLine"
@@ -65,7 +66,7 @@ class DualQuaternion:
     .. testcleanup:: [dq_example3]
 
         del DualQuaternion, dq, Quaternion, q1, q2
-        
+
     """
 
     def __init__(self, study_parameters: Optional[Sequence[float]] = None):
@@ -78,25 +79,96 @@ class DualQuaternion:
             of 8 Study's parameters. If None, an identity DualQuaternion is constructed.
             Defaults to None.
         """
-        if study_parameters is not None:
-            if len(study_parameters) != 8:
-                raise ValueError("DualQuaternion: input has to be 8-vector")
-            study_parameters = np.asarray(study_parameters)
-            primal = study_parameters[:4]
-            dual = study_parameters[4:]
-        else:
-            primal = np.array([1, 0, 0, 0])
-            dual = np.array([0, 0, 0, 0])
+        if study_parameters is None:
+            self.dq = np.array([1, 0, 0, 0, 0, 0, 0, 0])
+            self.is_rational = False
+            return
 
-        self.p = Quaternion(primal)
-        self.d = Quaternion(dual)
-        self.dq = self.array()
+        if len(study_parameters) != 8:
+            raise ValueError("DualQuaternion: input has to be 8-vector")
+        study_parameters = np.asarray(study_parameters)
 
-        # check if all entries of the DQ are rational numbers
-        if all(isinstance(x, Expr) for x in self.array()):
-            self.is_rational = True
-        else:
+        if study_parameters.dtype.kind == 'f':
+            # numeric input, no need to scan for sympy expressions
+            self.dq = study_parameters.astype('float64')
             self.is_rational = False
+        else:
+            # let numpy infer the type of elements (integers or sympy objects)
+            self.dq = np.array(list(study_parameters))
+            # check if all entries of the DQ are rational numbers
+            self.is_rational = all(isinstance(x, Expr) for x in self.dq)
+
+    @classmethod
+    def from_numeric_array(cls, study_parameters: np.ndarray) -> "DualQuaternion":
+        """
+        Fast construction of DualQuaternion from a float64 8-vector.
+
+        Meant for numeric code paths (kinematics, actions, metrics), the input is
+        neither validated nor copied and is used directly as the internal buffer.
+
+        :param np.ndarray study_parameters: float64 array of 8 Study parameters
+
+        :return: DualQuaternion
+        :rtype: DualQuaternion
+        """
+        dq = cls.__new__(cls)
+        dq.dq = study_parameters
+        dq.is_rational = False
+        return dq
+
+    def __setstate__(self, state: dict):
+        """
+        Restore the DualQuaternion from a pickled state.
+
+        Objects pickled by older versions store the primal and dual Quaternions
+        instead of a single buffer of Study parameters.
+
+        :param dict state: pickled attributes
+        """
+        if 'p' in state:
+            state['dq'] = np.concatenate((state.pop('p').array(),
+                                          state.pop('d').array()))
+        self.__dict__.update(state)
+
+    @property
+    def p(self) -> Quaternion:
+        """
+        Primal part of the DualQuaternion
+
+        :return: primal Quaternion
+        :rtype: Quaternion
+        """
+        return Quaternion(self.dq[:4])
+
+    @property
+    def d(self) -> Quaternion:
+        """
+        Dual part of the DualQuaternion
+
+        :return: dual Quaternion
+        :rtype: Quaternion
+        """
+        return Quaternion(self.dq[4:])
+
+    def _is_numeric(self, other=None) -> bool:
+        """
+        Check if the fast numeric path can be used
+
+        It is the case for float buffers, or for a float and an integer buffer when
+        the other DualQuaternion is given. Integer-only and symbolic DualQuaternions
+        keep exact arithmetic.
+
+        :param DualQuaternion other: other DualQuaternion, optional
+
+        :return: True if the fast numeric path can be used
+        :rtype: bool
+        """
+        if other is None:
+            return self.dq.dtype.kind == 'f'
+        if not isinstance(other, DualQuaternion):
+            return False
+        kinds = self.dq.dtype.kind + other.dq.dtype.kind
+        return 'f' in kinds and 'O' not in kinds
 
     @classmethod
     def from_two_quaternions(
@@ -313,9 +385,7 @@ class DualQuaternion:
         :return: float number of the element
         :rtype: np.ndarray
         """
-        element = self.array()
-        element = element[idx]  # or, p.dob = p.dob.__getitem__(idx)
-        return element
+        return self.dq[idx]
 
     def __setitem__(self, idx, value):
         """
@@ -324,12 +394,9 @@ class DualQuaternion:
         :param int idx: index of the element to set (0..7)
         :param value: value to set
         """
-        if idx < 4:
-            self.p[idx] = value
-        else:
-            self.d[idx - 4] = value
-        # Update the array representation
-        self.dq = self.array()
+        study_parameters = list(self.dq)
+        study_parameters[idx] = value
+        self.dq = np.array(study_parameters)
 
     def __eq__(self, other) -> bool:
         """
@@ -352,6 +419,8 @@ class DualQuaternion:
         :return: added DualQuaternion
         :rtype: DualQuaternion
         """
+        if self._is_numeric(other):
+            return DualQuaternion.from_numeric_array(self.dq + other.dq)
         p = self.p + other.p
         d = self.d + other.d
         return DualQuaternion.from_two_quaternions(p, d)
@@ -365,6 +434,8 @@ class DualQuaternion:
         :return: subtracted DualQuaternion
         :rtype: DualQuaternion
         """
+        if self._is_numeric(other):
+            return DualQuaternion.from_numeric_array(self.dq - other.dq)
         p = self.p - other.p
         d = self.d - other.d
         return DualQuaternion.from_two_quaternions(p, d)
@@ -378,8 +449,10 @@ class DualQuaternion:
         :return: multiplied DualQuaternion
         :rtype: DualQuaternion
         """
-        if isinstance(other, (int, float)):
+        if isinstance(other, (int, float, np.number)):
             return DualQuaternion(self.array() * other)
+        elif self._is_numeric(other):
+            return DualQuaternion.from_numeric_array(_numeric_mul(self.dq, other.dq))
         else:
             p = self.p * other.p
             d = (self.d * other.p) + (self.p * other.d)
@@ -400,7 +473,7 @@ class DualQuaternion:
 
         :warn: if the DualQuaternion was divided by other DualQuaternion
         """
-        if isinstance(other, (int, float)):
+        if isinstance(other, (int, float, np.number)):
             return DualQuaternion(self.array() / other)
         else:
             warn("DualQuaternion was multiplied by the inverse of the other "
@@ -473,7 +546,7 @@ class DualQuaternion:
         :return: DualQuaternion as numpy array
         :rtype: np.ndarray
         """
-        return np.concatenate((self.p.array(), self.d.array()))
+        return self.dq.copy()
 
     def conjugate(self) -> "DualQuaternion":
         """
@@ -482,6 +555,9 @@ class DualQuaternion:
         :return: conjugated DualQuaternion
         :rtype: DualQuaternion
         """
+        if self._is_numeric():
+            return DualQuaternion.from_numeric_array(
+                self.dq * np.array([1., -1., -1., -1., 1., -1., -1., -1.]))
         return DualQuaternion.from_two_quaternions(
             self.p.conjugate(), self.d.conjugate())
 
@@ -492,6 +568,9 @@ class DualQuaternion:
         :return: epsilon-conjugated DualQuaternion
         :rtype: DualQuaternion
         """
+        if self._is_numeric():
+            return DualQuaternion.from_numeric_array(
+                self.dq * np.array([1., 1., 1., 1., -1., -1., -1., -1.]))
         dual_part_eps_c = -1 * self.d.array()
         return DualQuaternion(np.concatenate((self.p.array(), dual_part_eps_c)))
 
@@ -531,6 +610,13 @@ class DualQuaternion:
         :return: inverse of the DualQuaternion
         :rtype: DualQuaternion
         """
+        if self._is_numeric():
+            p0, p1, p2, p3, d0, d1, d2, d3 = self.dq.tolist()
+            n = p0 * p0 + p1 * p1 + p2 * p2 + p3 * p3
+            p = [p0 / n, -p1 / n, -p2 / n, -p3 / n]
+            d = _numeric_quaternion_mul(
+                _numeric_quaternion_mul(p, [d0, d1, d2, d3]), p)
+            return DualQuaternion.from_numeric_array(np.array(p + [-x for x in d]))
         p = self.p.inv()
         d = -1 * p * self.d * p
         return DualQuaternion.from_two_quaternions(p, d)
@@ -580,6 +666,9 @@ class DualQuaternion:
         :return: 4x4 transformation matrix
         :rtype: np.ndarray
         """
+        if self._is_numeric():
+            return dq_array2matrix(self.dq, normalize=normalize)
+
         p0 = self[0]
         p1 = self[1]
         p2 = self[2]
@@ -738,20 +827,23 @@ class DualQuaternion:
 
     def act(
         self,
-        affected_object: Union["DualQuaternion", "NormalizedLine", "PointHomogeneous"],
-    ) -> Union["NormalizedLine", "PointHomogeneous"]:
+        affected_object: Union["DualQuaternion", "NormalizedLine", "PointHomogeneous",
+                               np.ndarray],
+    ) -> Union["NormalizedLine", "PointHomogeneous", np.ndarray]:
         """
         Act on a line or point with the DualQuaternion
 
         The action of a DualQuaternion is a half-turn about its axis. If the
         acted_object is a DualQuaternion (rotation axis DQ), it is converted to
-        NormalizedLine and then the action is performed.
+        NormalizedLine and then the action is performed. An (M, 4) array of
+        homogeneous points or (M, 6) array of lines is acted on at once, see
+        :meth:`.DualQuaternionAction.act_on_array`.
 
-        :param DualQuaternion, NormalizedLine, or PointHomogeneous affected_object:
-            object to act on (line or point)
+        :param DualQuaternion, NormalizedLine, PointHomogeneous, np.ndarray
+            affected_object: object to act on (line or point), or array of them
 
-        :return: line or point
-        :rtype: NormalizedLine, PointHomogeneous
+        :return: line or point, or array of them
+        :rtype: NormalizedLine, PointHomogeneous, np.ndarray
 
         :examples:
 
@@ -775,4 +867,54 @@ class DualQuaternion:
         from .DualQuaternionAction import DualQuaternionAction
 
         action = DualQuaternionAction()
+        if isinstance(affected_object, np.ndarray):
+            return action.act_on_array(self, affected_object)
         return action.act(self, affected_object)
+
+
+def _numeric_quaternion_mul(a: list, b: list) -> list:
+    """
+    Multiply two numeric quaternions given as lists of 4 floats
+
+    :param list a: quaternion parameters
+    :param list b: quaternion parameters
+
+    :return: parameters of the product
+    :rtype: list
+    """
+    w, x, y, z = a
+    ow, ox, oy, oz = b
+    return [w * ow - x * ox - y * oy - z * oz,
+            w * ox + x * ow + y * oz - z * oy,
+            w * oy - x * oz + y * ow + z * ox,
+            w * oz + x * oy - y * ox + z * ow]
+
+
+def _numeric_mul(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Multiply two numeric dual quaternions given as 8-vectors
+
+    Scalar counterpart of :func:`.utils.dq_array_mul`, cheaper for a single pair.
+
+    :param np.ndarray a: 8-vector of Study parameters
+    :param np.ndarray b: 8-vector of Study parameters
+
+    :return: 8-vector of the product
+    :rtype: np.ndarray
+    """
+    w, x, y, z, dw, dx, dy, dz = a.tolist()
+    ow, ox, oy, oz, odw, odx, ody, odz = b.tolist()
+
+    return np.array([
+        w * ow - x * ox - y * oy - z * oz,
+        w * ox + x * ow + y * oz - z * oy,
+        w * oy - x * oz + y * ow + z * ox,
+        w * oz + x * oy - y * ox + z * ow,
+        (dw * ow - dx * ox - dy * oy - dz * oz)
+        + (w * odw - x * odx - y * ody - z * odz),
+        (dw * ox + dx * ow + dy * oz - dz * oy)
+        + (w * odx + x * odw + y * odz - z * ody),
+        (dw * oy - dx * oz + dy * ow + dz * ox)
+        + (w * ody - x * odz + y * odw + z * odx),
+        (dw * oz + dx * oy - dy * ox + dz * ow)
+        + (w * odz + x * ody - y * odx + z * odw)])
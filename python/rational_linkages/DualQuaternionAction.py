@@ -1,15 +1,20 @@
 from typing import Union
 
+import numpy as np
+
 from .DualQuaternion import DualQuaternion
+from .DualQuaternionArray import DualQuaternionArray
 from .NormalizedLine import NormalizedLine
 from .PointHomogeneous import PointHomogeneous
+from .utils import dq_array_act_on_lines, dq_array_act_on_points
 
 
 class DualQuaternionAction:
     """
     Strategy pattern class for acting on objects using Dual Quaternions
 
-    So far, only acting on NormalizedLine and PointHomogeneous is implemented.
+    So far, only acting on NormalizedLine and PointHomogeneous is implemented. Arrays
+    of points or lines are acted on at once by :meth:`act_on_array`.
     """
 
     def __init__(self):
@@ -58,6 +63,70 @@ class DualQuaternionAction:
             case "is_point":
                 return self._act_on_point(acting_obj, affected_object)
 
+    def act_on_array(
+        self,
+        acting_object: Union[DualQuaternion, list[DualQuaternion],
+                             DualQuaternionArray, np.ndarray],
+        affected_array: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Act on an array of points or lines using one or more Dual Quaternions
+
+        The type of the affected objects is given by the last dimension of the array:
+        4 for homogeneous points [w, x, y, z], 6 for lines in Plucker coordinates
+        [direction, moment].
+
+        :param acting_object: DualQuaternion, list of DualQuaternion factors
+            (multiplied together), or N poses as DualQuaternionArray or (N, 8) array
+        :param affected_array: (M, 4) array of homogeneous points or (M, 6) array of
+            lines
+
+        :return: array of shape (M, 4) or (M, 6) for a single acting Dual Quaternion,
+            (N, M, 4) or (N, M, 6) for N Dual Quaternions; points are not normalized,
+            lines have unit direction
+        :rtype: np.ndarray
+
+        :raises ValueError: if the affected array is neither of points nor of lines
+
+        :example:
+
+        .. testcode:: [dualquaternionaction_example2]
+
+            #  Act on a point cloud with a Dual Quaternion
+
+            import numpy as np
+            from rational_linkages import DualQuaternion
+
+            dq = DualQuaternion([1, 2, 3, 4, 0.1, 0.2, 0.3, 0.4])
+            points = np.array([[1, 0, 0, 0], [1, 1, 2, 3]])
+
+            points_after_action = dq.act(points)
+
+        .. testcleanup:: [dualquaternionaction_example2]
+
+            del np, DualQuaternion, dq, points, points_after_action
+
+        """
+        if isinstance(acting_object, DualQuaternionArray):
+            dqs = acting_object.array()[:, np.newaxis, :]
+        elif isinstance(acting_object, np.ndarray):
+            dqs = np.asarray(acting_object, dtype='float64')
+            if dqs.ndim == 2:
+                dqs = dqs[:, np.newaxis, :]
+        else:
+            dqs = self._prepare_acting_object(acting_object).array()
+
+        affected_array = np.asarray(affected_array, dtype='float64')
+
+        match affected_array.shape[-1]:
+            case 4:
+                return dq_array_act_on_points(dqs, affected_array)
+            case 6:
+                return dq_array_act_on_lines(dqs, affected_array)
+            case _:
+                raise ValueError("The affected array has to be of shape (M, 4) for "
+                                 "points or (M, 6) for lines")
+
     @staticmethod
     def _analyze_affected_object(affected_object) -> str:
         """
@@ -90,12 +159,30 @@ class DualQuaternionAction:
         """
         if isinstance(acting_object, DualQuaternion):
             return acting_object
+        elif len(acting_object) == 0:
+            return DualQuaternion()
         else:
-            factors_multiplied = DualQuaternion()
-            for factor in acting_object:
+            factors_multiplied = acting_object[0]
+            for factor in acting_object[1:]:
                 factors_multiplied = factors_multiplied * factor
             return factors_multiplied
 
+    @staticmethod
+    def _embed(acting_dq: DualQuaternion, embedded: np.ndarray) -> DualQuaternion:
+        """
+        Wrap the embedded line or point as DualQuaternion
+
+        Numeric embeddings of numeric actions use the fast numeric construction.
+
+        :param acting_dq: DualQuaternion
+        :param embedded: 8-vector of the embedded object
+
+        :return: DualQuaternion
+        """
+        if acting_dq._is_numeric() and embedded.dtype.kind in 'fiu':
+            return DualQuaternion.from_numeric_array(embedded.astype('float64'))
+        return DualQuaternion(embedded)
+
     @staticmethod
     def _act_on_line(acting_dq: DualQuaternion,
                      affected_object: NormalizedLine) -> NormalizedLine:
@@ -111,7 +198,8 @@ class DualQuaternionAction:
 
         :return: NormalizedLine
         """
-        line_as_dq = DualQuaternion(affected_object.line2dq_array())
+        line_as_dq = DualQuaternionAction._embed(acting_dq,
+                                                 affected_object.line2dq_array())
 
         do_action = acting_dq * line_as_dq * acting_dq.conjugate()
 
@@ -129,7 +217,8 @@ class DualQuaternionAction:
 
         :return: PointHomogeneous
         """
-        point_as_dq = DualQuaternion(affected_object.point2dq_array())
+        point_as_dq = DualQuaternionAction._embed(acting_dq,
+                                                  affected_object.point2dq_array())
 
         do_action = acting_dq.eps_conjugate() * point_as_dq * acting_dq.conjugate()
 
@@ -0,0 +1,334 @@
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from .DualQuaternion import DualQuaternion
+from .utils import (dq_array2matrix, dq_array_act_on_lines, dq_array_act_on_points,
+                    dq_array_mul, quaternion_array_mul)
+
+
+class DualQuaternionArray:
+    """
+    Class representing a batch of numeric Dual Quaternions.
+
+    The Dual Quaternions are stored as structure of arrays, i.e. in a single
+    contiguous float64 array of shape (N, 8), and all operations are vectorized over
+    the whole batch. Elements of the batch are accessible as
+    :class:`.DualQuaternion` objects.
+
+    :param np.ndarray study_parameters: array of shape (N, 8) of Study parameters,
+        a single 8-vector is treated as a batch of one. If None, an empty batch is
+        constructed.
+
+    :ivar np.ndarray dq: (N, 8) array of Study parameters
+
+    :examples:
+
+    .. testcode:: [dqarray_example1]
+
+        # Transform points by a batch of poses
+
+        from rational_linkages import DualQuaternion, DualQuaternionArray
+
+        poses = DualQuaternionArray.from_dual_quaternions(
+            [DualQuaternion(), DualQuaternion([0, 0, 0, 1, 0, 0, 0, 0])])
+        points = poses.act_on_points([[1, 1, 0, 0], [1, 0, 1, 0]])
+
+    .. testcleanup:: [dqarray_example1]
+
+        del DualQuaternion, DualQuaternionArray, poses, points
+    """
+
+    def __init__(self, study_parameters: Optional[np.ndarray] = None):
+        """
+        Batch of Dual Quaternions, the input array is not copied if it is already
+        a float64 array.
+
+        :param Optional[np.ndarray] study_parameters: array of shape (N, 8) of
+            Study parameters. If None, an empty batch is constructed.
+
+        :raises ValueError: if the input is not of shape (N, 8)
+        """
+        if study_parameters is None:
+            study_parameters = np.zeros((0, 8))
+
+        study_parameters = np.asarray(study_parameters, dtype='float64')
+        if study_parameters.ndim == 1:
+            study_parameters = study_parameters[np.newaxis, :]
+
+        if study_parameters.ndim != 2 or study_parameters.shape[1] != 8:
+            raise ValueError("DualQuaternionArray: input has to be of shape (N, 8)")
+
+        self.dq = study_parameters
+
+    @classmethod
+    def from_dual_quaternions(
+        cls, dual_quaternions: Sequence[DualQuaternion]
+    ) -> "DualQuaternionArray":
+        """
+        Construct DualQuaternionArray from a sequence of DualQuaternions.
+
+        :param Sequence[DualQuaternion] dual_quaternions: numeric DualQuaternions
+
+        :return: DualQuaternionArray
+        :rtype: DualQuaternionArray
+        """
+        if len(dual_quaternions) == 0:
+            return cls()
+        return cls(np.array([dq.array() for dq in dual_quaternions], dtype='float64'))
+
+    @classmethod
+    def identity(cls, n: int) -> "DualQuaternionArray":
+        """
+        Construct a batch of identity DualQuaternions.
+
+        :param int n: number of DualQuaternions
+
+        :return: DualQuaternionArray
+        :rtype: DualQuaternionArray
+        """
+        dqs = np.zeros((n, 8))
+        dqs[:, 0] = 1.
+        return cls(dqs)
+
+    def __repr__(self):
+        """
+        Printing method override
+
+        :return: DualQuaternionArray in readable form
+        :rtype: str
+        """
+        dq = np.array2string(self.dq,
+                             precision=10,
+                             suppress_small=True,
+                             separator=', ',
+                             max_line_width=100000)
+        return f"DualQuaternionArray({dq})"
+
+    def __len__(self) -> int:
+        """
+        Number of DualQuaternions in the batch
+
+        :return: number of DualQuaternions
+        :rtype: int
+        """
+        return self.dq.shape[0]
+
+    def __getitem__(self, idx) -> Union[DualQuaternion, "DualQuaternionArray"]:
+        """
+        Get an element or a sub-batch of DualQuaternionArray
+
+        :param int, slice, np.ndarray idx: index of the element, slice or index array
+
+        :return: DualQuaternion for integer index, DualQuaternionArray otherwise; the
+            element and the sub-batch of a slice are views of the original data
+        :rtype: DualQuaternion, DualQuaternionArray
+        """
+        if isinstance(idx, (int, np.integer)):
+            return DualQuaternion.from_numeric_array(self.dq[idx])
+        return DualQuaternionArray(self.dq[idx])
+
+    def __iter__(self):
+        """
+        Iterate over the batch as DualQuaternions
+
+        The DualQuaternions are views of the rows of the batch.
+
+        :return: iterator of DualQuaternions
+        """
+        return (DualQuaternion.from_numeric_array(dq) for dq in self.dq)
+
+    def __eq__(self, other) -> bool:
+        """
+        Compare two DualQuaternionArrays if they are equal
+
+        :param DualQuaternionArray other: DualQuaternionArray
+
+        :return: True if two DualQuaternionArrays are equal, False otherwise
+        :rtype: bool
+        """
+        return np.array_equal(self.dq, other.array())
+
+    def __add__(self, other) -> "DualQuaternionArray":
+        """
+        Addition of DualQuaternionArrays, element-wise
+
+        :param DualQuaternionArray, DualQuaternion other: other batch or single
+            DualQuaternion
+
+        :return: added DualQuaternionArray
+        :rtype: DualQuaternionArray
+        """
+        return DualQuaternionArray(self.dq + other.array())
+
+    def __sub__(self, other) -> "DualQuaternionArray":
+        """
+        Subtraction of DualQuaternionArrays, element-wise
+
+        :param DualQuaternionArray, DualQuaternion other: other batch or single
+            DualQuaternion
+
+        :return: subtracted DualQuaternionArray
+        :rtype: DualQuaternionArray
+        """
+        return DualQuaternionArray(self.dq - other.array())
+
+    def __mul__(self, other) -> "DualQuaternionArray":
+        """
+        Multiplication of DualQuaternionArrays, element-wise
+
+        A single DualQuaternion on the right side multiplies every element of the
+        batch. For a single DualQuaternion on the left side, use
+        ``DualQuaternionArray(dq.array()) * dq_array``.
+
+        :param DualQuaternionArray, DualQuaternion, int, float other: other batch,
+            single DualQuaternion or scalar
+
+        :return: multiplied DualQuaternionArray
+        :rtype: DualQuaternionArray
+        """
+        if isinstance(other, (int, float, np.number)):
+            return DualQuaternionArray(self.dq * other)
+        return DualQuaternionArray(dq_array_mul(self.dq, other.array()))
+
+    def __rmul__(self, other) -> "DualQuaternionArray":
+        """Handle when the scalar is on the left side of the multiplication"""
+        if isinstance(other, (int, float, np.number)):
+            return DualQuaternionArray(self.dq * other)
+        return NotImplemented
+
+    def __neg__(self) -> "DualQuaternionArray":
+        """
+        Negation of the DualQuaternionArray
+
+        :return: negated DualQuaternionArray
+        :rtype: DualQuaternionArray
+        """
+        return DualQuaternionArray(-1 * self.dq)
+
+    def array(self) -> np.ndarray:
+        """
+        DualQuaternionArray to numpy array, without copying
+
+        :return: (N, 8) array of Study parameters
+        :rtype: np.ndarray
+        """
+        return self.dq
+
+    def to_list(self) -> list[DualQuaternion]:
+        """
+        DualQuaternionArray to list of DualQuaternions
+
+        :return: list of DualQuaternions
+        :rtype: list[DualQuaternion]
+        """
+        return list(self)
+
+    def conjugate(self) -> "DualQuaternionArray":
+        """
+        Dual Quaternion conjugate, element-wise
+
+        :return: conjugated DualQuaternionArray
+        :rtype: DualQuaternionArray
+        """
+        return DualQuaternionArray(self.dq * np.array([1, -1, -1, -1, 1, -1, -1, -1]))
+
+    def eps_conjugate(self) -> "DualQuaternionArray":
+        """
+        Dual Quaternion epsilon conjugate, element-wise
+
+        :return: epsilon-conjugated DualQuaternionArray
+        :rtype: DualQuaternionArray
+        """
+        return DualQuaternionArray(self.dq * np.array([1, 1, 1, 1, -1, -1, -1, -1]))
+
+    def norm(self) -> "DualQuaternionArray":
+        """
+        Dual Quaternion norm as dual number, element-wise; primal norm is in the
+        first element, dual norm is in the fifth element
+
+        :return: norms of the DualQuaternions
+        :rtype: DualQuaternionArray
+        """
+        norms = np.zeros_like(self.dq)
+        norms[:, 0] = np.sum(self.dq[:, :4] ** 2, axis=1)
+        norms[:, 4] = 2 * np.sum(self.dq[:, :4] * self.dq[:, 4:], axis=1)
+        return DualQuaternionArray(norms)
+
+    def inv(self) -> "DualQuaternionArray":
+        """
+        Inverse of the DualQuaternions, element-wise
+
+        :return: inverted DualQuaternionArray
+        :rtype: DualQuaternionArray
+        """
+        p = self.dq[:, :4] * np.array([1, -1, -1, -1])
+        p = p / np.sum(self.dq[:, :4] ** 2, axis=1, keepdims=True)
+        d = -1 * quaternion_array_mul(quaternion_array_mul(p, self.dq[:, 4:]), p)
+        return DualQuaternionArray(np.concatenate((p, d), axis=1))
+
+    def normalize(self) -> "DualQuaternionArray":
+        """
+        Normalize the DualQuaternions by their first elements
+
+        :return: normalized DualQuaternionArray
+        :rtype: DualQuaternionArray
+
+        :raises ValueError: if the first element of any DualQuaternion is zero
+        """
+        if np.any(np.isclose(self.dq[:, 0], 0.)):
+            raise ValueError("DualQuaternionArray: the first element is zero, "
+                             "cannot normalize the DualQuaternionArray.")
+        return DualQuaternionArray(self.dq / self.dq[:, :1])
+
+    def dq2matrix(self, normalize: bool = True) -> np.ndarray:
+        """
+        Dual Quaternions to SE(3) transformation matrices
+
+        :param bool normalize: if True, the transformation matrices are normalized by
+            their first elements. Defaults to True.
+
+        :return: (N, 4, 4) array of transformation matrices
+        :rtype: np.ndarray
+        """
+        return dq_array2matrix(self.dq, normalize=normalize)
+
+    def as_12d_vectors(self) -> np.ndarray:
+        """
+        Return the DualQuaternions as 12D vectors of normalized transformation
+        matrices, see :meth:`.DualQuaternion.as_12d_vector`
+
+        :return: (N, 12) array of 12D vectors
+        :rtype: np.ndarray
+        """
+        mat = self.dq2matrix()
+        return mat[:, 1:4, :].transpose(0, 2, 1).reshape(-1, 12)
+
+    def act_on_points(self, points: np.ndarray) -> np.ndarray:
+        """
+        Act on homogeneous points with the DualQuaternions
+
+        The DualQuaternions broadcast against the points, i.e. every pose can act on
+        its own point, or the batch can act on a (M, 1, 4) array of points giving
+        an (M, N, 4) array.
+
+        :param np.ndarray points: homogeneous points [w, x, y, z] of shape (..., 4)
+
+        :return: acted homogeneous points of shape (..., 4), not normalized
+        :rtype: np.ndarray
+        """
+        return dq_array_act_on_points(self.dq, points)
+
+    def act_on_lines(self, lines: np.ndarray) -> np.ndarray:
+        """
+        Act on lines in Plucker coordinates with the DualQuaternions
+
+        Broadcasting follows :meth:`act_on_points`.
+
+        :param np.ndarray lines: Plucker coordinates [direction, moment] of shape
+            (..., 6)
+
+        :return: acted lines of shape (..., 6), normalized to unit direction
+        :rtype: np.ndarray
+        """
+        return dq_array_act_on_lines(self.dq, lines)
@@ -0,0 +1,383 @@
+from typing import Union
+from warnings import warn
+
+import numpy as np
+
+from .DualQuaternion import DualQuaternion
+from .DualQuaternionArray import DualQuaternionArray
+from .RationalCurve import RationalCurve
+from .TransfMatrix import TransfMatrix
+
+# Forward declarations for class names
+RationalMechanism = "RationalMechanism"
+
+
+class InverseKinematicsSolver:
+    """
+    Numeric inverse kinematics solver of a rational mechanism
+
+    The solver is built once per mechanism. It keeps the coefficients of the motion
+    curve, its inverse part and their derivatives as numeric arrays, so a query only
+    evaluates polynomials. Gauss-Newton iterations of all initial guesses and all
+    target poses run at once.
+
+    :ivar RationalMechanism mechanism: mechanism to be solved
+    :ivar list[np.ndarray] coeffs: coefficients of the motion curve and of its
+        inverse part, ordered from the highest degree
+    :ivar list[np.ndarray] diff_coeffs: coefficients of their derivatives
+
+    :examples:
+
+    .. testcode:: [ik_solver_example1]
+
+        # Inverse kinematics of many poses at once
+
+        import numpy as np
+        from rational_linkages.models import bennett_ark24
+        from rational_linkages.InverseKinematicsSolver import InverseKinematicsSolver
+
+        m = bennett_ark24()
+        solver = InverseKinematicsSolver(m)
+
+        poses = [m.forward_kinematics(t) for t in np.linspace(-1, 1, 10)]
+        t_params = solver.solve(poses)
+
+    .. testcleanup:: [ik_solver_example1]
+
+        del np, bennett_ark24, InverseKinematicsSolver, m, solver, poses, t_params
+    """
+
+    def __init__(self, mechanism: RationalMechanism):
+        """
+        Prepare the numeric evaluators of the mechanism curve
+
+        :param RationalMechanism mechanism: mechanism to be solved
+        """
+        self.mechanism = mechanism
+
+        curve = mechanism._cached_curve()
+        self.coeffs = [np.asarray(curve.coeffs, dtype='float64'),
+                       np.asarray(curve._cached_inverse_curve().coeffs,
+                                  dtype='float64')]
+        self.diff_coeffs = [RationalCurve.derivative_coeffs(c) for c in self.coeffs]
+
+    def evaluate(self,
+                 t: Union[float, np.ndarray],
+                 inverted_part: bool = False) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate the curve and the derivative of the normalized curve
+
+        :param float, np.ndarray t: parameter values of any shape
+        :param bool inverted_part: if True, the inverse part of the curve is used
+
+        :return: tuple of curve values and derivatives of the normalized curve, both
+            of shape t.shape + (8,)
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+        branch = int(inverted_part)
+        curve = RationalCurve.evaluate_coeffs(self.coeffs[branch], t)
+        curve_diff = RationalCurve.evaluate_coeffs(self.diff_coeffs[branch], t)
+
+        # quotient rule, the curve is normalized by its first coordinate
+        w = curve[..., :1]
+        normalized_diff = (curve_diff * w - curve * curve_diff[..., :1]) / w ** 2
+
+        return curve, normalized_diff
+
+    def _target_poses(self,
+                      poses: Union[list[Union[DualQuaternion, TransfMatrix]],
+                                   DualQuaternionArray, np.ndarray]) -> np.ndarray:
+        """
+        Map the target poses to the motion curve of the identity frame
+
+        :param poses: target poses
+
+        :return: (N, 8) array of target poses
+        :rtype: np.ndarray
+
+        :raises ValueError: if a pose is neither DualQuaternion nor TransfMatrix
+        """
+        if isinstance(poses, DualQuaternionArray):
+            poses = poses.array()
+        elif not isinstance(poses, np.ndarray):
+            arrays = []
+            for pose in poses:
+                if isinstance(pose, TransfMatrix):
+                    arrays.append(pose.matrix2dq())
+                elif isinstance(pose, DualQuaternion):
+                    arrays.append(pose.array())
+                else:
+                    raise ValueError("pose must be either DualQuaternion or "
+                                     "TransfMatrix")
+            poses = np.array(arrays, dtype='float64').reshape(-1, 8)
+
+        tool_inv = self.mechanism.tool_frame.inv().array()
+        return (DualQuaternionArray(poses) * DualQuaternionArray(tool_inv)).array()
+
+    def _gauss_newton(self,
+                      targets: np.ndarray,
+                      t_init: np.ndarray,
+                      inverted_part: bool,
+                      max_iterations: int,
+                      tol: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Gauss-Newton iterations of all targets and initial guesses at once
+
+        :param np.ndarray targets: (N, 8) array of target poses
+        :param np.ndarray t_init: (S,) array of initial guesses
+        :param bool inverted_part: if True, the inverse part of the curve is used
+        :param int max_iterations: maximal number of iterations
+        :param float tol: tolerance of the squared distance to the target
+
+        :return: tuple of (N, S) arrays - final parameters, success flags and the
+            last squared distances
+        :rtype: tuple[np.ndarray, np.ndarray, np.ndarray]
+        """
+        t = np.tile(np.asarray(t_init, dtype='float64'), (len(targets), 1))
+        success = np.zeros(t.shape, dtype=bool)
+        sq_dist = np.full(t.shape, np.inf)
+        active = np.ones(t.shape, dtype=bool)
+
+        target_zero = np.isclose(targets[:, 0], 0.0)[:, np.newaxis]
+        target_normalized = targets / np.where(target_zero, 1.0, targets[:, :1])
+
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            for _ in range(max_iterations):
+                # parameters must stay in a reasonable range
+                active &= ~(np.isnan(t) | (t > 10.0) | (t < -10.0))
+                if not np.any(active):
+                    break
+
+                idx = np.nonzero(active)
+                t_act = t[idx]
+                current, current_diff = self.evaluate(t_act, inverted_part)
+
+                unnormalized = target_zero[idx[0], 0] | np.isclose(current[:, 0], 0.0)
+                twist = np.where(
+                    unnormalized[:, np.newaxis],
+                    targets[idx[0]] - current,
+                    target_normalized[idx[0]] - current / current[:, :1])
+
+                sq_dist[idx] = np.sum(twist ** 2, axis=1)
+                converged = sq_dist[idx] < tol
+
+                t_new = t_act + (np.einsum('ij,ij->i', current_diff, twist)
+                                 / np.sum(current_diff ** 2, axis=1))
+                # a converged guess keeps its value if the step is undefined
+                t[idx] = np.where(converged & ~np.isfinite(t_new), t_act, t_new)
+
+                success[idx] = converged
+                active[idx] = ~converged
+
+        return t, success, sq_dist
+
+    def _solve_targets(self,
+                       targets: np.ndarray,
+                       robust: bool) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Solve inverse kinematics for prepared targets on both parts of the curve
+
+        :param np.ndarray targets: (N, 8) array of target poses
+        :param bool robust: if True, many initial guesses and more iterations are used
+
+        :return: tuple of (N,) arrays - curve parameters and success flags
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+        if robust:
+            t_init = np.linspace(-1.0, 1.0, 30)
+            max_iterations = 50
+            tol = 1e-15
+        else:
+            t_init = np.array([0., -0.999999999, 0.999999999, -0.5, 0.5])
+            max_iterations = 10
+            tol = 1e-10
+
+        results = [self._gauss_newton(targets, t_init, inverted_part, max_iterations,
+                                      tol)
+                   for inverted_part in (False, True)]
+
+        # both parts in the order of the search, (N, 2 * S)
+        t = np.hstack([res[0] for res in results])
+        success = np.hstack([res[1] for res in results])
+        sq_dist = np.hstack([res[2] for res in results])
+
+        # the first converged guess, otherwise the closest one
+        found = np.any(success, axis=1)
+        idx = np.where(found, np.argmax(success, axis=1), np.argmin(sq_dist, axis=1))
+        t_res = t[np.arange(len(t)), idx]
+
+        inversed = idx >= len(t_init)
+        t_res[inversed & np.isclose(t_res, 0.0)] = np.finfo(np.float64).tiny
+        t_res[inversed] = 1 / t_res[inversed]
+
+        return t_res, found
+
+    def solve(self,
+              poses: Union[list[Union[DualQuaternion, TransfMatrix]],
+                           DualQuaternionArray, np.ndarray],
+              robust: bool = False) -> np.ndarray:
+        """
+        Solve inverse kinematics for many poses at once
+
+        Poses that do not converge with the fast search are searched again with many
+        initial guesses.
+
+        :param poses: target poses as list of DualQuaternions or TransfMatrices,
+            DualQuaternionArray or (N, 8) array
+        :param bool robust: if True, use many initial guesses and more iteration steps
+            for all poses
+
+        :return: (N,) array of parameters t of the motion curve
+        :rtype: np.ndarray
+
+        :warns: if the method does not converge for some poses
+        """
+        targets = self._target_poses(poses)
+        t_res, success = self._solve_targets(targets, robust)
+
+        if not robust and not np.all(success):
+            t_res[~success], success[~success] = self._solve_targets(
+                targets[~success], robust=True)
+
+        if not np.all(success):
+            warn(f"Not converged for {np.sum(~success)} pose(s), providing the "
+                 f"closest results.")
+
+        return t_res
+
+    def _collinearity_polynomials(self,
+                                  targets: np.ndarray,
+                                  inverted_part: bool) -> np.ndarray:
+        """
+        Polynomials vanishing at the curve parameters of the target poses
+
+        A pose T is reached at t if C(t) is a multiple of T, i.e. all
+        polynomials C_k(t) T_j - C_j(t) T_k vanish. The coordinate k is the largest
+        one of the target and the polynomial with the largest coefficients is chosen.
+
+        :param np.ndarray targets: (N, 8) array of normalized target poses
+        :param bool inverted_part: if True, the inverse part of the curve is used
+
+        :return: (N, degree + 1) array of coefficients, ordered from the highest
+            degree
+        :rtype: np.ndarray
+        """
+        coeffs = self.coeffs[int(inverted_part)]
+        n = np.arange(len(targets))
+        k = np.argmax(np.abs(targets), axis=1)
+
+        # (N, 8, degree + 1)
+        polys = (coeffs[k][:, np.newaxis, :] * targets[:, :, np.newaxis]
+                 - coeffs[np.newaxis, :, :] * targets[n, k][:, np.newaxis, np.newaxis])
+
+        j = np.argmax(np.sum(polys ** 2, axis=2), axis=1)
+        return polys[n, j]
+
+    @staticmethod
+    def polynomial_roots(polys: np.ndarray) -> np.ndarray:
+        """
+        Roots of many polynomials of the same degree at once
+
+        The roots are the eigenvalues of the companion matrices. Polynomials with
+        a vanishing leading coefficient are solved one by one with a lower degree.
+
+        :param np.ndarray polys: (N, degree + 1) array of coefficients, ordered from
+            the highest degree
+
+        :return: (N, degree) complex array of roots, padded with NaN if a polynomial
+            has a lower degree
+        :rtype: np.ndarray
+        """
+        n, degree = polys.shape[0], polys.shape[1] - 1
+        roots = np.full((n, degree), np.nan, dtype='complex128')
+
+        scale = np.max(np.abs(polys), axis=1)
+        regular = np.abs(polys[:, 0]) > 1e-12 * scale
+
+        if np.any(regular):
+            monic = polys[regular, 1:] / polys[regular, :1]
+            companion = np.zeros((len(monic), degree, degree))
+            companion[:, 0, :] = -monic
+            companion[:, 1:, :-1] = np.eye(degree - 1)
+            roots[regular] = np.linalg.eigvals(companion)
+
+        for i in np.nonzero(~regular)[0]:
+            poly = np.where(np.abs(polys[i]) > 1e-12 * scale[i], polys[i], 0.0)
+            poly_roots = np.roots(poly)
+            roots[i, :len(poly_roots)] = poly_roots
+
+        return roots
+
+    def solve_algebraic(self,
+                        poses: Union[list[Union[DualQuaternion, TransfMatrix]],
+                                     DualQuaternionArray, np.ndarray],
+                        tol: float = 1e-10) -> list[np.ndarray]:
+        """
+        Find all real curve parameters of the poses by polynomial root finding
+
+        Roots of the motion curve with absolute value up to 1 are found from the
+        curve, the remaining ones from its inverse part, where they are well
+        conditioned. Only parameters whose curve pose matches the target pose are
+        returned, so the poses have to be reachable by the mechanism.
+
+        :param poses: target poses as list of DualQuaternions or TransfMatrices,
+            DualQuaternionArray or (N, 8) array
+        :param float tol: tolerance of the squared sine of the angle between the
+            target and the curve pose in the space of Study parameters
+
+        :return: list of N arrays of curve parameters, sorted from the closest match;
+            an array is empty if the pose is not reachable
+        :rtype: list[np.ndarray]
+        """
+        targets = self._target_poses(poses)
+        targets = targets / np.linalg.norm(targets, axis=1, keepdims=True)
+
+        branch_params = []
+        branch_residua = []
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for inverted_part in (False, True):
+                polys = self._collinearity_polynomials(targets, inverted_part)
+                roots = self.polynomial_roots(polys)
+
+                # real roots of the well conditioned part of the branch
+                real = (np.abs(roots.imag) < 1e-6) & (np.abs(roots) <= 1.0)
+                x = np.where(real, roots.real, np.nan)
+
+                # one Newton step to polish the roots
+                value = np.zeros_like(x)
+                diff = np.zeros_like(x)
+                for c in polys.T:
+                    diff = diff * x + value
+                    value = value * x + c[:, np.newaxis]
+                step = value / diff
+                x = np.where(np.isfinite(step), x - step, x)
+
+                curve = RationalCurve.evaluate_coeffs(self.coeffs[int(inverted_part)],
+                                                      x)
+                cos = (np.einsum('nsi,ni->ns', curve, targets)
+                       / np.linalg.norm(curve, axis=2))
+                residuum = 1.0 - cos ** 2
+
+                if inverted_part:
+                    x = np.where(x == 0.0, np.finfo(np.float64).tiny, x)
+                    x = 1 / x
+                branch_params.append(x)
+                branch_residua.append(residuum)
+
+        params = np.hstack(branch_params)
+        residua = np.hstack(branch_residua)
+
+        solutions = []
+        for t, res in zip(params, residua):
+            valid = res < tol
+            t, res = t[valid], res[valid]
+
+            # double roots and roots of absolute value 1 are found twice
+            order = np.argsort(res)
+            unique = []
+            for t_val in t[order]:
+                if all(not np.isclose(t_val, u, rtol=1e-6, atol=1e-9) for u in unique):
+                    unique.append(t_val)
+            solutions.append(np.array(unique, dtype='float64'))
+
+        return solutions
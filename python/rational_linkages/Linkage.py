@@ -3,6 +3,7 @@ Classes in the Module:
     - Linkage: Represents the connection points on a joint.
     - PointsConnection: Operates the connection points for a given joint.
     - LineSegment: Represents the physical realization of a linkage.
+    - NumericLineSegment: Numeric-only representation of a line segment.
 """
 from typing import Union
 
@@ -190,14 +191,22 @@ class LineSegment:
     _registry = {}
     _id_counter = 0
 
-    def __init__(self, equation, point0, point1, linkage_type, f_idx, idx, default_line=None):
-        self.equation = equation
-        self.point0 = point0
-        self.point1 = point1
+    def __init__(self, equation, point0, point1, linkage_type, f_idx, idx, default_line=None,
+                 plucker_coeffs=None, points_coeffs=None):
+        # numeric coefficients, if already known, see the properties
+        self._plucker_coeffs = plucker_coeffs
+        self._points_coeffs = points_coeffs
+
+        # symbolic equations may be None if the coefficients are given, they are
+        # built only when accessed, see the properties
+        self._equation = equation
+        self._point0 = point0
+        self._point1 = point1
+
         self.type = linkage_type
         self.factorization_idx = f_idx
         self.idx = idx
-        self.default_line = default_line if default_line else equation
+        self.default_line = default_line if default_line else self.equation
 
         # counter of instances
         self.creation_index = LineSegment._id_counter
@@ -209,6 +218,14 @@ class LineSegment:
         # store the instance in the registry
         LineSegment._registry[self.id] = self
 
+    def __setstate__(self, state):
+        # segments pickled before the equations became lazy store them as plain
+        # attributes
+        for name in ('equation', 'point0', 'point1'):
+            if name in state:
+                state['_' + name] = state.pop(name)
+        self.__dict__.update(state)
+
     @classmethod
     def get_by_id(cls, segment_id):
         """Get a line segment by its ID"""
@@ -228,6 +245,173 @@ class LineSegment:
     def __repr__(self):
         return self.id
 
+    @property
+    def equation(self) -> NormalizedLine:
+        """
+        Equation of the line segment under the motion.
+
+        Built from :attr:`.LineSegment.plucker_coeffs` when not given.
+
+        :return: line with Plucker coordinates as polynomial expressions in t
+        :rtype: NormalizedLine
+        """
+        if self._equation is None:
+            self._equation = NormalizedLine(self.get_poly_exprs(self._plucker_coeffs))
+        return self._equation
+
+    @property
+    def point0(self) -> PointHomogeneous:
+        """
+        Equation of the first point of the line segment.
+
+        Built from :attr:`.LineSegment.points_coeffs` when not given.
+
+        :return: point with coordinates as polynomial expressions in t
+        :rtype: PointHomogeneous
+        """
+        if self._point0 is None:
+            self._point0 = PointHomogeneous(self.get_poly_exprs(self._points_coeffs[0]))
+        return self._point0
+
+    @property
+    def point1(self) -> PointHomogeneous:
+        """
+        Equation of the second point of the line segment.
+
+        Built from :attr:`.LineSegment.points_coeffs` when not given.
+
+        :return: point with coordinates as polynomial expressions in t
+        :rtype: PointHomogeneous
+        """
+        if self._point1 is None:
+            self._point1 = PointHomogeneous(self.get_poly_exprs(self._points_coeffs[1]))
+        return self._point1
+
+    @property
+    def plucker_coeffs(self) -> np.ndarray:
+        """
+        Numeric coefficients of the Plucker coordinates of the segment's line motion.
+
+        Obtained once from the symbolic equation, see
+        :meth:`.LineSegment.get_plucker_coeffs`.
+
+        :return: array of shape (6, degree + 1)
+        :rtype: np.ndarray
+        """
+        # segments loaded from older pickled files do not have the attribute
+        if getattr(self, '_plucker_coeffs', None) is None:
+            self._plucker_coeffs = self.get_plucker_coeffs(self.equation)
+        return self._plucker_coeffs
+
+    @property
+    def points_coeffs(self) -> np.ndarray:
+        """
+        Numeric coefficients of the homogeneous coordinates of the segment's end points.
+
+        :return: array of shape (2, 4, degree + 1), the first axis corresponds to
+            point0 and point1
+        :rtype: np.ndarray
+        """
+        # segments loaded from older pickled files do not have the attribute
+        if getattr(self, '_points_coeffs', None) is None:
+            c0 = self.get_poly_coeffs(self.point0.coordinates)
+            c1 = self.get_poly_coeffs(self.point1.coordinates)
+            deg = max(c0.shape[1], c1.shape[1])
+            self._points_coeffs = np.zeros((2, 4, deg))
+            self._points_coeffs[0, :, :c0.shape[1]] = c0
+            self._points_coeffs[1, :, :c1.shape[1]] = c1
+        return self._points_coeffs
+
+    @staticmethod
+    def get_plucker_coeffs(line: NormalizedLine) -> np.ndarray:
+        """
+        Get the numeric coefficients of the Plucker coordinates of a line in motion.
+
+        Rows correspond to the direction and moment coordinates, columns to the
+        coefficients of the polynomials in t in ascending order (NumPy polynomial
+        convention). Static lines have only the constant coefficients.
+
+        :param NormalizedLine line: line with coordinates given as polynomial
+            expressions in t or numbers
+
+        :return: array of shape (6, degree + 1)
+        :rtype: np.ndarray
+        """
+        return LineSegment.get_poly_coeffs(line.screw)
+
+    @staticmethod
+    def get_poly_coeffs(coordinates: Union[list, np.ndarray]) -> np.ndarray:
+        """
+        Get the numeric coefficients of coordinates given as polynomials in t.
+
+        :param list, np.ndarray coordinates: polynomial expressions in t or numbers
+
+        :return: array of shape (len(coordinates), degree + 1), coefficients in
+            ascending order
+        :rtype: np.ndarray
+        """
+        from sympy import Expr, Poly, Symbol  # lazy import
+
+        t = Symbol("t")
+
+        coords = []
+        for coord in coordinates:
+            if isinstance(coord, Expr) and coord.free_symbols:
+                coords.append(np.array(Poly(coord, t).all_coeffs(),
+                                       dtype="float64")[::-1])
+            else:
+                coords.append(np.array([coord], dtype="float64"))
+
+        coeffs = np.zeros((len(coords), max(len(c) for c in coords)))
+        for i, c in enumerate(coords):
+            coeffs[i, :len(c)] = c
+
+        return coeffs
+
+    @staticmethod
+    def get_poly_exprs(coeffs: np.ndarray) -> list:
+        """
+        Get polynomial expressions in t from their numeric coefficients.
+
+        Inverse of :meth:`.LineSegment.get_poly_coeffs`.
+
+        :param np.ndarray coeffs: array of shape (n, degree + 1), coefficients in
+            ascending order
+
+        :return: list of n polynomial expressions in t
+        :rtype: list
+        """
+        from sympy import Poly, Symbol  # lazy import
+
+        t = Symbol("t")
+        return [Poly(c[::-1], t).as_expr() for c in coeffs]
+
+    @property
+    def numeric(self) -> 'NumericLineSegment':
+        """
+        Compact numeric representation of the line segment.
+
+        :return: numeric line segment sharing the coefficients of this segment
+        :rtype: NumericLineSegment
+        """
+        return NumericLineSegment(self.plucker_coeffs, self.points_coeffs, self.id)
+
+    def evaluate_line(self, t_vals: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the Plucker coordinates of the segment's line at given parameters.
+
+        See :meth:`.NumericLineSegment.evaluate_line`.
+        """
+        return self.numeric.evaluate_line(t_vals)
+
+    def evaluate_points(self, t_vals: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the end points of the segment at given parameters.
+
+        See :meth:`.NumericLineSegment.evaluate_points`.
+        """
+        return self.numeric.evaluate_points(t_vals)
+
     def is_point_in_segment(self, point: PointHomogeneous, t_val: float) -> bool:
         """
         Checks if the colliding point is in the line segment.
@@ -256,6 +440,15 @@ class LineSegment:
         else:
             return False
 
+    def is_point_in_segment_batch(self, points: np.ndarray,
+                                  t_vals: np.ndarray) -> np.ndarray:
+        """
+        Checks if the colliding points are in the line segment.
+
+        See :meth:`.NumericLineSegment.is_point_in_segment_batch`.
+        """
+        return self.numeric.is_point_in_segment_batch(points, t_vals)
+
     def get_plot_data(self) -> tuple:
         """
         Returns the plot data of the line segment.
@@ -280,6 +473,76 @@ class LineSegment:
         return x, y, z
 
 
+class NumericLineSegment:
+    """
+    Class for storing the motion of a line segment by numeric coefficients only.
+
+    Lightweight counterpart of :class:`.LineSegment` without the symbolic equations,
+    cheap to pickle and send to worker processes.
+
+    :ivar np.ndarray plucker_coeffs: coefficients of the Plucker coordinates of the
+        segment's line, shape (6, degree + 1), see
+        :meth:`.LineSegment.get_plucker_coeffs`
+    :ivar np.ndarray points_coeffs: coefficients of the end points, shape
+        (2, 4, degree + 1)
+    :ivar str id: ID of the line segment
+    """
+    def __init__(self, plucker_coeffs: np.ndarray, points_coeffs: np.ndarray,
+                 segment_id: str = None):
+        self.plucker_coeffs = plucker_coeffs
+        self.points_coeffs = points_coeffs
+        self.id = segment_id
+
+    def __repr__(self):
+        return f"NumericLineSegment({self.id})"
+
+    def evaluate_line(self, t_vals: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the Plucker coordinates of the segment's line at given parameters.
+
+        :param np.ndarray t_vals: array of N parameter values
+
+        :return: array of shape (N, 6), unnormalized Plucker coordinates
+        :rtype: np.ndarray
+        """
+        return np.polynomial.polynomial.polyval(np.asarray(t_vals, dtype="float64"),
+                                                self.plucker_coeffs.T).T
+
+    def evaluate_points(self, t_vals: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the end points of the segment at given parameters.
+
+        :param np.ndarray t_vals: array of N parameter values
+
+        :return: array of shape (2, N, 3), 3D coordinates of point0 and point1
+        :rtype: np.ndarray
+        """
+        pts = np.polynomial.polynomial.polyval(np.asarray(t_vals, dtype="float64"),
+                                               self.points_coeffs.transpose(2, 0, 1))
+        return np.moveaxis(pts[:, 1:, :] / pts[:, :1, :], 1, 2)
+
+    def is_point_in_segment_batch(self, points: np.ndarray,
+                                  t_vals: np.ndarray) -> np.ndarray:
+        """
+        Checks if the colliding points are in the line segment.
+
+        Vectorized version of :meth:`.LineSegment.is_point_in_segment` that uses the
+        numeric coefficients of the end points instead of symbolic evaluation.
+
+        :param np.ndarray points: array of shape (N, 3), 3D collision points
+        :param np.ndarray t_vals: array of N parameters of the collision points
 
+        :return: boolean mask of shape (N,)
+        :rtype: np.ndarray
+        """
+        points = np.asarray(points, dtype="float64").reshape(-1, 3)
+        p0, p1 = self.evaluate_points(np.atleast_1d(t_vals))
+
+        # segment length
+        seg_length = np.linalg.norm(p0 - p1, axis=1)
 
+        # distances between the end points and the collision points
+        d0 = np.linalg.norm(p0 - points, axis=1)
+        d1 = np.linalg.norm(p1 - points, axis=1)
 
+        return np.isclose(seg_length, d0 + d1)
@@ -70,19 +70,17 @@ class MiniBall:
 
         # Prepare constraint equations based on the metric
         if self.metric_type == "hofer":
+            points_12d = np.array([point.normalize()[1:] for point in self.points])
+
             def constraint_equations(x):
                 """
                 For Hofer metric, constraint equations must satisfy the ball by:
                 r - radius of the sphere, x - one of given points,
                 c - center of the sphere
                 """
-                constraints = np.zeros(self.number_of_points)
-
-                for i in range(self.number_of_points):
-                    squared_distance = self.metric.squared_distance_pr12_points(
-                        self.points[i].normalize(), x[:-1])
-                    constraints[i] = np.square(x[-1]) - squared_distance
-                return constraints
+                squared_distances = self.metric.squared_distance_12d(points_12d,
+                                                                     x[1:-1])
+                return np.square(x[-1]) - squared_distances
         else:
             def constraint_equations(x):
                 """
@@ -104,6 +104,7 @@ class MotionApproximation:
                                for pose in poses])
 
         num_added_poses = len(poses) - 4
+        poses_12d = metric.as_12d_vectors(poses)
 
         initial_guess = init_curve.coeffs[:,1:4].flatten()
         initial_guess = np.concatenate((initial_guess, t_vals[-num_added_poses:]), axis=None)
@@ -119,12 +120,8 @@ class MotionApproximation:
                 val = i + 1
                 t_vals[-val] = params[24:][i]
 
-            sq_dist = 0.
-            for i, pose in enumerate(poses):
-                curve_pose = DualQuaternion(curve.evaluate(t_vals[i]))
-                sq_dist += metric.squared_distance(pose, curve_pose)
-
-            return sq_dist
+            curve_poses = metric.as_12d_vectors(curve.evaluate(np.asarray(t_vals)))
+            return np.sum(metric.squared_distance_12d(poses_12d, curve_poses))
 
         def constraint_func(params):
             curve = MotionApproximation._construct_curve(params[:24])
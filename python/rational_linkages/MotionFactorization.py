@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from typing import Union
 
 import numpy as np
@@ -66,6 +67,8 @@ class MotionFactorization(RationalCurve):
         self.number_of_factors = len(self.dq_axes)
 
         self._linkage = None
+        self._action_coeffs = None
+        self._prefix_products = None
 
     @property
     def linkage(self):
@@ -126,6 +129,60 @@ class MotionFactorization(RationalCurve):
         dq = DualQuaternion([t_numerical, 0, 0, 0, 0, 0, 0, 0])
         return [dq - self.dq_axes[i] for i in range(len(self.dq_axes))]
 
+    def get_prefix_products(self, t_numerical: Union[float, np.ndarray]) -> np.ndarray:
+        """
+        Get the cumulative products of the numerical factors.
+
+        The k-th product is (t - h_0)(t - h_1)...(t - h_k), i.e. the pose of the k-th
+        link. All products are obtained with n - 1 dual quaternion multiplications.
+        The results for the 64 most recently used scalar parameters are cached, an
+        array of parameters is evaluated at once.
+
+        :param float, np.ndarray t_numerical: parameter of the motion curve, scalar or
+            array of shape (N,)
+
+        :return: array of shape (n, 8) for a scalar parameter, (N, n, 8) for an array
+            of parameters, where n is the number of factors
+        :rtype: np.ndarray
+        """
+        from .utils import dq_array_mul  # lazy import
+
+        is_scalar = np.ndim(t_numerical) == 0
+
+        if is_scalar:
+            # factorizations loaded from older pickled files do not have the attribute
+            if getattr(self, '_prefix_products', None) is None:
+                self._prefix_products = OrderedDict()
+
+            key = float(t_numerical)
+            if key in self._prefix_products:
+                self._prefix_products.move_to_end(key)
+                return self._prefix_products[key]
+
+        t = np.atleast_1d(np.asarray(t_numerical, dtype='float64'))
+        axes = np.array([np.asarray(axis.array(), dtype='float64')
+                         for axis in self.dq_axes])
+
+        # numerical factors (t - h_i) of shape (N, n, 8)
+        factors = -1 * np.broadcast_to(axes, t.shape + axes.shape).copy()
+        factors[..., 0] += t[:, np.newaxis]
+
+        products = np.empty_like(factors)
+        products[:, 0] = factors[:, 0]
+        for i in range(1, self.number_of_factors):
+            products[:, i] = dq_array_mul(products[:, i - 1], factors[:, i])
+
+        if is_scalar:
+            products = products[0]
+            products.flags.writeable = False
+
+            # keep only a limited number of the recently used parameters
+            if len(self._prefix_products) >= 64:
+                self._prefix_products.popitem(last=False)
+            self._prefix_products[key] = products
+
+        return products
+
     def act(
         self, affected_object, param: float, start_idx: int = None, end_idx: int = None
     ):
@@ -147,11 +204,107 @@ class MotionFactorization(RationalCurve):
 
         start_idx = 0 if start_idx is None else start_idx
         end_idx = self.number_of_factors - 1 if end_idx is None else end_idx
-        acting_sequence = self.get_numerical_factors(param)[start_idx : end_idx + 1]
 
         action = DualQuaternionAction()
+
+        if start_idx == 0 and isinstance(param, (int, float, np.number)):
+            # numeric parameter, use the cached product of the factors
+            acting_dq = DualQuaternion(self.get_prefix_products(param)[end_idx])
+            return action.act(acting_dq, affected_object)
+
+        acting_sequence = self.get_numerical_factors(param)[start_idx : end_idx + 1]
         return action.act(acting_sequence, affected_object)
 
+    def get_action_coeffs(self,
+                          end_idx: int = None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Numeric coefficients of the action of the factors sequence on points and lines.
+
+        The action of the product of factors with indices 0, ..., end_idx is linear
+        in the coordinates of the acted point (or line), i.e. it is given by a matrix
+        with polynomial entries in t. The matrices are cached, since they depend only
+        on the axes of the factorization, not on the joint connection points.
+
+        :param int end_idx: index of the last axis to act with, all axes by default
+
+        :return: tuple (point action of shape (4, 4, degree + 1), line action of shape
+            (6, 6, degree + 1)), coefficients in ascending order; output coordinates
+            are indexed by the first axis
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+        from .utils import dq_poly_mul  # lazy import
+
+        end_idx = self.number_of_factors - 1 if end_idx is None else end_idx
+
+        # factorizations loaded from older pickled files do not have the attribute
+        if getattr(self, '_action_coeffs', None) is None:
+            self._action_coeffs = {}
+
+        if end_idx not in self._action_coeffs:
+            # motion polynomial as product of factors (t - axis)
+            motion = np.array([[1., 0, 0, 0, 0, 0, 0, 0]])
+            for axis in self.dq_axes[:end_idx + 1]:
+                factor = np.zeros((2, 8))
+                factor[0] = -1 * np.asarray(axis.array(), dtype='float64')
+                factor[1, 0] = 1.
+                motion = dq_poly_mul(motion, factor)
+
+            motion_conj = motion * np.array([1, -1, -1, -1, 1, -1, -1, -1])
+            motion_eps_conj = motion * np.array([1, 1, 1, 1, -1, -1, -1, -1])
+
+            # act on the basis of homogeneous coordinates of points, see
+            # DualQuaternionAction._act_on_point()
+            point_idx = [0, 5, 6, 7]
+            point_action = np.zeros((4, 4, 2 * len(motion) - 1))
+            for k, idx in enumerate(point_idx):
+                basis = np.zeros((1, 8))
+                basis[0, idx] = 1.
+                acted = dq_poly_mul(dq_poly_mul(motion_eps_conj, basis), motion_conj)
+                point_action[:, k, :] = acted[:, point_idx].T
+
+            # act on the basis of Plucker coordinates of lines embedded as
+            # [0, direction, 0, -moment], see DualQuaternionAction._act_on_line()
+            line_idx = [1, 2, 3, 5, 6, 7]
+            line_sign = np.array([1, 1, 1, -1, -1, -1])
+            line_action = np.zeros((6, 6, 2 * len(motion) - 1))
+            for k, idx in enumerate(line_idx):
+                basis = np.zeros((1, 8))
+                basis[0, idx] = line_sign[k]
+                acted = dq_poly_mul(dq_poly_mul(motion, basis), motion_conj)
+                line_action[:, k, :] = line_sign[:, np.newaxis] * acted[:, line_idx].T
+
+            self._action_coeffs[end_idx] = (point_action, line_action)
+
+        return self._action_coeffs[end_idx]
+
+    def act_coeffs(self, affected_object: Union[PointHomogeneous, NormalizedLine],
+                   end_idx: int = None) -> np.ndarray:
+        """
+        Act on an object with the sequence of axes and return numeric coefficients.
+
+        Numeric counterpart of :meth:`.MotionFactorization.act` with the symbolic
+        parameter t, using the cached action matrices, see
+        :meth:`.MotionFactorization.get_action_coeffs`.
+
+        :param PointHomogeneous, NormalizedLine affected_object: object to act on
+        :param int end_idx: index of the last axis to act with
+
+        :return: coefficients of the coordinates of the acted object in ascending
+            order, shape (4, degree + 1) for points, (6, degree + 1) for lines
+        :rtype: np.ndarray
+        """
+        point_action, line_action = self.get_action_coeffs(end_idx)
+
+        if isinstance(affected_object, PointHomogeneous):
+            coords = np.asarray(affected_object.coordinates, dtype='float64')
+            return np.einsum('ikn,k->in', point_action, coords)
+        elif isinstance(affected_object, NormalizedLine):
+            coords = np.asarray(affected_object.screw, dtype='float64')
+            return np.einsum('ikn,k->in', line_action, coords)
+        else:
+            raise TypeError("Other types than NormalizedLine or PointHomogeneous "
+                            "not yet implemented")
+
     def direct_kinematics(self, t_numerical: float, inverted_part: bool = False
                           ) -> list[np.array]:
         """
@@ -163,28 +316,51 @@ class MotionFactorization(RationalCurve):
         :return: list of np.array - points of the curve
         :rtype: list[np.ndarray]
         """
-        linkage_points = []
-        for i in range(self.number_of_factors):
-            linkage_points.append(self.linkage[i].points)
+        return list(self.direct_kinematics_batch(t_numerical,
+                                                 inverted_part=inverted_part))
 
-        for i in range(self.number_of_factors - 1):
-            if inverted_part:
-                if t_numerical == 0:  # avoid division by zero
-                    t_numerical = np.finfo(float).eps
+    def direct_kinematics_batch(self,
+                                t_numerical: Union[float, np.ndarray],
+                                inverted_part: bool = False) -> np.ndarray:
+        """
+        Direct kinematics of the rational mechanism for an array of parameters
 
-                pts_acted = [self.act(linkage_points[i + 1][j],
-                                      end_idx=i, param=1/t_numerical) for j in range(2)]
-            else:
-                pts_acted = [self.act(linkage_points[i + 1][j],
-                                      end_idx=i, param=t_numerical) for j in range(2)]
-            linkage_points[i + 1] = pts_acted
+        Vectorized version of :meth:`.MotionFactorization.direct_kinematics` using the
+        cumulative products of factors, see
+        :meth:`.MotionFactorization.get_prefix_products`.
 
-        linkage_points = [linkage_points[i][j] for i in range(len(linkage_points))
-                          for j in range(len(linkage_points[i]))]
+        :param float, np.ndarray t_numerical: parameter of the motion curve, scalar or
+            array of shape (N,)
+        :param bool inverted_part: if True, return the inverted part of the curve
+
+        :return: points of the linkage, array of shape (2n, 3) for a scalar parameter,
+            (N, 2n, 3) for an array of parameters, where n is the number of factors
+        :rtype: np.ndarray
+        """
+        from .utils import dq_array_act_on_points  # lazy import
+
+        if inverted_part:
+            t_numerical = np.asarray(t_numerical, dtype='float64')
+            # avoid division by zero
+            t_numerical = 1 / np.where(t_numerical == 0, np.finfo(float).eps,
+                                       t_numerical)
+            if t_numerical.ndim == 0:
+                t_numerical = float(t_numerical)
+
+        products = self.get_prefix_products(t_numerical)
 
-        linkage_points_3d = [np.array(linkage_points[i].normalized_in_3d())
-                             for i in range(len(linkage_points))]
-        return linkage_points_3d
+        points = np.array([np.asarray(linkage.points[j].array(), dtype='float64')
+                           for linkage in self.linkage for j in range(2)])
+
+        # the first joint is static, the other joint points are moved by the links
+        identity = np.zeros(products.shape[:-2] + (1, 8))
+        identity[..., 0] = 1
+        acting = np.concatenate((identity, products[..., :-1, :]), axis=-2)
+        acting = np.repeat(acting, 2, axis=-2)
+
+        acted = dq_array_act_on_points(acting, points)
+
+        return acted[..., 1:] / acted[..., :1]
 
     def direct_kinematics_of_tool(self, t_numerical: float, end_effector: np.ndarray,
                                   inverted_part=False) -> np.ndarray:
@@ -244,11 +420,13 @@ class MotionFactorization(RationalCurve):
         from 0 to 2*pi. More information can be found in documentation in `Joint Angle
         to Curve Parameter`_.
 
-        :param float joint_angle: joint angle in radians
+        :param Union[np.ndarray, float] joint_angle: joint angle in radians, scalar
+            or array of angles
         :param str unit: 'rad' or 'deg'
 
-        :return: t parameter of the curve, bool - if True, the inverted part
-        :rtype: float
+        :return: t parameter of the curve, array of parameters if an array of angles
+            is given
+        :rtype: Union[float, np.ndarray]
 
         :seealso: `Joint Angle to Curve Parameter`_
 
@@ -259,22 +437,26 @@ class MotionFactorization(RationalCurve):
         elif unit != 'rad':
             raise ValueError("unit must be 'rad' or 'deg'")
 
+        joint_angle = np.asarray(joint_angle, dtype='float64')
+
         # normalize angle to [0, 2*pi]
-        if joint_angle >= 0:
-            normalized_angle = joint_angle % (2 * np.pi)
-        else:
-            normalized_angle = (joint_angle % (2 * np.pi)) - np.pi
+        normalized_angle = np.where(joint_angle >= 0,
+                                    joint_angle % (2 * np.pi),
+                                    (joint_angle % (2 * np.pi)) - np.pi)
 
         # avoid division by zero
-        if normalized_angle == 0.0:
-            normalized_angle = np.finfo(float).eps
+        normalized_angle = np.where(normalized_angle == 0.0,
+                                    np.finfo(float).eps,
+                                    normalized_angle)
 
         t = (np.linalg.norm(self.dq_axes[0].p[1:]) / np.tan(normalized_angle/2)
              + self.dq_axes[0].p[0])
 
-        return t
+        # return scalar for scalar input
+        return t[()]
 
-    def t_param_to_joint_angle(self, t_param: float) -> float:
+    def t_param_to_joint_angle(self, t_param: Union[float, np.ndarray]
+                               ) -> Union[float, np.ndarray]:
         """
         Convert t parameter of the curve to joint angle
 
@@ -282,24 +464,22 @@ class MotionFactorization(RationalCurve):
         :meth:`.MotionFactorization.joint_angle_to_t_param` method. See more
         information in documentation in `Joint Angle to Curve Parameter`_.
 
-        :param float t_param: t parameter of the curve
+        :param float, np.ndarray t_param: t parameter of the curve, scalar or array
 
-        :return: joint angle in radians
-        :rtype: float
+        :return: joint angle in radians, scalar or array
+        :rtype: float, np.ndarray
         """
-        t_param_joint0 = t_param - self.dq_axes[0].p[0]
-
-        if t_param_joint0 == 0.0:
-            t_param_joint0 = np.finfo(float).eps
+        axis = np.asarray(self.dq_axes[0].array()[:4], dtype='float64')
+        t_param_joint0 = np.asarray(t_param, dtype='float64') - axis[0]
+        t_param_joint0 = np.where(t_param_joint0 == 0.0, np.finfo(float).eps,
+                                  t_param_joint0)
 
-        angle = 2 * np.arctan(np.float64(
-            np.linalg.norm(self.dq_axes[0].p[1:]) / t_param_joint0))
+        angle = 2 * np.arctan(np.linalg.norm(axis[1:]) / t_param_joint0)
 
         # normalize angle to [0, 2*pi]
-        if angle < 0:
-            angle += 2 * np.pi
+        angle = np.where(angle < 0, angle + 2 * np.pi, angle)
 
-        return angle
+        return angle[()]
 
     def factorize(self, use_rationals: bool = False) -> list['MotionFactorization']:
         """
@@ -365,10 +365,50 @@ class PointHomogeneous:
 
         coords_3d = self.normalized_in_3d()
 
-        radius_squared = acting_radius * (1/metric.total_mass + np.sum([(coord ** 2 / metric.inertia_eigen_vals[i]) for i, coord in enumerate(coords_3d)]))
+        radius_squared = acting_radius * (1/metric.total_mass + np.sum(coords_3d ** 2 / metric.inertia_eigen_vals))
 
         return point_center, radius_squared
 
+    @staticmethod
+    def get_points_orbits(points: np.ndarray,
+                          acting_centers: np.ndarray,
+                          acting_radii: np.ndarray,
+                          metric: "AffineMetric",
+                          ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get orbits of many points for many acting balls at once
+
+        Vectorized version of :meth:`.PointHomogeneous.get_point_orbit`, the acting
+        balls are typically the balls of all Bezier splits of a motion.
+
+        :param np.ndarray points: (P, 4) array of homogeneous coordinates of the points
+        :param np.ndarray acting_centers: (S, 13) array of homogeneous coordinates of
+            the centers of the acting balls in PR12
+        :param np.ndarray acting_radii: (S,) array of squared radii of the acting balls
+        :param AffineMetric metric: metric of the curve
+
+        :return: tuple (orbit centers of shape (S, P, 4), orbit radii squared of shape
+            (S, P))
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+        points = np.asarray(points, dtype='float64').reshape(-1, 4)
+        points = points / points[:, [0]]
+        acting_centers = np.asarray(acting_centers, dtype='float64').reshape(-1, 13)
+        acting_centers = acting_centers / acting_centers[:, [0]]
+
+        # rows: translation and images of the basis vectors, see point2matrix()
+        affine_maps = acting_centers[:, 1:].reshape(-1, 4, 3)
+
+        centers = np.ones((len(acting_centers), len(points), 4))
+        centers[..., 1:] = np.einsum('pk,skj->spj', points, affine_maps)
+
+        points_factor = (1/metric.total_mass
+                         + np.sum(points[:, 1:] ** 2 / metric.inertia_eigen_vals, axis=1))
+        radii_squared = (np.asarray(acting_radii, dtype='float64').reshape(-1, 1)
+                         * points_factor)
+
+        return centers, radii_squared
+
 
 class PointOrbit:
     def __init__(self, point_center, radius_squared, t_interval):
@@ -1,4 +1,4 @@
-from copy import deepcopy
+from typing import Union
 
 import numpy as np
 import sympy as sp
@@ -156,27 +156,48 @@ class RationalBezier(RationalCurve):
 class BezierSegment:
     """
     Bezier curves that reparameterizes a motion curve in split segments.
+
+    The control points are stored as a numeric array of shape (n, dimension + 1),
+    the :class:`.PointHomogeneous` objects are created only when requested.
     """
     def __init__(self,
-                 control_points: list[PointHomogeneous],
+                 control_points: Union[list[PointHomogeneous], np.ndarray],
                  t_param: tuple[bool, list[float]] = (False, [0, 1]),
                  metric: "AffineMetric" = None):
         """
         Initializes a BezierSegment object with the provided control points.
 
-        :param control_points: list[PointHomogeneous] - control points of the curve
+        :param control_points: list[PointHomogeneous] or np.ndarray - control points
+            of the curve, as objects or as an array of shape (n, dimension + 1)
         :param t_param: tuple[bool, list[float]] - True if the Bezier curve is
             interpolation inverse part of reparameterized motion curve, False otherwise;
             list of two floats representing the original parameter interval of the
             motion curve
         """
-        self.control_points = control_points
+        if isinstance(control_points, np.ndarray):
+            self.control_points_array = np.asarray(control_points, dtype='float64')
+            self._control_points = None
+        else:
+            self.control_points_array = np.array(
+                [point.array() for point in control_points], dtype='float64')
+            self._control_points = control_points
+
         self.t_param_of_motion_curve = t_param
         self._metric = metric
 
         self._ball = None
         self._curve = None
 
+    @property
+    def control_points(self) -> list[PointHomogeneous]:
+        """
+        Get the control points of the curve as PointHomogeneous objects
+        """
+        if self._control_points is None:
+            self._control_points = [PointHomogeneous(point)
+                                    for point in self.control_points_array]
+        return self._control_points
+
     @property
     def curve(self):
         """
@@ -218,6 +239,49 @@ class BezierSegment:
         else:
             raise TypeError("The 'metric' property must be of type 'AffineMetric'")
 
+    @staticmethod
+    def de_casteljau(control_points: np.ndarray,
+                     t: float = 0.5) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Split many Bezier curves of the same degree at once
+
+        :param np.ndarray control_points: control points of shape (..., n, dim)
+        :param float t: parameter value to split the curves at
+
+        :return: tuple of the control points of the left and right parts, both of
+            shape (..., n, dim)
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+        points = np.asarray(control_points, dtype='float64')
+        n = points.shape[-2]
+
+        left = np.empty_like(points)
+        right = np.empty_like(points)
+        left[..., 0, :] = points[..., 0, :]
+        right[..., -1, :] = points[..., -1, :]
+
+        # interpolate adjacent control points until only one point remains
+        for i in range(1, n):
+            points = points[..., :-1, :] * (1 - t) + points[..., 1:, :] * t
+            left[..., i, :] = points[..., 0, :]
+            right[..., n - 1 - i, :] = points[..., -1, :]
+
+        return left, right
+
+    @staticmethod
+    def invalid_weights(control_points: np.ndarray) -> np.ndarray:
+        """
+        Check many Bezier curves for control points at infinity or negative weights
+
+        :param np.ndarray control_points: control points of shape (..., n, dim)
+
+        :return: boolean array of shape (...), True if a curve has a control point at
+            infinity or a negative weight
+        :rtype: np.ndarray
+        """
+        weights = np.asarray(control_points)[..., 0]
+        return np.any(np.isclose(weights, 0.0, atol=1e-12) | (weights < 0), axis=-1)
+
     def split_de_casteljau(self,
                            t: float = 0.5,
                            ) -> tuple:
@@ -229,35 +293,13 @@ class BezierSegment:
         :return: tuple - two new Bezier curves
         :rtype: tuple
         """
-        control_points = deepcopy(self.control_points)
+        left_curve, right_curve = self.de_casteljau(self.control_points_array, t)
 
-        left_curve = [control_points[0]]
-        right_curve = [control_points[-1]]
+        t_start, t_end = self.t_param_of_motion_curve[1]
+        mid_t = t_start + t * (t_end - t_start)
 
-        # Perform De Casteljau subdivision until only two points remain
-        while len(control_points) > 1:
-            new_points = []
-
-            # Compute linear interpolations between adjacent control points
-            for i in range(len(control_points) - 1):
-                new_points.append(
-                    control_points[i].linear_interpolation(control_points[i + 1], t))
-
-            # Append the first point of the new segment to the left curve
-            left_curve.append(new_points[0])
-            # Insert the last point of a new segment at the beginning of the right curve
-            right_curve.insert(0, new_points[-1])
-
-            # Update control points for the next iteration
-            control_points = new_points
-
-        mid_t = t * (self.t_param_of_motion_curve[1][0]
-                     + self.t_param_of_motion_curve[1][1])
-
-        new_t_left = (self.t_param_of_motion_curve[0],
-                      [self.t_param_of_motion_curve[1][0], mid_t])
-        new_t_right = (self.t_param_of_motion_curve[0],
-                       [mid_t, self.t_param_of_motion_curve[1][1]])
+        new_t_left = (self.t_param_of_motion_curve[0], [t_start, mid_t])
+        new_t_right = (self.t_param_of_motion_curve[0], [mid_t, t_end])
 
         return (BezierSegment(left_curve, t_param=new_t_left, metric=self.metric),
                 BezierSegment(right_curve, t_param=new_t_right, metric=self.metric))
@@ -268,7 +310,8 @@ class BezierSegment:
 
         :return: bool - True if there is a control point at infinity, False otherwise
         """
-        return any(point.is_at_infinity for point in self.control_points)
+        return bool(np.any(np.isclose(self.control_points_array[:, 0], 0.0,
+                                      atol=1e-12)))
 
     def check_for_negative_weights(self):
         """
@@ -276,7 +319,7 @@ class BezierSegment:
 
         :return: bool - True if there are negative weights, False otherwise
         """
-        return any(point.coordinates[0] < 0 for point in self.control_points)
+        return bool(np.any(self.control_points_array[:, 0] < 0))
 
 
 class RationalSoo(RationalCurve):
@@ -1,12 +1,12 @@
-from copy import deepcopy
-from typing import Union
+from math import comb
+from typing import Optional, Union
 
 import numpy as np
 import sympy as sp
 
-from .DualQuaternion import DualQuaternion
 from .PointHomogeneous import PointHomogeneous
 from .Quaternion import Quaternion
+from .utils import dq_array2matrix, dq_array_mul
 
 MotionFactorization = "MotionFactorization"
 
@@ -90,36 +90,76 @@ class RationalCurve:
     """
 
     def __init__(self,
-                 polynomials: list[sp.Poly],
+                 polynomials: Optional[list[sp.Poly]],
                  coeffs: Union[np.array, sp.Matrix] = None,
                  metric: "AffineMetric" = None):
         """
         Initializes a RationalCurve object with the provided coefficients.
 
-        :param polynomials: list of polynomial equations of the curve
+        If only numeric coefficients are given, the sympy polynomials are created
+        lazily when they are requested.
+
+        :param polynomials: list of polynomial equations of the curve, or None if
+            numeric coefficients are given
         :param coeffs: coefficients of the curve
         """
+        if polynomials is None and coeffs is None:
+            raise ValueError("Either polynomials or coefficients have to be given")
+
+        self._set_of_polynomials = polynomials
+        self._coeffs = coeffs
+        self._init_views()
+
+        # check if the curve is a motion curve
+        self.is_motion = self.dimension == 7
+        self.is_affine_motion = self.dimension == 12
 
-        self.set_of_polynomials = polynomials
+        self._metric = metric
 
-        self.dimension = len(self.set_of_polynomials) - 1
-        # Get the degree of the curve
-        self.degree = 1
-        for i in range(len(polynomials)):
-            self.degree = max(self.degree, self.set_of_polynomials[i].degree())
+    def _init_views(self):
+        """
+        Set the dimension and degree of the curve and reset its cached views
+
+        The views (inversed coefficients, symbolic expressions, inverse curve) are
+        derived from the coefficients, or from the polynomials if the coefficients
+        are not known yet.
+        """
+        if self._set_of_polynomials is not None:
+            self.dimension = len(self._set_of_polynomials) - 1
+            # Get the degree of the curve
+            self.degree = 1
+            for poly in self._set_of_polynomials:
+                self.degree = max(self.degree, poly.degree())
+        else:
+            self._coeffs = np.asarray(self._coeffs)
+            self.dimension = self._coeffs.shape[0] - 1
+            # Get the degree of the curve, the same as of sympy polynomials
+            nonzero_columns = np.flatnonzero(np.any(self._coeffs != 0, axis=0))
+            leading = nonzero_columns[0] if nonzero_columns.size else None
+            self.degree = 1 if leading is None else max(
+                1, self._coeffs.shape[1] - 1 - leading)
 
-        self._coeffs = coeffs
         self._symbolic = None
 
         self.coeffs_inversed = self.inverse_coeffs()
         self._symbolic_inversed = None
         self._set_of_polynomials_inversed = None
 
-        # check if the curve is a motion curve
-        self.is_motion = self.dimension == 7
-        self.is_affine_motion = self.dimension == 12
+        self._curve = None
+        self._inverse_curve = None
 
-        self._metric = metric
+    def __setstate__(self, state: dict):
+        """
+        Restore the curve from a pickled state.
+
+        Objects pickled by older versions store the polynomials as a plain
+        attribute.
+
+        :param dict state: pickled attributes
+        """
+        if 'set_of_polynomials' in state:
+            state['_set_of_polynomials'] = state.pop('set_of_polynomials')
+        self.__dict__.update(state)
 
     @property
     def metric(self):
@@ -185,12 +225,40 @@ class RationalCurve:
 
         return self._set_of_polynomials_inversed
 
+    @property
+    def set_of_polynomials(self) -> list[sp.Poly]:
+        """
+        Get the set of polynomials representing the curve
+
+        :return: list of sympy polynomials
+        :rtype: list[sp.Poly]
+        """
+        if self._set_of_polynomials is None:
+            _, self._set_of_polynomials = self.get_symbolic_expressions(self._coeffs)
+        return self._set_of_polynomials
+
     @property
     def coeffs(self):
+        """
+        Get the coefficients of the curve, ordered from the highest degree
+
+        Setting new coefficients resets all cached views of the curve.
+
+        :return: np.array of coefficients
+        :rtype: np.ndarray
+        """
         if self._coeffs is None:
             self._coeffs = self.get_coeffs()
         return self._coeffs
 
+    @coeffs.setter
+    def coeffs(self, coeffs: np.ndarray):
+        self._coeffs = coeffs
+        self._set_of_polynomials = None
+        self._init_views()
+        self.is_motion = self.dimension == 7
+        self.is_affine_motion = self.dimension == 12
+
     @classmethod
     def from_coeffs(cls, coeffs: Union[np.ndarray, sp.Matrix]) -> "RationalCurve":
         """
@@ -201,6 +269,10 @@ class RationalCurve:
         :returns: RationalCurve object from coefficients
         :rtype: RationalCurve
         """
+        if isinstance(coeffs, np.ndarray) and coeffs.dtype != object:
+            # polynomials are created lazily
+            return cls(None, coeffs)
+
         _, polynomials = cls.get_symbolic_expressions(coeffs)
         return cls(polynomials, coeffs)
 
@@ -310,42 +382,39 @@ class RationalCurve:
         :return: list of Bezier control points
         :rtype: list[PointHomogeneous]
         """
-        t = sp.Symbol("t")
+        points_array = self.bezier_control_points_array(reparametrization)
+        return [PointHomogeneous(point) for point in points_array]
 
-        # Get the symbolic variables in the form of x00, x01, ... based on degree
-        # of curve and dimension of space
-        points = [
-            [sp.Symbol("x%d_%d" % (i, j)) for j in range(self.dimension + 1)]
-            for i in range(self.degree + 1)
-        ]
-        points_flattened = [var for variables in points for var in variables]
-
-        # Get the Bernstein polynomial equations and Bernstein basis
-        expression_list = self.get_bernstein_polynomial_equations(t, reparametrization=reparametrization)
-        bernstein_basis = [0] * (self.dimension + 1)
-        for i in range(self.dimension + 1):
-            for j in range(self.degree + 1):
-                bernstein_basis[i] += expression_list[j] * points[j][i]
+    def bezier_control_points_array(self,
+                                    reparametrization: bool = False) -> np.ndarray:
+        """
+        Control points of the curve in the Bernstein basis as a numeric array
+
+        The power basis coefficients are converted by the standard change of basis
+        matrix, no equations are solved.
+
+        :param bool reparametrization: if True, the curve is mapped to the [-1,1]
 
-        # Get the coefficients of the equations
-        equations_coeffs = [
-            sp.Poly((bernstein_basis[i] - self.symbolic[i]), t, greedy=False).all_coeffs()
-            for i in range(self.dimension + 1)
-        ]
-        # Flatten the list
-        equations_coeffs = [coeff for coeffs in equations_coeffs for coeff in coeffs]
+        :return: array of shape (degree + 1, dimension + 1) of control points
+        :rtype: np.ndarray
+        """
+        degree = self.degree
+        # coefficients in ascending order of the power basis
+        coeffs = np.asarray(self.coeffs, dtype='float64')[:, ::-1][:, :degree + 1]
 
-        # Solve the equations
-        points_sol = sp.linsolve(equations_coeffs, points_flattened)
-        # Convert the solutions to numpy arrays (get points)
-        points_array = np.array(points_sol.args[0], dtype="float64").reshape(
-            self.degree + 1, self.dimension + 1)
+        if reparametrization:
+            # substitution t = 2u - 1 maps the Bernstein parameter u in [0, 1]
+            substitution = np.array([[comb(k, j) * 2 ** j * (-1) ** (k - j)
+                                      if j <= k else 0
+                                      for j in range(degree + 1)]
+                                     for k in range(degree + 1)], dtype='float64')
+            coeffs = coeffs @ substitution
 
-        points_objects = [PointHomogeneous()] * (self.degree + 1)
-        for i in range(self.degree + 1):
-            points_objects[i] = PointHomogeneous(points_array[i, :])
+        power2bernstein = np.array([[comb(i, j) / comb(degree, j) if j <= i else 0
+                                     for j in range(degree + 1)]
+                                    for i in range(degree + 1)])
 
-        return points_objects
+        return power2bernstein @ coeffs.T
 
     def get_bernstein_polynomial_equations(self,
                                            t_var: sp.Symbol,
@@ -411,10 +480,41 @@ class RationalCurve:
         Get the rational curve (itself) - suitable for subclasses, returns the
         superclass object
 
+        The returned curve is a new object with copied coefficients, so changing it
+        does not affect this curve.
+
         :return: RationalCurve
         :rtype: RationalCurve
         """
-        return RationalCurve(self.set_of_polynomials)
+        if self._set_of_polynomials is None:
+            return RationalCurve(None, self.coeffs.copy())
+        return RationalCurve(list(self._set_of_polynomials), self.coeffs.copy())
+
+    def _cached_inverse_curve(self) -> "RationalCurve":
+        """
+        Get the inverse curve, created once and cached until the coefficients change
+
+        The cached object is shared and must not be modified.
+
+        :return: inversed rational curve
+        :rtype: RationalCurve
+        """
+        if getattr(self, '_inverse_curve', None) is None:
+            self._inverse_curve = self.inverse_curve()
+        return self._inverse_curve
+
+    def _cached_curve(self) -> "RationalCurve":
+        """
+        Get the rational curve, created once and cached until the coefficients change
+
+        The cached object is shared and must not be modified.
+
+        :return: RationalCurve
+        :rtype: RationalCurve
+        """
+        if getattr(self, '_curve', None) is None:
+            self._curve = self.curve()
+        return self._curve
 
     def extract_expressions(self) -> list:
         """
@@ -431,29 +531,57 @@ class RationalCurve:
         """
         Evaluate the curve for given t and return in the form of dual quaternion vector
 
-        :param float, np.ndarray t_param: parameter of the motion curve
+        The curve is evaluated numerically from its coefficients (Horner scheme), so
+        a whole array of parameter values can be evaluated at once.
+
+        :param float, np.ndarray t_param: parameter of the motion curve, scalar or
+            array of N values
         :param bool inverted_part: if True, return the inverted part of the curve
 
-        :return: pose of the curve as a dual quaternion vector
+        :return: pose of the curve as a dual quaternion vector of shape (8,), or array
+            of shape (N, 8) if an array of parameters is given
         :rtype: np.ndarray
         """
-        t = sp.Symbol("t")
-        if inverted_part:
-            return np.array(
-                [
-                    self.set_of_polynomials_inversed[i].subs(t, t_param).evalf()
-                    for i in range(len(self.set_of_polynomials_inversed))
-                ],
-                dtype="float64",
-            )
-        else:
-            return np.array(
-                [
-                    self.set_of_polynomials[i].subs(t, t_param).evalf()
-                    for i in range(len(self.set_of_polynomials))
-                ],
-                dtype="float64",
-            )
+        coeffs = self.coeffs_inversed if inverted_part else self.coeffs
+        return self.evaluate_coeffs(coeffs, t_param)
+
+    @staticmethod
+    def evaluate_coeffs(coeffs: Union[np.ndarray, sp.Matrix],
+                        t_param: Union[float, np.ndarray]) -> np.ndarray:
+        """
+        Evaluate the rows of the coefficient matrix as polynomials in t
+
+        The coefficients are ordered from the highest degree, as in
+        :attr:`.RationalCurve.coeffs`.
+
+        :param Union[np.ndarray, sp.Matrix] coeffs: coefficients of the curve
+        :param float, np.ndarray t_param: parameter value or array of N values
+
+        :return: array of shape (dimension + 1,) or (N, dimension + 1)
+        :rtype: np.ndarray
+        """
+        coeffs = np.asarray(coeffs, dtype="float64")
+        t_param = np.asarray(t_param, dtype="float64")
+
+        result = np.multiply.outer(np.ones_like(t_param), coeffs[:, 0])
+        for i in range(1, coeffs.shape[1]):
+            result = result * t_param[..., np.newaxis] + coeffs[:, i]
+
+        return result
+
+    @staticmethod
+    def derivative_coeffs(coeffs: np.ndarray) -> np.ndarray:
+        """
+        Coefficients of the derivatives of the rows of the coefficient matrix
+
+        :param np.ndarray coeffs: coefficients of shape (n, degree + 1), ordered from
+            the highest degree
+
+        :return: coefficients of the derivatives of shape (n, degree)
+        :rtype: np.ndarray
+        """
+        degree = coeffs.shape[1] - 1
+        return coeffs[:, :-1] * np.arange(degree, 0, -1)
 
     def evaluate_as_matrix(self, t_param, inverted_part: bool = False) -> np.ndarray:
         """
@@ -501,34 +629,22 @@ class RationalCurve:
         :return: tuple of np.ndarray - (x, y, z) coordinates of the curve
         :rtype: tuple[np.ndarray, np.ndarray, np.ndarray]
         """
-        t = sp.Symbol("t")
-
         if interval == 'closed':
             # tangent half-angle substitution for closed curves
-            t_space = np.tan(np.linspace(-np.pi/2, np.pi/2, steps + 1))
+            t_space = np.tan(np.linspace(-np.pi/2, np.pi/2, steps + 1))[:steps]
         else:
             t_space = np.linspace(interval[0], interval[1], steps)
 
-        # make a copy of the polynomials and append the homogeneous coordinate
-        # to the Z-equation place in the list if in 2D, so later z = 1
-        polynoms = deepcopy(self.set_of_polynomials)
-        if self.dimension == 2:
-            polynoms.append(sp.Poly(polynoms[0], t))
-
-        # plot the curve
-        curve_points = [PointHomogeneous()] * steps
-        for i in range(steps):
-            point = self.evaluate(t_space[i])
-
-            # if it is a pose in SE3, convert it to a point via matrix mapping
-            if self.is_motion:
-                point = DualQuaternion(point).dq2point_via_matrix()
-                point = np.concatenate((np.array([1]), point))
-            elif self.is_affine_motion:
-                point = point[:4]
-
-            curve_points[i] = PointHomogeneous([point[0], point[-3], point[-2], point[-1]])
-        x, y, z = zip(*[curve_points[i].normalized_in_3d() for i in range(steps)])
+        values = self.evaluate(t_space)
+
+        # if it is a pose in SE3, convert it to a point via matrix mapping
+        if self.is_motion:
+            values = dq_array2matrix(values)[:, :, 0]
+        elif self.is_affine_motion:
+            values = values[:, :4]
+
+        points = values[:, [0, -3, -2, -1]]
+        x, y, z = (points[:, 1:] / points[:, :1]).T
         return x, y, z
 
     def get_curve_in_pr12(self) -> "RationalCurve":
@@ -541,28 +657,38 @@ class RationalCurve:
         if not self.is_motion:
             raise ValueError("The curve is not a motion curve, cannot convert to PR12")
 
-        t = sp.Symbol("t")
+        coeffs = np.asarray(self.coeffs, dtype='float64')
+
+        # products of the coordinate polynomials, (8, 8, 2 * degree + 1)
+        products = np.array([[np.convolve(a, b) for b in coeffs] for a in coeffs])
 
-        # convert the motion curve to a dual quaternion, then map to matrix
-        curve_matrix = DualQuaternion(self.symbolic).dq2matrix(normalize=False)
+        # entries of the matrix are quadratic forms in the Study parameters,
+        # recovered by polarization of the dual quaternion to matrix map
+        basis = np.eye(8)
+        squares = dq_array2matrix(basis, normalize=False)
+        forms = (dq_array2matrix(basis[:, np.newaxis] + basis[np.newaxis, :],
+                                 normalize=False)
+                 - squares[:, np.newaxis] - squares[np.newaxis, :]) / 2
+        curve_matrix = np.einsum('ijrc,ijk->rck', forms, products)
 
-        # save the not normalized coordinate
-        curve_p = curve_matrix[0, 0]
-        # transpose the matrix so the flatten() provides right order (vector by vector)
-        curve_r12 = curve_matrix[1:4, :].T.flatten()
+        # the not normalized coordinate, then the matrix columns vector by vector
+        curve_pr12 = np.concatenate((curve_matrix[0, :1],
+                                     curve_matrix[1:4, :].transpose(1, 0, 2).reshape(
+                                         12, -1)))
 
-        # create PR12 vector of polynomial equations
-        curve_pr12 = np.concatenate((np.array([curve_p]), curve_r12))
-        curve_poly = [sp.Poly(curve, t) for curve in curve_pr12]
+        # drop vanishing leading coefficients
+        scale = np.max(np.abs(curve_pr12))
+        leading = np.argmax(np.any(np.abs(curve_pr12) > 1e-12 * scale, axis=0))
 
-        return RationalCurve(curve_poly)
+        return RationalCurve.from_coeffs(curve_pr12[:, leading:])
 
     def split_in_beziers(self,
                          min_splits: int = 0) -> list["BezierSegment"]:
         """
         Split the curve into Bezier curves with positive weights of control points.
 
-        The curve is split into Bezier curves using the De Casteljau algorithm.
+        The curve is split into Bezier curves using the De Casteljau algorithm,
+        all segments are subdivided at once as a (k, n, 13) array of control points.
 
         :param int min_splits: minimal number of splits to be performed
 
@@ -576,45 +702,50 @@ class RationalCurve:
 
         curve = self.get_curve_in_pr12()
 
-        # obtain Bezier curves for the curve and its reparametrized inverse part
-        bezier_curve_segments = [
-            # reparametrize the curve from the intervals [-1, 1]
-            BezierSegment(curve.curve2bezier_control_points(reparametrization=True),
-                          t_param=(False, [-1.0, 1.0]),
-                          metric=self.metric),
-            BezierSegment(curve.inverse_curve().curve2bezier_control_points(
-                reparametrization=True),
-                t_param=(True, [-1.0, 1.0]),
-                metric=self.metric)
-        ]
+        # control points of the curve and its reparametrized inverse part,
+        # both reparametrized from the intervals [-1, 1], (k, n, 13)
+        control_points = np.array([
+            curve.bezier_control_points_array(reparametrization=True),
+            curve.inverse_curve().bezier_control_points_array(reparametrization=True)])
+        inverted = np.array([False, True])
+        intervals = np.array([[-1.0, 1.0], [-1.0, 1.0]])
 
         # split the Bezier curves until all control points have positive weights
         # or no weights at infinity, or the minimal number of splits is reached
         while True:
-            new_segments = [
-                part for b_curve in bezier_curve_segments
-                for part in (
-                    b_curve.split_de_casteljau()
-                    if b_curve.check_for_control_points_at_infinity()
-                       or b_curve.check_for_negative_weights() else [b_curve])
-            ]
+            to_split = BezierSegment.invalid_weights(control_points)
 
             # if all control points have positive weights and no weights at infinity,
             # but the minimal number of splits is not reached, continue splitting
-            if not any(
-                    b_curve.check_for_control_points_at_infinity()
-                    or b_curve.check_for_negative_weights()
-                    for b_curve in new_segments):
-                if len(new_segments) < min_splits:
-                    new_segments = [part for b_curve in new_segments
-                                    for part in b_curve.split_de_casteljau()]
+            if not np.any(to_split):
+                if len(control_points) < min_splits:
+                    to_split[:] = True
                 else:
-                    bezier_curve_segments = new_segments
                     break
 
-            bezier_curve_segments = new_segments
-
-        return bezier_curve_segments
+            left, right = BezierSegment.de_casteljau(control_points[to_split])
+            mid_t = np.mean(intervals[to_split], axis=1)
+
+            # keep the order of the segments, the split ones are replaced by
+            # their left and right parts
+            order = np.argsort(np.concatenate((2 * np.nonzero(~to_split)[0],
+                                               2 * np.nonzero(to_split)[0],
+                                               2 * np.nonzero(to_split)[0] + 1)),
+                               kind='stable')
+
+            control_points = np.concatenate(
+                (control_points[~to_split], left, right))[order]
+            inverted = np.concatenate(
+                (inverted[~to_split], inverted[to_split], inverted[to_split]))[order]
+            intervals = np.concatenate(
+                (intervals[~to_split],
+                 np.column_stack((intervals[to_split, 0], mid_t)),
+                 np.column_stack((mid_t, intervals[to_split, 1]))))[order]
+
+        return [BezierSegment(points,
+                              t_param=(bool(inv), interval.tolist()),
+                              metric=self.metric)
+                for points, inv, interval in zip(control_points, inverted, intervals)]
 
     def get_path_length(self, num_of_points: int = 100) -> float:
         """
@@ -628,13 +759,164 @@ class RationalCurve:
         :rtype: float
         """
         t_space = np.tan(np.linspace(-np.pi/2, np.pi/2, num_of_points))
-        poses = [self.evaluate(t) for t in t_space]
-
-        points = [DualQuaternion(p).dq2point_via_matrix()
-                  for p in poses]
+        points = dq_array2matrix(self.evaluate(t_space))[:, 1:4, 0]
 
         return np.sum(np.linalg.norm(np.diff(points, axis=0), axis=1))
 
+    def point_path_speed(self,
+                         t_param: Union[float, np.ndarray],
+                         point_to_act_on: PointHomogeneous = PointHomogeneous()
+                         ) -> np.ndarray:
+        """
+        Speed of a point moved by the motion curve, i.e. the norm of its derivative
+
+        :param float, np.ndarray t_param: parameter values of any shape
+        :param PointHomogeneous point_to_act_on: point to act on
+
+        :return: speed of the point of the same shape as t_param
+        :rtype: np.ndarray
+        """
+        coeffs = np.asarray(self.coeffs, dtype='float64')
+        curve = self.evaluate_coeffs(coeffs, t_param)
+        curve_diff = self.evaluate_coeffs(self.derivative_coeffs(coeffs), t_param)
+
+        point = np.asarray(point_to_act_on.array(), dtype='float64')
+        point_dq = np.zeros(8)
+        point_dq[0] = point[0]
+        point_dq[5:] = point[1:]
+
+        eps_conj = np.array([1, 1, 1, 1, -1, -1, -1, -1])
+        conj = np.array([1, -1, -1, -1, 1, -1, -1, -1])
+
+        # the orbit eps_conj(C) X conj(C) and its derivative by the product rule
+        moved = dq_array_mul(dq_array_mul(curve * eps_conj, point_dq), curve * conj)
+        moved_diff = (dq_array_mul(dq_array_mul(curve_diff * eps_conj, point_dq),
+                                   curve * conj)
+                      + dq_array_mul(dq_array_mul(curve * eps_conj, point_dq),
+                                     curve_diff * conj))
+
+        # derivative of the normalized point by the quotient rule
+        w = moved[..., :1]
+        velocity = (moved_diff[..., 5:] * w - moved[..., 5:] * moved_diff[..., :1]) / w ** 2
+
+        return np.linalg.norm(velocity, axis=-1)
+
+    def arc_length_table(self,
+                         interval: list[float],
+                         point_to_act_on: PointHomogeneous = PointHomogeneous(),
+                         tol: float = 1e-12) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Cumulative arc length of the point path in given interval
+
+        The interval is split into panels that are refined until the Gauss-Legendre
+        quadrature of every panel agrees with the sum over its halves.
+
+        :param list[float] interval: interval of the parameter t
+        :param PointHomogeneous point_to_act_on: point to act on
+        :param float tol: tolerance of the arc length relative to its total value
+
+        :return: tuple of the panel boundaries and the cumulative arc length at them
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+        nodes, weights = np.polynomial.legendre.leggauss(10)
+
+        def integrate(lows, highs):
+            half = (highs - lows) / 2
+            t = lows[:, np.newaxis] + half[:, np.newaxis] * (nodes + 1)
+            return half * (self.point_path_speed(t, point_to_act_on) @ weights)
+
+        lows = np.linspace(interval[0], interval[1], 17)[:-1]
+        highs = np.append(lows[1:], interval[1])
+        done_lows, done_highs, done_lengths = [], [], []
+
+        for _ in range(50):
+            mids = (lows + highs) / 2
+            coarse = integrate(lows, highs)
+            fine = integrate(lows, mids) + integrate(mids, highs)
+
+            total = np.sum(done_lengths) + np.sum(fine)
+            accurate = np.abs(fine - coarse) <= tol * max(total, np.finfo(float).tiny)
+
+            done_lows.append(lows[accurate])
+            done_highs.append(highs[accurate])
+            done_lengths.append(fine[accurate])
+
+            lows, highs = (np.concatenate((lows[~accurate], mids[~accurate])),
+                           np.concatenate((mids[~accurate], highs[~accurate])))
+            if len(lows) == 0:
+                break
+        else:
+            done_lows.append(lows)
+            done_highs.append(highs)
+            done_lengths.append(integrate(lows, highs))
+
+        lows = np.concatenate(done_lows)
+        order = np.argsort(lows)
+        breakpoints = np.append(lows[order], interval[1])
+        cumulative = np.concatenate(([0.0],
+                                     np.cumsum(np.concatenate(done_lengths)[order])))
+
+        return breakpoints, cumulative
+
+    def arc_length_to_t(self,
+                        lengths: np.ndarray,
+                        table: tuple[np.ndarray, np.ndarray],
+                        point_to_act_on: PointHomogeneous = PointHomogeneous(),
+                        tol: float = 1e-14) -> np.ndarray:
+        """
+        Parameter values of the point path at given arc lengths
+
+        The panels of the arc length table are found by binary search, the
+        parameters inside them by Newton's method safeguarded by bisection.
+
+        :param np.ndarray lengths: arc lengths from the start of the table interval
+        :param tuple[np.ndarray, np.ndarray] table: table returned by
+            :meth:`.RationalCurve.arc_length_table`
+        :param PointHomogeneous point_to_act_on: point of the table
+        :param float tol: tolerance of the parameter values
+
+        :return: parameter values of the same shape as lengths
+        :rtype: np.ndarray
+        """
+        breakpoints, cumulative = table
+        nodes, weights = np.polynomial.legendre.leggauss(10)
+
+        lengths = np.asarray(lengths, dtype='float64')
+        flat_lengths = lengths.ravel()
+        panel = np.clip(np.searchsorted(cumulative, flat_lengths, side='right') - 1,
+                        0, len(breakpoints) - 2)
+
+        start = breakpoints[panel]
+        target = flat_lengths - cumulative[panel]
+        low, high = start.copy(), breakpoints[panel + 1].copy()
+
+        # linear interpolation in the panel as the initial guess
+        panel_lengths = cumulative[panel + 1] - cumulative[panel]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = start + (high - low) * np.clip(target / panel_lengths, 0.0, 1.0)
+        t = np.where(np.isfinite(t), t, start)
+
+        for _ in range(50):
+            half = (t - start) / 2
+            t_nodes = start[:, np.newaxis] + half[:, np.newaxis] * (nodes + 1)
+            residuum = (half * (self.point_path_speed(t_nodes, point_to_act_on)
+                                @ weights)) - target
+
+            low = np.where(residuum < 0, t, low)
+            high = np.where(residuum > 0, t, high)
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                t_new = t - residuum / self.point_path_speed(t, point_to_act_on)
+            bracketed = np.isfinite(t_new) & (t_new >= low) & (t_new <= high)
+            t_new = np.where(bracketed, t_new, (low + high) / 2)
+
+            converged = np.abs(t_new - t) <= tol * np.maximum(1.0, np.abs(t))
+            t = t_new
+            if np.all(converged):
+                break
+
+        return t.reshape(lengths.shape)
+
     def split_in_equal_segments(self,
                                 interval: list[float],
                                 point_to_act_on: PointHomogeneous = PointHomogeneous(),
@@ -643,7 +925,9 @@ class RationalCurve:
         Find the t values that split the curve into equal segments in given interval
 
         Perform the arc length parameterization of the curve to split it into equal
-        segments. The method uses the bisection method to find the t values.
+        segments. The cumulative arc length table is computed once, see
+        :meth:`.RationalCurve.arc_length_table`, and inverted for all the segments
+        at once.
 
         :param list[float] interval: interval of the parameter t
         :param PointHomogeneous point_to_act_on: point to act on
@@ -656,11 +940,6 @@ class RationalCurve:
         :raises ValueError: if the interval values are identical
         :raises ValueError: if the number of segments is less than 1
         """
-        try:
-            from scipy.integrate import quad  # lazy import
-        except ImportError:
-            raise RuntimeError("Scipy import failed. Check the package installation.")
-
         if interval[0] > interval[1]:
             raise ValueError("The interval must be in the form [a, b] where a < b")
         elif interval[0] == interval[1]:
@@ -668,78 +947,13 @@ class RationalCurve:
         elif num_segments < 2:
             raise ValueError("The number of segments must be greater than 1")
 
-        t = sp.Symbol('t')
-
-        curve_dq = DualQuaternion(self.symbolic)
-        point_path = curve_dq.act(point_to_act_on)
-
-        dx_dt = sp.diff(point_path[1] / point_path[0], t)
-        dy_dt = sp.diff(point_path[2] / point_path[0], t)
-        dz_dt = sp.diff(point_path[3] / point_path[0], t)
-
-        integrand = sp.sqrt(dx_dt ** 2 + dy_dt ** 2 + dz_dt ** 2)
-        integrand_func = sp.lambdify(t, integrand, 'numpy')
-
-        arc_length, _ = quad(integrand_func, interval[0], interval[1])
-        desired_segment_length = arc_length / num_segments
-
-        t_vals = [interval[0]]
-        for i in range(num_segments - 1):
-            b = self._bisection_find_t(t_vals[-1],
-                                       interval,
-                                       desired_segment_length,
-                                       integrand_func)
-            t_vals.append(b)
-        t_vals.append(interval[1])
-
-        return t_vals
-
-    @staticmethod
-    def _bisection_find_t(section_start: float,
-                          curve_interval: list[float],
-                          segment_length_target: float,
-                          integrand_func: callable,
-                          tolerance: float = 1e-14):
-        """
-        Find the t value that splits the curve into given segment length using bisection
-
-        :param float section_start: start of the section
-        :param list[float] curve_interval: interval of the parameter t
-        :param float segment_length_target: target segment length
-        :param callable integrand_func: integrand function
-        :param float tolerance: tolerance of the bisection method
-
-        :return: t value that splits the curve into given segment length
-        :rtype: float
-        """
-        try:
-            from scipy.integrate import quad  # lazy import
-        except ImportError:
-            raise RuntimeError("Scipy import failed. Check the package installation.")
-
-        # initial lower and upper bounds
-        low = section_start
-        high = curve_interval[1]  # start with the upper bound
-
-        # ensure the segment length at 'high' is greater than the target
-        while True:
-            segment_length_high, _ = quad(integrand_func, section_start, high)
-            if segment_length_high >= segment_length_target:
-                break
-            high += 0.1 * (curve_interval[1] - curve_interval[0])
-
-        # bisection
-        while high - low > tolerance:
-            mid = (low + high) / 2
-            segment_length_mid, _ = quad(integrand_func, section_start, mid)
+        table = self.arc_length_table(interval, point_to_act_on)
+        arc_length = table[1][-1]
 
-            if segment_length_mid < segment_length_target:
-                low = mid
-            else:
-                high = mid
+        lengths = arc_length * np.arange(1, num_segments) / num_segments
+        t_vals = self.arc_length_to_t(lengths, table, point_to_act_on)
 
-        t_val = (low + high) / 2
-        return t_val
+        return [interval[0]] + t_vals.tolist() + [interval[1]]
 
     def study_quadric_check(self) -> np.ndarray:
         """
@@ -8,7 +8,7 @@ import numpy as np
 import sympy as sp
 
 from .DualQuaternion import DualQuaternion
-from .Linkage import LineSegment
+from .Linkage import LineSegment, NumericLineSegment
 from .MotionFactorization import MotionFactorization
 from .NormalizedLine import NormalizedLine
 from .PointHomogeneous import PointHomogeneous
@@ -83,6 +83,8 @@ class RationalMechanism(RationalCurve):
         self._metric = None
 
         self._linear_motions_cycle = None
+        self._ik_solver = None
+        self._collision_analyser = None
 
 
     @property
@@ -102,6 +104,35 @@ class RationalMechanism(RationalCurve):
 
         return self._segments
 
+    @property
+    def ik_solver(self) -> "InverseKinematicsSolver":
+        """
+        Return the inverse kinematics solver of the mechanism, created once.
+
+        :return: numeric inverse kinematics solver
+        :rtype: InverseKinematicsSolver
+        """
+        if getattr(self, '_ik_solver', None) is None:
+            from .InverseKinematicsSolver import InverseKinematicsSolver  # lazy import
+            self._ik_solver = InverseKinematicsSolver(self)
+        return self._ik_solver
+
+    @property
+    def collision_analyser(self) -> "CollisionAnalyser":
+        """
+        Return the collision analyser of the mechanism, created once.
+
+        After the design of the mechanism changes, update it by
+        :meth:`.CollisionAnalyser.update_points`.
+
+        :return: collision analyser of the bounding balls of the segments
+        :rtype: CollisionAnalyser
+        """
+        if getattr(self, '_collision_analyser', None) is None:
+            from .CollisionAnalyser import CollisionAnalyser  # lazy import
+            self._collision_analyser = CollisionAnalyser(self)
+        return self._collision_analyser
+
     @property
     def metric(self):
         """
@@ -570,7 +601,9 @@ class RationalMechanism(RationalCurve):
                         parallel: bool = False,
                         pretty_print: bool = True,
                         only_links: bool = False,
-                        terminate_on_first: bool = False):
+                        terminate_on_first: bool = False,
+                        broad_phase: bool = False,
+                        pool: 'CollisionCheckPool' = None):
         """
         Perform full-cycle collision check on the line-model linkage.
 
@@ -578,53 +611,51 @@ class RationalMechanism(RationalCurve):
         faster for 4-bar linkages and 6-bar lingakes with a "simpler" motion curve,
         but slower for 6-bar linkages with "complex" motions.
 
+        With the broad phase enabled, the bounding balls of the segment orbits
+        (see :class:`.CollisionAnalyser`) are compared first and the pairs of segments
+        whose swept volumes do not overlap are skipped.
+
         :param bool parallel: if True, perform collision check in parallel using
             multiprocessing
-        :param bool pretty_print: if True, print the results in a readable form
+        :param bool pretty_print: if True, print the progress and the results in
+            a readable form, if False, nothing is printed
         :param bool only_links: if True, only link-link collisions are checked,
             expecting that distances between joint connection points are minimal
         :param bool terminate_on_first: if True, terminate the collision check when
             the first collision is found
+        :param bool broad_phase: if True, discard the segment pairs with
+            non-overlapping bounding balls before solving the collision polynomials
+        :param CollisionCheckPool pool: persistent pool of worker processes used in
+            the parallel mode; reuse it for repeated checks to avoid starting new
+            processes for every call
 
         :return: list of collision check colliding parameter values
         :rtype: list[float]
         """
         start_time = time()
-        print("Collision check started...")
+        if pretty_print:
+            print("Collision check started...")
 
         # update the line segments (physical realization of the linkage)
         self.update_segments()
 
-        iters = []
-        # iterate over all line segments
-        for ii in range(len(self.segments)):
-            # for each line segment, iterate over all other line segments that are not
-            # its immediate neighbors
-            for jj in range(ii + 2, len(self.segments)):
-                # in only links should be checked (joint segments have minimal length)
-                if only_links:
-                    if (self.segments[ii].type == 'j'
-                            or self.segments[jj].type == 'j'
-                            or jj - ii == 2):  # skip neighbouring links
-                        pass
-                    else:
-                        iters.append((ii, jj))
-                else:
-                    iters.append((ii, jj))
+        iters = self.collision_check_pairs(only_links)
 
-        # remove the last neighbouring pair of links
-        if only_links:
-            # find the pair with the highest difference
-            max_pair = max(iters, key=lambda x: x[1] - x[0])
-            # remove the pair from the list
-            iters.remove(max_pair)
-        else:  # remove the first link and last joint segments anyway (neighbours)
-            iters.remove((0, len(self.segments) - 1))
+        if broad_phase:
+            # the motions and their splits are reused between the calls
+            analyser = self.collision_analyser
+            analyser.update_points()
+            iters = [(ii, jj) for ii, jj in iters
+                     if analyser.segments_may_collide(self.segments[ii].id,
+                                                      self.segments[jj].id)]
 
-        print(f"--- number of tasks to solve: {len(iters)} ---")
+        if pretty_print:
+            print(f"--- number of tasks to solve: {len(iters)} ---")
 
         if parallel:
-            collision_results = self._collision_check_parallel(iters)
+            if pretty_print:
+                print("--- running in parallel ---")
+            collision_results = self._collision_check_parallel(iters, pool)
         else:
             collision_results = self._collision_check_nonparallel(iters,
                                                                   terminate_on_first)
@@ -635,9 +666,9 @@ class RationalMechanism(RationalCurve):
             flattened_results = None
 
         end_time = time()
-        print(f"--- collision check finished in {end_time - start_time} seconds.")
 
         if pretty_print:
+            print(f"--- collision check finished in {end_time - start_time} seconds.")
             if flattened_results is None:
                 print("No collisions found.")
             else:
@@ -648,7 +679,8 @@ class RationalMechanism(RationalCurve):
 
         return flattened_results
 
-    def _collision_check_parallel(self, iters: list[tuple[int, int]]):
+    def _collision_check_parallel(self, iters: list[tuple[int, int]],
+                                  pool: 'CollisionCheckPool' = None):
         """
         Perform collision check in parallel using multiprocessing.
 
@@ -656,17 +688,61 @@ class RationalMechanism(RationalCurve):
         faster for 6-bar linkages with "complex" motions.
 
         :param list iters: list of tuples of indices of the line segments to be checked
+        :param CollisionCheckPool pool: pool of worker processes to use, if None,
+            a temporary pool is created
 
         :return: list of collision check results
         :rtype: list[str]
         """
-        print("--- running in parallel ---")
-        import concurrent.futures
+        if pool is not None:
+            return pool.check_pairs(self.segments, iters)
 
-        with concurrent.futures.ProcessPoolExecutor() as executor:
-            results = executor.map(self._check_given_pair, iters)
+        from .CollisionCheckPool import CollisionCheckPool  # lazy import
+
+        with CollisionCheckPool() as tmp_pool:
+            results = tmp_pool.check_pairs(self.segments, iters)
+
+        return results
+
+    def collision_check_pairs(self, only_links: bool = False) -> list[tuple[int, int]]:
+        """
+        Get the pairs of line segments that are checked for collisions
 
-        return list(results)
+        Neighbouring segments are connected, so they are not checked.
+
+        :param bool only_links: if True, only link-link pairs are returned, expecting
+            that distances between joint connection points are minimal
+
+        :return: list of pairs of indices of line segments
+        :rtype: list[tuple[int, int]]
+        """
+        iters = []
+        # iterate over all line segments
+        for ii in range(len(self.segments)):
+            # for each line segment, iterate over all other line segments that are not
+            # its immediate neighbors
+            for jj in range(ii + 2, len(self.segments)):
+                # in only links should be checked (joint segments have minimal length)
+                if only_links:
+                    if (self.segments[ii].type == 'j'
+                            or self.segments[jj].type == 'j'
+                            or jj - ii == 2):  # skip neighbouring links
+                        pass
+                    else:
+                        iters.append((ii, jj))
+                else:
+                    iters.append((ii, jj))
+
+        # remove the last neighbouring pair of links
+        if only_links:
+            # find the pair with the highest difference
+            max_pair = max(iters, key=lambda x: x[1] - x[0])
+            # remove the pair from the list
+            iters.remove(max_pair)
+        else:  # remove the first link and last joint segments anyway (neighbours)
+            iters.remove((0, len(self.segments) - 1))
+
+        return iters
 
     def _collision_check_nonparallel(self, iters: list[tuple[int, int]],
                                      terminate_on_first: bool = False):
@@ -700,30 +776,40 @@ class RationalMechanism(RationalCurve):
         :return: collision check result
         :rtype: list[float]
         """
-        i = iters[0]
-        j = iters[1]
+        return self.check_segments_pair(self.segments[iters[0]],
+                                        self.segments[iters[1]])
+
+    @staticmethod
+    def check_segments_pair(segment0: Union[LineSegment, NumericLineSegment],
+                            segment1: Union[LineSegment, NumericLineSegment]
+                            ) -> Union[list[float], None]:
+        """
+        Perform collision check for a pair of line segments.
+
+        Only numeric coefficients of the segments are used, therefore it works also
+        with the compact :class:`.NumericLineSegment` representation.
+
+        :param LineSegment, NumericLineSegment segment0: first line segment
+        :param LineSegment, NumericLineSegment segment1: second line segment
+
+        :return: colliding parameter values, None if the segments do not collide
+        :rtype: list[float]
+        """
         # check if two lines are colliding
-        collisions, coll_pts = self.colliding_lines(self.segments[i].equation,
-                                                    self.segments[j].equation)
-
-        if collisions is not None:
-            # check if the collision is between the physical line segments
-            physical_collision = [
-                self.segments[i].is_point_in_segment(coll_pts[k], t_val) and
-                self.segments[j].is_point_in_segment(coll_pts[k], t_val)
-                for k, t_val in enumerate(collisions)
-            ]
+        collisions = RationalMechanism.collision_polynomial_roots(
+            segment0.plucker_coeffs, segment1.plucker_coeffs)
+        coll_pts = RationalMechanism.get_intersection_points_batch(
+            segment0.evaluate_line(collisions),
+            segment1.evaluate_line(collisions))
+
+        # check if the collision is between the physical line segments
+        physical_collision = (
+            segment0.is_point_in_segment_batch(coll_pts, collisions)
+            & segment1.is_point_in_segment_batch(coll_pts, collisions))
+
+        if physical_collision.any():
+            result = list(collisions[physical_collision])
         else:
-            physical_collision = [False]
-
-        result = []
-        if True in physical_collision:
-            for i, res in enumerate(physical_collision):
-                if res:
-                    result.append(collisions[i])
-            #result = f"{physical_collision} at parameters: {collisions} for linkage pair: {self.segments[i].type}_{self.segments[i].factorization_idx}{self.segments[i].idx} X {self.segments[j].type}_{self.segments[j].factorization_idx}{self.segments[j].idx}"
-        else:
-            #result = f"no collision between {self.segments[i].type}_{self.segments[i].factorization_idx}{self.segments[i].idx} X {self.segments[j].type}_{self.segments[j].factorization_idx}{self.segments[j].idx}"
             result = None
 
         return result
@@ -739,24 +825,48 @@ class RationalMechanism(RationalCurve):
         :return: tuple (list of t values, list of intersection points)
         :rtype: tuple[list[float], list[PointHomogeneous]]
         """
-        t = sp.Symbol("t")
+        solutions = self.collision_polynomial_roots(LineSegment.get_plucker_coeffs(l0),
+                                                    LineSegment.get_plucker_coeffs(l1))
+
+        intersection_points = self.get_intersection_points(l0, l1, solutions)
+
+        return solutions, intersection_points
+
+    @staticmethod
+    def collision_polynomial_roots(coeffs0: np.ndarray,
+                                   coeffs1: np.ndarray) -> np.ndarray:
+        """
+        Return the parameter values at which two lines in motion intersect.
+
+        The lines are given by numeric coefficients of their Plucker coordinates, see
+        :meth:`.LineSegment.get_plucker_coeffs`. The collision polynomial
+        (direction0 . moment1 + moment0 . direction1) is assembled by polynomial
+        multiplication and its real roots are found as eigenvalues of the companion
+        matrix.
+
+        :param np.ndarray coeffs0: Plucker coefficients of the first line, shape (6, n)
+        :param np.ndarray coeffs1: Plucker coefficients of the second line, shape (6, m)
+
+        :return: array of t values
+        :rtype: np.ndarray
+        """
+        poly = np.polynomial.polynomial
 
         # lines are colliding when expr = 0
-        expr = np.dot(l0.direction, l1.moment) + np.dot(l0.moment, l1.direction)
+        expr = np.zeros(1)
+        for k in range(3):
+            expr = poly.polyadd(expr, poly.polymul(coeffs0[k], coeffs1[k + 3]))
+            expr = poly.polyadd(expr, poly.polymul(coeffs0[k + 3], coeffs1[k]))
 
         # reparametrize the expresion by t -> (t + 1) / 2 to interval [-1, 1]
-        e = sp.Expr(expr).subs(t, (t + 1) / 2).evalf()
+        expr = poly.Polynomial(expr)(poly.Polynomial([0.5, 0.5]))
+        expr_n = poly.polytrim(expr.coef)
 
-        expr_poly = sp.Poly(e.args[0], t)
-        expr_coeffs = expr_poly.all_coeffs()
-
-        # convert to numpy polynomial
-        expr_n = np.array(expr_coeffs, dtype="float64")
-        np_poly = np.polynomial.polynomial.Polynomial(expr_n[::-1])
+        np_poly = poly.Polynomial(expr_n)
 
         # inversing coeffs enables to solve intervals (-oo, 0) and (0, oo), that are
         # actually mapped to [-1, 1]
-        np_poly_inversed = np.polynomial.polynomial.Polynomial(expr_n)
+        np_poly_inversed = poly.Polynomial(expr_n[::-1])
 
         # solve for t
         colliding_lines_sol = np_poly.roots()
@@ -767,23 +877,13 @@ class RationalMechanism(RationalCurve):
         sol_real_inversed = colliding_lines_sol_inversed.real[
             np.isclose(colliding_lines_sol_inversed.imag, 0, atol=1e-5)]
 
-        sol_real = [((sol + 1)/2) for sol in sol_real]
-        sol_real_inversed = [((sol + 1)/2) for sol in sol_real_inversed]
+        sol_real = (sol_real + 1) / 2
+        sol_real_inversed = (sol_real_inversed + 1) / 2
 
-        solutions = deepcopy(sol_real)
+        # eps is very small number (avoid division by zero)
+        sol_real_inversed[np.isclose(sol_real_inversed, 0)] = np.finfo(float).eps
 
-        for sol in sol_real_inversed:
-            if np.isclose(sol, 0):
-                # eps is very small number (avoid division by zero)
-                sol = 1 / np.finfo(float).eps
-            else:
-                sol = 1 / sol
-
-            solutions = np.append(solutions, sol)
-
-        intersection_points = self.get_intersection_points(l0, l1, solutions)
-
-        return solutions, intersection_points
+        return np.concatenate((sol_real, 1 / sol_real_inversed))
 
     @staticmethod
     def get_intersection_points(l0: NormalizedLine, l1: NormalizedLine,
@@ -812,6 +912,45 @@ class RationalMechanism(RationalCurve):
 
         return intersection_points
 
+    @staticmethod
+    def get_intersection_points_batch(lines0: np.ndarray,
+                                      lines1: np.ndarray) -> np.ndarray:
+        """
+        Return the intersection points of pairs of lines given as arrays.
+
+        Vectorized version of :meth:`.RationalMechanism.get_intersection_points`,
+        the lines are given by their (unnormalized) Plucker coordinates, e.g.
+        evaluated by :meth:`.LineSegment.evaluate_line`.
+
+        :param np.ndarray lines0: array of shape (N, 6) of the first lines
+        :param np.ndarray lines1: array of shape (N, 6) of the second lines
+
+        :return: array of shape (N, 3) of intersection points
+        :rtype: np.ndarray
+        """
+        lines0 = np.asarray(lines0, dtype="float64").reshape(-1, 6)
+        lines1 = np.asarray(lines1, dtype="float64").reshape(-1, 6)
+
+        # normalize the lines
+        lines0 = lines0 / np.linalg.norm(lines0[:, :3], axis=1)[:, np.newaxis]
+        lines1 = lines1 / np.linalg.norm(lines1[:, :3], axis=1)[:, np.newaxis]
+        d0, m0 = lines0[:, :3], lines0[:, 3:]
+        d1, m1 = lines1[:, :3], lines1[:, 3:]
+
+        # foot point of the common perpendicular on the first line, see
+        # NormalizedLine.common_perpendicular_to_other_line()
+        cross_product = np.cross(d0, d1)
+        cross_product_norm = np.linalg.norm(cross_product, axis=1)
+        parallel = np.isclose(cross_product_norm, 0.0, atol=1e-5)
+
+        numerator = (np.cross(-m0, np.cross(d1, cross_product))
+                     + d0 * np.sum(m1 * cross_product, axis=1)[:, np.newaxis])
+        denominator = np.where(parallel, 1.0, cross_product_norm ** 2)
+
+        return np.where(parallel[:, np.newaxis],
+                        np.cross(d0, m0),
+                        numerator / denominator[:, np.newaxis])
+
     def _get_line_segments_of_linkage_old(self) -> list:
         """
         Return the line segments of the linkage.
@@ -867,6 +1006,57 @@ class RationalMechanism(RationalCurve):
 
         return segments[0] + segments[1][::-1]
 
+    def _get_moving_segment(self,
+                            line: NormalizedLine,
+                            point0: PointHomogeneous,
+                            point1: PointHomogeneous,
+                            linkage_type: str,
+                            f_idx: int,
+                            idx: int) -> LineSegment:
+        """
+        Get the line segment moving with the given link or joint.
+
+        Links are acted by the axes preceding them, joints also by their own axis.
+        The tool link (index equal to the number of factors of the 2nd factorization)
+        is acted by the 1st factorization, except its second point.
+
+        :param NormalizedLine line: line of the segment in the home configuration
+        :param PointHomogeneous point0: first point of the segment in the home
+            configuration
+        :param PointHomogeneous point1: second point of the segment in the home
+            configuration
+        :param str linkage_type: 'l' for link, 'j' for joint
+        :param int f_idx: index of the factorization
+        :param int idx: index of the segment in the factorization
+
+        :return: line segment with its motion equations
+        :rtype: LineSegment
+        """
+        if idx == self.factorizations[1].number_of_factors and f_idx == 1:  # tool link
+            f0, f1, end_idx = self.factorizations[0], self.factorizations[1], None
+        else:
+            f0 = f1 = self.factorizations[f_idx]
+            end_idx = idx if linkage_type == "j" else idx - 1
+
+        line_coeffs = f0.act_coeffs(line, end_idx=end_idx)
+        p0_coeffs = f0.act_coeffs(point0, end_idx=end_idx)
+        p1_coeffs = f1.act_coeffs(point1, end_idx=end_idx)
+
+        points_coeffs = np.zeros((2, 4, max(p0_coeffs.shape[1], p1_coeffs.shape[1])))
+        points_coeffs[0, :, :p0_coeffs.shape[1]] = p0_coeffs
+        points_coeffs[1, :, :p1_coeffs.shape[1]] = p1_coeffs
+
+        # the symbolic equations are built by the segment only when accessed
+        return LineSegment(None,
+                           None,
+                           None,
+                           linkage_type=linkage_type,
+                           f_idx=f_idx,
+                           idx=idx,
+                           default_line=line,
+                           plucker_coeffs=line_coeffs,
+                           points_coeffs=points_coeffs)
+
     def _get_line_segments_of_linkage(self) -> list:
         """
         Return the line segments of the linkage.
@@ -875,11 +1065,13 @@ class RationalMechanism(RationalCurve):
         their motion equations using default connection points of the factorizations
         (default meaning the static points in the home configuration).
 
+        The motions are obtained by the cached numeric actions of the factorizations
+        (see :meth:`.MotionFactorization.get_action_coeffs`), therefore only the
+        connection points and lines are recomputed when the design changes.
+
         :return: list of LineSegment objects
         :rtype: list[LineSegment]
         """
-        t = sp.Symbol("t")
-
         segments = []
 
         # base (static) link has index 0 in the list of the 1st factorization
@@ -895,46 +1087,25 @@ class RationalMechanism(RationalCurve):
         # moving links and joints
         i = 0
         for j in range(1, self.factorizations[i].number_of_factors):
-            line, p0, p1 = self.factorizations[i].link(j)
-            link = self.factorizations[i].act(line, end_idx=j-1, param=t)
-            p0 = self.factorizations[i].act(p0, end_idx=j-1, param=t)
-            p1 = self.factorizations[i].act(p1, end_idx=j-1, param=t)
-            segments.append(LineSegment(link, p0, p1, default_line=line,
-                                        linkage_type="l", f_idx=i, idx=j))
-
-            line, p0, p1 = self.factorizations[i].joint(j)
-            joint = self.factorizations[i].act(line, end_idx=j, param=t)
-            p0 = self.factorizations[i].act(p0, end_idx=j, param=t)
-            p1 = self.factorizations[i].act(p1, end_idx=j, param=t)
-            segments.append(LineSegment(joint, p0, p1, default_line=line,
-                                        linkage_type="j", f_idx=i, idx=j))
+            segments.append(self._get_moving_segment(*self.factorizations[i].link(j),
+                                                     linkage_type="l", f_idx=i, idx=j))
+            segments.append(self._get_moving_segment(*self.factorizations[i].joint(j),
+                                                     linkage_type="j", f_idx=i, idx=j))
 
         # tool (moving - acted) link has index -1 in the list of the 2nd factorization
         tool_link_line, p0, p1 = self.factorizations[0].tool_link(
             self.factorizations[1].linkage[-1].points[1])
-        tool_link = self.factorizations[0].act(tool_link_line, param=t)
-        p0 = self.factorizations[0].act(p0, param=t)
-        p1 = self.factorizations[1].act(p1, param=t)
         tool_idx = self.factorizations[1].number_of_factors
-        segments.append(LineSegment(tool_link, p0, p1, default_line=tool_link_line,
-                                    linkage_type="l", f_idx=1, idx=tool_idx))
+        segments.append(self._get_moving_segment(tool_link_line, p0, p1,
+                                                 linkage_type="l", f_idx=1,
+                                                 idx=tool_idx))
 
         i = 1
         for j in range(self.factorizations[i].number_of_factors -1, 0, -1):
-            line, p0, p1 = self.factorizations[i].joint(j)
-            joint = self.factorizations[i].act(line, end_idx=j, param=t)
-            p0 = self.factorizations[i].act(p0, end_idx=j, param=t)
-            p1 = self.factorizations[i].act(p1, end_idx=j, param=t)
-            segments.append(LineSegment(joint, p0, p1, default_line=line,
-                                        linkage_type="j", f_idx=i, idx=j))
-
-            line, p0, p1 = self.factorizations[i].link(j)
-            link = self.factorizations[i].act(line, end_idx=j-1, param=t)
-            p0 = self.factorizations[i].act(p0, end_idx=j-1, param=t)
-            p1 = self.factorizations[i].act(p1, end_idx=j-1, param=t)
-            segments.append(LineSegment(link, p0, p1, default_line=line,
-                                        linkage_type="l", f_idx=i, idx=j))
-
+            segments.append(self._get_moving_segment(*self.factorizations[i].joint(j),
+                                                     linkage_type="j", f_idx=i, idx=j))
+            segments.append(self._get_moving_segment(*self.factorizations[i].link(j),
+                                                     linkage_type="l", f_idx=i, idx=j))
 
         segments.append(LineSegment(*self.factorizations[1].joint(0),
                                     linkage_type="j", f_idx=1, idx=0))
@@ -1073,6 +1244,46 @@ class RationalMechanism(RationalCurve):
 
         return DualQuaternion(self.evaluate(t)) * self.tool_frame
 
+    def forward_kinematics_batch(self,
+                                 joint_angles: np.ndarray,
+                                 unit: str = 'rad',
+                                 as_matrix: bool = False) -> np.ndarray:
+        """
+        Calculate forward kinematics for an array of joint angles at once.
+
+        Vectorized version of :meth:`.RationalMechanism.forward_kinematics`. The
+        conversion to curve parameters, evaluation of the motion curve and composition
+        with the tool frame are performed on whole arrays.
+
+        :param np.ndarray joint_angles: array of N joint angles (or curve parameters)
+        :param str unit: unit of the joint angles, can be 'rad', 'deg', or 't' as
+            t is the parameter of the motion curve. Default is 'rad'.
+        :param bool as_matrix: if True, return normalized SE(3) matrices instead of
+            dual quaternions
+
+        :return: tool frames as array of shape (N, 8) of Study parameters, or
+            (N, 4, 4) of transformation matrices
+        :rtype: np.ndarray
+
+        :raises ValueError: if unit is not 'rad', 'deg', or 't'
+        """
+        from .utils import dq_array2matrix, dq_array_mul  # lazy import
+
+        if unit == 't':
+            t_params = np.asarray(joint_angles, dtype='float64')
+        elif unit in {'rad', 'deg'}:
+            t_params = self.factorizations[0].joint_angle_to_t_param(
+                np.asarray(joint_angles, dtype='float64'), unit=unit)
+        else:
+            raise ValueError("unit must be deg, rad, or t")
+
+        poses = dq_array_mul(self.evaluate(np.atleast_1d(t_params)),
+                             self.tool_frame.array())
+
+        if as_matrix:
+            return dq_array2matrix(poses)
+        return poses
+
     def direct_kinematics(self,
                           joint_angle: float,
                           unit: str = 'rad') -> DualQuaternion:
@@ -1109,6 +1320,8 @@ class RationalMechanism(RationalCurve):
 
         :return: joint angle in radians or degrees
         :rtype: float
+
+        :raises ValueError: if the 'algebraic' method finds no solution
         """
         if isinstance(pose, TransfMatrix):
             pose = DualQuaternion(pose.matrix2dq())
@@ -1116,11 +1329,13 @@ class RationalMechanism(RationalCurve):
             raise ValueError("pose must be either DualQuaternion or TransfMatrix")
 
         if unit not in {'rad', 'deg', 't'}:
-            raise ValueError("unit must be deg or rad")
+            raise ValueError("unit must be deg, rad, or t")
 
         if method == 'algebraic':
-            # TODO: implement algebraic method
-            raise NotImplementedError("Algebraic method is not implemented yet.")
+            t_solutions = self.ik_solver.solve_algebraic([pose])[0]
+            if len(t_solutions) == 0:
+                raise ValueError("The pose is not reachable by the mechanism.")
+            t = t_solutions[0]
         elif method == 'gauss-newton':
             t = self._ik_gauss_newton(pose, robust_search=robust)
         else:
@@ -1140,6 +1355,8 @@ class RationalMechanism(RationalCurve):
         """
         Calculate inverse kinematics using Gauss-Newton method.
 
+        The iterations are performed by :attr:`.RationalMechanism.ik_solver`.
+
         :param DualQuaternion goal_pose: pose of the mechanism
         :param bool robust_search: if True, use many initial guesses
 
@@ -1148,113 +1365,92 @@ class RationalMechanism(RationalCurve):
 
         :warns: if the method does not converge
         """
-        def run_gauss_newton(pose, robust):
-            t = sp.Symbol("t")
-
-            curves = [self.curve(), self.curve().inverse_curve()]
-            success = False
-            inversed_part = False
-            t_min = [None, float('inf')]
-            t_init_set = [0., -0.999999999, 0.999999999, -0.5, 0.5]
-            t_res = None
-            max_iterations = 10
-            tol = 1e-10
-
-            # map pose to the motion curve of identity frame
-            pose = pose * self.tool_frame.inv()
-
-            if robust:
-                t_init_set = np.linspace(-1.0, 1.0, 30)
-                max_iterations = 50
-                tol = 1e-15
-
-            for inv, curve in enumerate(curves):
-                if inv == 1:
-                    inversed_part = True
-
-                norm_curve = [element / curve.set_of_polynomials[0]
-                              for element in curve.set_of_polynomials]
-
-                c_diff = [element.diff(t) for element in norm_curve]
-
-                # numerical preparation of the derivatives
-                c_diff_funcs = [sp.lambdify(t, expr, modules='numpy')
-                                for expr in c_diff]
-                def c_diff_lambdified(x: float):
-                    return np.array([f(x) for f in c_diff_funcs])
-
-                curve_funcs = [sp.lambdify(t, expr, modules='numpy')
-                               for expr in curve.symbolic]
-                def curve_lambdified(x: float):
-                    return np.array([f(x) for f in curve_funcs])
-
-                for t_val in t_init_set:
-                    step_size = 1.0
-                    previous_error = float('inf')
+        return self.ik_solver.solve([goal_pose], robust=robust_search)[0]
 
-                    for i in range(max_iterations):
-
-                        # check if t_val is valid, i.e. must be in the range [-1, 1]
-                        if (t_val == sp.nan or np.isnan(t_val) or t_val > 10.0
-                                or t_val < -10.0):
-                            break
+    def inverse_kinematics_batch(self,
+                                 poses: list[Union[DualQuaternion, TransfMatrix]],
+                                 unit: str = 'rad',
+                                 method: str = 'gauss-newton',
+                                 robust: bool = False) -> np.ndarray:
+        """
+        Calculate inverse kinematics for many poses at once.
 
-                        target_pose = pose.array()
-                        current_pose = curve_lambdified(t_val)
-                        c_diff_eval = c_diff_lambdified(t_val)
+        Vectorized version of :meth:`.RationalMechanism.inverse_kinematics`, the
+        numeric evaluators of the curve are prepared only once.
 
-                        # error to desired pose
-                        if (np.isclose(target_pose[0], 0.0)
-                                or np.isclose(current_pose[0], 0.0)):
-                            twist_to_desired = target_pose - current_pose
-                        else:
-                            twist_to_desired = (target_pose / target_pose[0]
-                                                - current_pose / current_pose[0])
+        :param list[Union[DualQuaternion, TransfMatrix]] poses: poses of the mechanism,
+            also DualQuaternionArray or (N, 8) array
+        :param str unit: unit of the joint angles, can be 'rad', 'deg', or 't' as
+            t is the parameter of the motion curve. Default is 'rad'.
+        :param str method: numerically for 'gauss-newton' or 'algebraic', see
+            :meth:`.RationalMechanism.inverse_kinematics`
+        :param bool robust: if True, use the Gauss-Newton method with
+            many initial guesses and more iteration steps
 
-                        square_dist_to_desired = np.sum(twist_to_desired ** 2)
+        :return: (N,) array of joint angles or curve parameters; NaN for poses that
+            are not reachable by the 'algebraic' method
+        :rtype: np.ndarray
 
-                        t_val += (step_size * (c_diff_eval @ twist_to_desired)
-                                  / np.sum(c_diff_eval ** 2))
+        :warns: if the 'algebraic' method finds no solution for some poses
+        """
+        if unit not in {'rad', 'deg', 't'}:
+            raise ValueError("unit must be deg, rad, or t")
 
-                        if square_dist_to_desired > previous_error:
-                            step_size *= 0.5
-                        else:
-                            step_size = 1.0
+        if method == 'algebraic':
+            t_solutions = self.ik_solver.solve_algebraic(poses)
+            t = np.array([sol[0] if len(sol) > 0 else np.nan for sol in t_solutions])
+            if np.any(np.isnan(t)):
+                warn(f"No solution found for {np.sum(np.isnan(t))} pose(s).")
+        elif method == 'gauss-newton':
+            t = self.ik_solver.solve(poses, robust=robust)
+        else:
+            raise ValueError("method must be either 'algebraic' or 'gauss-newton")
 
-                        if square_dist_to_desired < tol:
-                            success = True
-                            t_res = t_val
-                            break
+        return self._t_params_to_unit(t, unit)
 
-                    if square_dist_to_desired < t_min[1]:
-                        t_min = [t_val, square_dist_to_desired]
+    def inverse_kinematics_all(self,
+                               poses: list[Union[DualQuaternion, TransfMatrix]],
+                               unit: str = 'rad') -> list[np.ndarray]:
+        """
+        Calculate all solutions of inverse kinematics for many poses at once.
 
-                    if success:
-                        break
-                if success:
-                    break
+        The curve parameters are the real roots of polynomials given by the curve
+        coefficients, see :meth:`.InverseKinematicsSolver.solve_algebraic`. The
+        poses must be reachable by the mechanism.
 
-            if not success:
-                t_res = t_min[0]
+        :param list[Union[DualQuaternion, TransfMatrix]] poses: poses of the mechanism,
+            also DualQuaternionArray or (N, 8) array
+        :param str unit: unit of the joint angles, can be 'rad', 'deg', or 't' as
+            t is the parameter of the motion curve. Default is 'rad'.
 
-            if inversed_part:
-                if np.isclose(t_res, 0.0):
-                    t_res = np.finfo(np.float64).tiny
-                t_res = 1 / t_res
+        :return: list of N arrays of joint angles or curve parameters, sorted from
+            the closest match; an array is empty if the pose is not reachable
+        :rtype: list[np.ndarray]
+        """
+        if unit not in {'rad', 'deg', 't'}:
+            raise ValueError("unit must be deg, rad, or t")
 
-            return t_res, success
+        return [np.atleast_1d(self._t_params_to_unit(t, unit))
+                for t in self.ik_solver.solve_algebraic(poses)]
 
-        t_res, success = run_gauss_newton(pose=goal_pose, robust=robust_search)
+    def _t_params_to_unit(self,
+                          t: Union[float, np.ndarray],
+                          unit: str) -> Union[float, np.ndarray]:
+        """
+        Convert curve parameters to joint angles in given unit
 
-        if not success:
-            print("Fast search did not converge. Retrying with different initial "
-                  "guesses...")
-            t_res, success = run_gauss_newton(pose=goal_pose, robust=True)
-            print("...done.")
-            print("Converged successfully.") if success else (
-                warn("Not converged, providing the closest result."))
+        :param float, np.ndarray t: curve parameters
+        :param str unit: 'rad', 'deg', or 't'
 
-        return t_res
+        :return: joint angles or curve parameters
+        :rtype: float, np.ndarray
+        """
+        if unit == 't':
+            return t
+        joint_angles = self.factorizations[0].t_param_to_joint_angle(t)
+        if unit == 'deg':
+            joint_angles = np.rad2deg(joint_angles)
+        return joint_angles
 
     @staticmethod
     def traj_p2p_joint_space(joint_angle_start: float,
@@ -1443,8 +1639,8 @@ class RationalMechanism(RationalCurve):
                                               point_to_act_on=ee_point,
                                               num_segments=num_points)
 
-        joint_angles = [self.factorizations[0].t_param_to_joint_angle(x)
-                        for x in t_vals]
+        joint_angles = list(self.factorizations[0].t_param_to_joint_angle(
+            np.array(t_vals)))
 
         # flip the joint angles back if needed
         if flip:
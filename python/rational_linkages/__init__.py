@@ -8,8 +8,10 @@ except PackageNotFoundError:
     # package is not installed
     __version__ = "unknown"
 
+from .CollisionCheckPool import CollisionCheckPool
 from .CollisionFreeOptimization import CollisionFreeOptimization
 from .DualQuaternion import DualQuaternion
+from .DualQuaternionArray import DualQuaternionArray
 from .ExudynAnalysis import ExudynAnalysis
 from .Linkage import LineSegment, Linkage, PointsConnection
 from .MotionDesigner import MotionDesigner
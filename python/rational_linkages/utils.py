@@ -160,4 +160,190 @@ def normalized_line_rationally(point, direction):
     dir = Matrix(direction)
     pt = Matrix(point)
     mom = (-1 * dir).cross(pt)
-    return Matrix.vstack(dir, mom)
\ No newline at end of file
+    return Matrix.vstack(dir, mom)
+
+
+def quaternion_array_mul(a, b):
+    """
+    Multiply quaternions given as arrays, vectorized over leading axes.
+
+    :param np.ndarray a: quaternions of shape (..., 4)
+    :param np.ndarray b: quaternions of shape (..., 4)
+
+    :return: quaternion products of shape (..., 4)
+    :rtype: np.ndarray
+    """
+    import numpy as np  # lazy import
+
+    a = np.asarray(a, dtype='float64')
+    b = np.asarray(b, dtype='float64')
+
+    w, x, y, z = a[..., 0], a[..., 1], a[..., 2], a[..., 3]
+    ow, ox, oy, oz = b[..., 0], b[..., 1], b[..., 2], b[..., 3]
+
+    return np.stack((w * ow - x * ox - y * oy - z * oz,
+                     w * ox + x * ow + y * oz - z * oy,
+                     w * oy - x * oz + y * ow + z * ox,
+                     w * oz + x * oy - y * ox + z * ow), axis=-1)
+
+
+def dq_array_mul(a, b):
+    """
+    Multiply dual quaternions given as arrays, vectorized over leading axes.
+
+    Equivalent to :meth:`.DualQuaternion.__mul__` applied element-wise, the inputs
+    broadcast against each other, i.e. a stack of poses can be multiplied by
+    a single dual quaternion.
+
+    :param np.ndarray a: dual quaternions of shape (..., 8)
+    :param np.ndarray b: dual quaternions of shape (..., 8)
+
+    :return: dual quaternion products of shape (..., 8)
+    :rtype: np.ndarray
+    """
+    import numpy as np  # lazy import
+
+    a = np.asarray(a, dtype='float64')
+    b = np.asarray(b, dtype='float64')
+
+    p = quaternion_array_mul(a[..., :4], b[..., :4])
+    d = (quaternion_array_mul(a[..., 4:], b[..., :4])
+         + quaternion_array_mul(a[..., :4], b[..., 4:]))
+
+    return np.concatenate((p, d), axis=-1)
+
+
+def dq_array_act_on_points(dqs, points):
+    """
+    Act by dual quaternions on homogeneous points, vectorized over leading axes.
+
+    Equivalent to :meth:`.DualQuaternion.act` on :class:`.PointHomogeneous` applied
+    element-wise; the inputs broadcast against each other.
+
+    :param np.ndarray dqs: dual quaternions of shape (..., 8)
+    :param np.ndarray points: homogeneous points [w, x, y, z] of shape (..., 4)
+
+    :return: acted homogeneous points of shape (..., 4), not normalized
+    :rtype: np.ndarray
+    """
+    import numpy as np  # lazy import
+
+    dqs = np.asarray(dqs, dtype='float64')
+    points = np.asarray(points, dtype='float64')
+
+    # point embedded as dual quaternion [w, 0, 0, 0, 0, x, y, z]
+    points_dq = np.zeros(points.shape[:-1] + (8,))
+    points_dq[..., 0] = points[..., 0]
+    points_dq[..., 5:] = points[..., 1:]
+
+    eps_conj = dqs * np.array([1, 1, 1, 1, -1, -1, -1, -1])
+    conj = dqs * np.array([1, -1, -1, -1, 1, -1, -1, -1])
+
+    acted = dq_array_mul(dq_array_mul(eps_conj, points_dq), conj)
+
+    return acted[..., [0, 5, 6, 7]]
+
+
+def dq_array_act_on_lines(dqs, lines):
+    """
+    Act by dual quaternions on lines in Plucker coordinates, vectorized.
+
+    Equivalent to :meth:`.DualQuaternion.act` on :class:`.NormalizedLine` applied
+    element-wise; the inputs broadcast against each other.
+
+    :param np.ndarray dqs: dual quaternions of shape (..., 8)
+    :param np.ndarray lines: Plucker coordinates [direction, moment] of shape (..., 6)
+
+    :return: acted lines of shape (..., 6), normalized to unit direction
+    :rtype: np.ndarray
+    """
+    import numpy as np  # lazy import
+
+    dqs = np.asarray(dqs, dtype='float64')
+    lines = np.asarray(lines, dtype='float64')
+
+    # line embedded as dual quaternion [0, d, 0, -m]
+    lines_dq = np.zeros(lines.shape[:-1] + (8,))
+    lines_dq[..., 1:4] = lines[..., :3]
+    lines_dq[..., 5:] = -lines[..., 3:]
+
+    conj = dqs * np.array([1, -1, -1, -1, 1, -1, -1, -1])
+    acted = dq_array_mul(dq_array_mul(dqs, lines_dq), conj)
+
+    # same projection as DualQuaternion.dq2line_vectors
+    f = -np.sum(acted[..., 1:4] ** 2, axis=-1, keepdims=True)
+    g = acted[..., :1] * acted[..., 4:5]
+
+    direction = f * acted[..., 1:4]
+    moment = g * acted[..., 1:4] - f * acted[..., 5:8]
+    dir_norm = np.linalg.norm(direction, axis=-1, keepdims=True)
+
+    return -1 * np.concatenate((direction, moment), axis=-1) / dir_norm
+
+
+def dq_poly_mul(a, b):
+    """
+    Multiply polynomials with dual quaternion coefficients.
+
+    :param np.ndarray a: coefficients of the first polynomial in ascending order,
+        shape (na, 8)
+    :param np.ndarray b: coefficients of the second polynomial in ascending order,
+        shape (nb, 8)
+
+    :return: coefficients of the product in ascending order, shape (na + nb - 1, 8)
+    :rtype: np.ndarray
+    """
+    import numpy as np  # lazy import
+
+    a = np.asarray(a, dtype='float64')
+    b = np.asarray(b, dtype='float64')
+
+    products = dq_array_mul(a[:, np.newaxis, :], b[np.newaxis, :, :])
+
+    result = np.zeros((len(a) + len(b) - 1, 8))
+    for i in range(len(a)):
+        result[i:i + len(b)] += products[i]
+
+    return result
+
+
+def dq_array2matrix(dqs, normalize: bool = True):
+    """
+    Map dual quaternions given as arrays to SE(3) matrices, vectorized.
+
+    Equivalent to :meth:`.DualQuaternion.dq2matrix` applied element-wise, following
+    the European convention (translation in the first column).
+
+    :param np.ndarray dqs: dual quaternions of shape (..., 8)
+    :param bool normalize: if True, the matrices are normalized by their first
+        element
+
+    :return: transformation matrices of shape (..., 4, 4)
+    :rtype: np.ndarray
+    """
+    import numpy as np  # lazy import
+
+    dqs = np.asarray(dqs, dtype='float64')
+    p0, p1, p2, p3, d0, d1, d2, d3 = np.moveaxis(dqs, -1, 0)
+
+    mat = np.zeros(dqs.shape[:-1] + (4, 4))
+
+    mat[..., 0, 0] = p0**2 + p1**2 + p2**2 + p3**2
+    mat[..., 1, 0] = 2 * (-p0 * d1 + p1 * d0 - p2 * d3 + p3 * d2)
+    mat[..., 2, 0] = 2 * (-p0 * d2 + p1 * d3 + p2 * d0 - p3 * d1)
+    mat[..., 3, 0] = 2 * (-p0 * d3 - p1 * d2 + p2 * d1 + p3 * d0)
+
+    mat[..., 1, 1] = p0**2 + p1**2 - p2**2 - p3**2
+    mat[..., 1, 2] = 2 * (p1 * p2 - p0 * p3)
+    mat[..., 1, 3] = 2 * (p1 * p3 + p0 * p2)
+    mat[..., 2, 1] = 2 * (p1 * p2 + p0 * p3)
+    mat[..., 2, 2] = p0**2 - p1**2 + p2**2 - p3**2
+    mat[..., 2, 3] = 2 * (p2 * p3 - p0 * p1)
+    mat[..., 3, 1] = 2 * (p1 * p3 - p0 * p2)
+    mat[..., 3, 2] = 2 * (p2 * p3 + p0 * p1)
+    mat[..., 3, 3] = p0**2 - p1**2 - p2**2 + p3**2
+
+    if normalize:
+        mat = mat / mat[..., :1, :1]
+
+    return mat
@@ -1,8 +1,10 @@
 import unittest
 
+import numpy as np
 import sympy
 
 from rational_linkages import (
+    DualQuaternion,
     PointHomogeneous,
     RationalMechanism,
     RationalCurve)
@@ -28,4 +30,48 @@ class TestAffineMetric(unittest.TestCase):
         metric = AffineMetric(curve, m_points)
         self.assertTrue(isinstance(metric, AffineMetric))
 
-        # TODO: test attributes
\ No newline at end of file
+        # TODO: test attributes
+
+    def test_inner_product(self):
+        points = [PointHomogeneous([1, 0, 0, 0]), PointHomogeneous([1, 1, 2, 3]),
+                  PointHomogeneous([2, -1, 0, 4])]
+        metric = AffineMetric(None, points)
+
+        a = DualQuaternion([1, 2, 3, 4, 0.1, 0.2, 0.3, 0.4])
+        b = DualQuaternion([0, 0, 0, 1, 0, 0, 2, 0])
+
+        expected = 0
+        for pt in points:
+            diff = a.act(pt).normalized_in_3d() - b.act(pt).normalized_in_3d()
+            expected += np.dot(diff, diff)
+
+        self.assertTrue(np.isclose(metric.inner_product(a, b), expected))
+        self.assertTrue(np.isclose(metric.inner_product(a, a), 0.))
+
+    def test_distance_matrix(self):
+        points = [PointHomogeneous([1, 0, 0, 0]), PointHomogeneous([1, 1, 2, 3]),
+                  PointHomogeneous([2, -1, 0, 4])]
+        metric = AffineMetric(None, points)
+
+        poses_a = [DualQuaternion([1, 2, 3, 4, 0.1, 0.2, 0.3, 0.4]),
+                   DualQuaternion([0, 0, 0, 1, 0, 0, 2, 0])]
+        poses_b = [DualQuaternion([1., 0, 0, 0, 0, 0, 0, 0]),
+                   DualQuaternion([0.5, -1, 0, 2, 1, 0, -3, 0.25]),
+                   DualQuaternion([2, 1, 0, 0, 0, 0, 4, -1])]
+
+        dist = metric.distance_matrix(poses_a, poses_b)
+        self.assertEqual(dist.shape, (2, 3))
+        for i, a in enumerate(poses_a):
+            for j, b in enumerate(poses_b):
+                self.assertTrue(np.isclose(dist[i, j], metric.distance(a, b)))
+
+        sq_dist = metric.distance_matrix(np.array([b.array() for b in poses_b]),
+                                         squared=True)
+        self.assertTrue(np.allclose(np.diag(sq_dist), 0.))
+        self.assertTrue(np.allclose(sq_dist, sq_dist.T))
+
+        a12 = metric.as_12d_vectors(poses_a)
+        expected = [metric.squared_distance(poses_a[0], poses_a[1]), 0.]
+        self.assertTrue(np.allclose(metric.squared_distance_12d(a12, a12[1]),
+                                    expected))
+        self.assertRaises(ValueError, metric.as_12d_vectors, np.zeros((2, 5)))
@@ -0,0 +1,50 @@
+from unittest import TestCase
+
+import numpy as np
+
+from rational_linkages.BoundingBallHierarchy import BoundingBallHierarchy
+
+
+class TestBoundingBallHierarchy(TestCase):
+    def test_init(self):
+        rng = np.random.default_rng(0)
+        centers = rng.random((100, 3))
+        radii = rng.random(100) * 0.1
+
+        tree = BoundingBallHierarchy(centers, radii, leaf_size=8)
+
+        self.assertEqual(len(tree), 100)
+        self.assertTrue(np.array_equal(np.sort(tree.indices), np.arange(100)))
+        self.assertTrue(np.array_equal(tree.centers, centers[tree.indices]))
+        self.assertTrue(np.array_equal(tree.radii, radii[tree.indices]))
+
+    def test_candidate_pairs(self):
+        rng = np.random.default_rng(1)
+        centers0 = rng.random((200, 3))
+        radii0 = rng.random(200) * 0.1
+        centers1 = rng.random((150, 3)) + 0.7
+        radii1 = rng.random(150) * 0.1
+
+        tree0 = BoundingBallHierarchy(centers0, radii0, leaf_size=8)
+        tree1 = BoundingBallHierarchy(centers1, radii1, leaf_size=8)
+
+        dist = np.linalg.norm(centers0[:, np.newaxis] - centers1[np.newaxis], axis=2)
+        expected = set(zip(*np.nonzero(dist <= radii0[:, np.newaxis] + radii1)))
+        self.assertTrue(len(expected) > 0)
+
+        found = set()
+        for idx0, idx1 in tree0.candidate_pairs(tree1):
+            dist = np.linalg.norm(tree0.centers[idx0, np.newaxis]
+                                  - tree1.centers[np.newaxis, idx1], axis=2)
+            overlap = dist <= tree0.radii[idx0, np.newaxis] + tree1.radii[idx1]
+            for i, j in zip(*np.nonzero(overlap)):
+                found.add((tree0.indices[idx0][i], tree1.indices[idx1][j]))
+
+        self.assertEqual(found, expected)
+
+        # separated sets have no candidates
+        tree2 = BoundingBallHierarchy(centers1 + 10, radii1)
+        self.assertEqual(list(tree0.candidate_pairs(tree2)), [])
+
+        empty = BoundingBallHierarchy(np.zeros((0, 3)), np.zeros(0))
+        self.assertEqual(list(tree0.candidate_pairs(empty)), [])
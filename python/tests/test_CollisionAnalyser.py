@@ -0,0 +1,176 @@
+from unittest import TestCase
+
+import numpy as np
+
+from rational_linkages.CollisionAnalyser import CollisionAnalyser
+from rational_linkages.models import bennett_ark24
+
+
+class TestCollisionAnalyser(TestCase):
+    def test_check_all_segments(self):
+        m = bennett_ark24()
+        analyser = CollisionAnalyser(m)
+
+        results = analyser.check_all_segments()
+
+        segment_ids = [segment.id for segment in m.segments]
+        expected_pairs = [(segment_ids[ii], segment_ids[jj])
+                          for ii, jj in m.collision_check_pairs()]
+        self.assertEqual(list(results.keys()), expected_pairs)
+
+        for (segment0, segment1), intervals in results.items():
+            # time-aware sweep is never less strict than the check of all balls
+            if intervals:
+                self.assertTrue(analyser.check_two_segments(segment0, segment1))
+
+            for branch in (False, True):
+                bounds = [interval for inverted_part, interval in intervals
+                          if inverted_part == branch]
+                for start, end in bounds:
+                    self.assertLess(start, end)
+                for (_, end0), (start1, _) in zip(bounds[:-1], bounds[1:]):
+                    self.assertLess(end0, start1)
+
+        only_links = analyser.check_all_segments(only_links=True)
+        self.assertTrue(all(segment0.startswith('l') and segment1.startswith('l')
+                            for segment0, segment1 in only_links))
+
+        pair = analyser.check_all_segments(pairs=[('l_00', 'l_11')])
+        self.assertEqual(pair[('l_00', 'l_11')], results[('l_00', 'l_11')])
+
+    def test_check_all_segments_adaptive(self):
+        m = bennett_ark24()
+        analyser = CollisionAnalyser(m, min_splits=2)
+
+        coarse = analyser.check_all_segments()
+        refined = analyser.check_all_segments(tolerance=0.05)
+
+        self.assertEqual(list(refined.keys()), list(coarse.keys()))
+        self.assertTrue(any(refined.values()))
+
+        # the refined intervals lie in the coarse ones
+        for pair, intervals in refined.items():
+            for inverted_part, (start, end) in intervals:
+                self.assertLess(start, end)
+                self.assertTrue(any(inverted_part == coarse_part
+                                    and coarse_start <= start and end <= coarse_end
+                                    for coarse_part, (coarse_start, coarse_end)
+                                    in coarse[pair]))
+
+        self.assertLess(sum(end - start for intervals in refined.values()
+                            for _, (start, end) in intervals),
+                        sum(end - start for intervals in coarse.values()
+                            for _, (start, end) in intervals))
+
+        self.assertRaises(ValueError, analyser.colliding_intervals,
+                          'l_00', 'l_11', tolerance=0.0)
+
+    def test_get_segment_orbit_arrays(self):
+        m = bennett_ark24()
+        analyser = CollisionAnalyser(m, min_splits=4)
+
+        for segment_id in analyser.segments:
+            centers, radii, orbit_indices, t_intervals = (
+                analyser.get_segment_orbit_arrays(segment_id))
+            orbits = analyser.get_segment_orbit(segment_id)
+
+            self.assertEqual(len(orbits), len(t_intervals))
+            self.assertTrue(np.array_equal(np.bincount(orbit_indices),
+                                           [len(orbit) - 1 for orbit in orbits]))
+
+            packed = analyser.pack_balls([ball for orbit in orbits
+                                          for ball in orbit[1:]])
+            self.assertTrue(np.allclose(packed[0], centers))
+            self.assertTrue(np.allclose(packed[1], radii))
+
+        # gap between the orbits is filled by interpolated balls
+        centers, radii, orbit_indices = analyser.connect_orbit_arrays(
+            np.array([[0., 0., 0.], [0., 0., 0.]]), np.array([0.1, 0.5]),
+            np.array([[1., 0., 0.], [0.5, 0., 0.]]), np.array([0.1, 0.5]))
+        self.assertTrue(np.array_equal(orbit_indices, [0] * 12 + [1, 1]))
+        self.assertTrue(np.allclose(centers[[0, 11, 12, 13]],
+                                    [[0, 0, 0], [1, 0, 0], [0, 0, 0], [0.5, 0, 0]]))
+        self.assertTrue(np.allclose(radii[:12], 0.1))
+        self.assertTrue(np.all(np.diff(centers[:12, 0]) > 0))
+
+    def test_optimize_control_points(self):
+        from rational_linkages.PointHomogeneous import PointHomogeneous, PointOrbit
+
+        t_interval = (False, [0.0, 1.0])
+        orbits = [[[t_interval,
+                    PointOrbit(PointHomogeneous.from_3d_point([0, 0, 0]), 1.0,
+                               t_interval),
+                    PointOrbit(PointHomogeneous.from_3d_point([3, 0, 0]), 0.25,
+                               t_interval)]]]
+        init_points = [PointHomogeneous.from_3d_point([0.5, 0.2, 0.0]),
+                       PointHomogeneous.from_3d_point([5.0, 0.0, 0.0])]
+
+        new_points = CollisionAnalyser.optimize_control_points(init_points, orbits)
+        new_points_kdtree = CollisionAnalyser.optimize_control_points(
+            init_points, orbits, use_kdtree=True)
+
+        new_cps = np.array([point.normalized_in_3d() for point in new_points])
+        new_cps_kdtree = np.array([point.normalized_in_3d()
+                                   for point in new_points_kdtree])
+        self.assertTrue(np.allclose(new_cps, new_cps_kdtree))
+
+        # the first point is pushed out of the ball, the second one is free
+        self.assertGreater(np.linalg.norm(new_cps[0]),
+                           np.linalg.norm(init_points[0].normalized_in_3d()))
+        self.assertTrue(np.allclose(new_cps[0, 2], 0.0))
+        self.assertTrue(np.allclose(new_cps[1], [5.0, 0.0, 0.0]))
+
+    def test_check_all_segments_adaptive_no_collision(self):
+        m = bennett_ark24()
+        analyser = CollisionAnalyser(m)
+
+        coarse = analyser.check_all_segments()
+        refined = analyser.check_all_segments(tolerance=0.02)
+
+        # pairs with overlapping hierarchies but no valid pair of balls
+        for pair, intervals in coarse.items():
+            if not intervals:
+                self.assertEqual(refined[pair], [])
+
+    def test_check_miniballs_arrays(self):
+        from rational_linkages.PointHomogeneous import PointHomogeneous, PointOrbit
+
+        centers0 = np.array([[0.0, 0.0, 0.0]])
+        centers1 = np.array([[1.8, 0.0, 0.0], [2.0, 0.0, 0.0], [2.2, 0.0, 0.0]])
+
+        collide = CollisionAnalyser.check_miniballs_arrays(centers0, np.ones(1),
+                                                           centers1, np.ones(3))
+        self.assertTrue(np.array_equal(collide, [[True, True, False]]))
+
+        t_interval = (False, [0.0, 1.0])
+        ball0 = PointOrbit(PointHomogeneous.from_3d_point(centers0[0]), 1.0, t_interval)
+        ball1 = PointOrbit(PointHomogeneous.from_3d_point(centers1[0]), 1.0, t_interval)
+        self.assertTrue(CollisionAnalyser.check_two_miniballs(ball0, ball1))
+
+    def test_refine_orbit_pair(self):
+        from rational_linkages.RationalBezier import BezierSegment
+
+        class OrbitsOfIntervals(CollisionAnalyser):
+            """Moving segment 'a' whose orbit depends only on the split interval"""
+            def __init__(self):
+                self.split = BezierSegment(np.ones((2, 13)), t_param=(False, [0, 1]))
+                self.segment_orbit_arrays = {
+                    'a': (np.array([[3.0, 0.0, 0.0]]), np.array([3.0]),
+                          np.zeros(1, dtype=int), [(False, [0, 1])]),
+                    'b': (np.zeros((1, 3)), np.ones(1),
+                          np.zeros(1, dtype=int), [(None, [-1, 1])])}
+
+            def get_segment_points_and_splits(self, segment_id):
+                return None, None, [self.split] if segment_id == 'a' else None
+
+            def get_splits_orbit_arrays(self, p0, p1, splits):
+                start = splits[0].t_param_of_motion_curve[1][0]
+                # only the first half touches the static ball, at distance 1.8
+                center = [[1.8 if start < 0.5 else 5.0, 0.0, 0.0]]
+                return np.array(center), np.ones(1), np.zeros(1, dtype=int)
+
+        analyser = OrbitsOfIntervals()
+        branches, bounds = analyser.refine_orbit_pair('a', 0, 'b', 0, tolerance=0.5)
+
+        self.assertEqual(analyser.merge_intervals(branches, bounds),
+                         [(False, [0.0, 0.5])])
@@ -0,0 +1,64 @@
+from unittest import TestCase
+
+import numpy as np
+
+from rational_linkages import (CollisionCheckPool, DualQuaternion, MotionFactorization,
+                               PointHomogeneous, RationalMechanism)
+
+
+class TestCollisionCheckPool(TestCase):
+    def test_check_pairs(self):
+        f1 = MotionFactorization([DualQuaternion([0, 0, 0, 1, 0, 0, 0, 0]),
+                                  DualQuaternion([0, 0, 0, 2, 0, 0, -1, 0])])
+        f2 = MotionFactorization([DualQuaternion([0, 0, 0, 2, 0, 0, -1 / 3, 0]),
+                                  DualQuaternion([0, 0, 0, 1, 0, 0, -2 / 3, 0])])
+        f1.set_joint_connection_points([PointHomogeneous([1, 0, 0, 0.1]),
+                                        PointHomogeneous([1, 0, 0, 0.5]),
+                                        PointHomogeneous([1, -0.5, 0, 0.2]),
+                                        PointHomogeneous([1, -0.5, 0, 0.3])])
+        f2.set_joint_connection_points([PointHomogeneous([1, -0.16666667, 0, 0]),
+                                        PointHomogeneous([1, -0.16666667, 0, -0.1]),
+                                        PointHomogeneous([1, -0.66666667, 0, 0.1]),
+                                        PointHomogeneous([1, -0.66666667, 0, 0])])
+        m = RationalMechanism([f1, f2], tool='mid_of_last_link')
+
+        iters = [(i, j) for i in range(len(m.segments))
+                 for j in range(i + 2, len(m.segments))]
+        expected = [m._check_given_pair(pair) for pair in iters]
+
+        with CollisionCheckPool(max_workers=2) as pool:
+            # the pool is reused for repeated checks
+            for _ in range(2):
+                res = pool.check_pairs(m.segments, iters)
+                self.assertEqual(len(res), len(iters))
+                for r, e in zip(res, expected):
+                    if e is None:
+                        self.assertIsNone(r)
+                    else:
+                        self.assertTrue(np.allclose(r, e))
+
+            # the segments were sent to the workers only once
+            self.assertEqual(pool._version, 1)
+
+            res = m.collision_check(parallel=True, pool=pool)
+            self.assertEqual(pool._version, 2)
+            res[1] = 1 / res[1]
+            self.assertTrue(np.allclose(res, [0, 0]))
+
+    def test_check_pairs_chunk(self):
+        from rational_linkages.CollisionCheckPool import _check_pairs_chunk
+
+        m = RationalMechanism([MotionFactorization([
+            DualQuaternion([0, 0, 0, 1, 0, 0, 0, 0]),
+            DualQuaternion([0, 0, 0, 2, 0, 0, -1, 0])]), MotionFactorization([
+            DualQuaternion([0, 0, 0, 2, 0, 0, -1 / 3, 0]),
+            DualQuaternion([0, 0, 0, 1, 0, 0, -2 / 3, 0])])])
+        segments = [segment.numeric for segment in m.segments]
+
+        # the worker asks for the segments of an unknown version
+        self.assertIsNone(_check_pairs_chunk(-1, [(0, 2)]))
+
+        res = _check_pairs_chunk(-1, [(0, 2)], segments)
+        self.assertEqual(len(res), 1)
+        self.assertEqual(_check_pairs_chunk(-1, [(0, 2)]), res)
+        self.assertIsNone(_check_pairs_chunk(-2, [(0, 2)]))
@@ -2,10 +2,21 @@ import unittest
 from unittest.mock import MagicMock
 from itertools import product
 from rational_linkages.models import bennett_ark24
-from rational_linkages import CollisionFreeOptimization
+from rational_linkages import (CollisionFreeOptimization, DualQuaternion,
+                               MotionFactorization, RationalMechanism)
 from rational_linkages.CollisionFreeOptimization import CombinatorialSearch
 
 
+def _six_r_mechanism() -> RationalMechanism:
+    """
+    Mechanism of the combinatorial search tests, 6R linkage from a cubic motion.
+    """
+    h1 = DualQuaternion.as_rational([0, 1, 0, 0, 0, 0, 0, 0])
+    h2 = DualQuaternion.as_rational([0, 0, 3, 0, 0, 0, 0, 1])
+    h3 = DualQuaternion.as_rational([0, 1, 1, 0, 0, 0, 0, -2])
+    return RationalMechanism(MotionFactorization([h1, h2, h3]).factorize())
+
+
 class CollisionFreeOptimizationTests(unittest.TestCase):
     def test_init(self):
         cfo = CollisionFreeOptimization(bennett_ark24())
@@ -31,3 +42,71 @@ class CombinatorialSearchTests(unittest.TestCase):
         expected_result = list(product([0, 1, -1], repeat=mechanism.num_joints))
         expected_result.remove((0,) * mechanism.num_joints)
         self.assertEqual(result, expected_result)
+
+    def test_search_links(self):
+        m = _six_r_mechanism()
+
+        cs = CombinatorialSearch(m, linkage_length=4.118252368663382, step_length=25)
+        # the first sequence is colliding, the other two are collision-free
+        combs = [(0, 0, 0, 0, 0, 1), (0, 0, 0, 1, 1, 0), (0, 0, 0, 1, 1, -1)]
+
+        res = cs.search_links(4, combinations=combs)
+        res_parallel = cs.search_links(4, combinations=combs, parallel=True,
+                                       max_workers=2, chunk_size=1)
+
+        shift = 4 * 4.118252368663382 / 25
+        expected = [[0.], [0.], [0.], [shift], [shift], [0.]]
+        self.assertEqual(res, expected)
+        self.assertEqual(res_parallel, expected)
+
+        res_broad = cs.search_links(4, combinations=combs, broad_phase=True)
+        res_broad_parallel = cs.search_links(4, combinations=combs, parallel=True,
+                                             max_workers=2, chunk_size=1,
+                                             broad_phase=True)
+        self.assertEqual(res_broad, expected)
+        self.assertEqual(res_broad_parallel, expected)
+
+    def test_search_mechanism(self):
+        m = _six_r_mechanism()
+
+        cs = CombinatorialSearch(m, linkage_length=4.118252368663382, step_length=25,
+                                 min_joint_segment_length=0.3)
+        links_params = cs.search_links(4, combinations=[(0, 0, 0, 1, 1, 0)])
+
+        combs = [(-1, 1, -1, 1, -1, 1, 1, -1, 1, -1, 1, -1),
+                 (-1, 1, 1, -1, -1, 1, 1, -1, -1, 1, 1, -1)]
+
+        progress = []
+        res = cs.search_mechanism(links_params, combinations=combs,
+                                  progress_callback=lambda i, n: progress.append((i, n)))
+        self.assertIsNotNone(res)
+        self.assertEqual(progress[-1][1], 2)
+
+        progress_parallel = []
+        res_parallel = cs.search_mechanism(
+            links_params, combinations=combs, parallel=True, max_workers=2,
+            chunk_size=1,
+            progress_callback=lambda i, n: progress_parallel.append((i, n)))
+        self.assertEqual(res_parallel, res)
+        self.assertEqual(progress_parallel[-1][1], 2)
+
+    def test_search_chunk_quiet(self):
+        import io
+        import multiprocessing
+        from contextlib import redirect_stdout
+
+        from rational_linkages.CollisionFreeOptimization import (_init_search_worker,
+                                                                 _search_chunk)
+
+        shift = 4 * 4.118252368663382 / 25
+        candidates = [[[0.], [0.], [0.], [0.], [0.], [shift]],
+                      [[0.], [0.], [0.], [shift], [shift], [0.]]]
+
+        _init_search_worker(_six_r_mechanism(), multiprocessing.Value('q', 2))
+
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            res = _search_chunk(0, candidates, True)
+
+        self.assertEqual(res, (1, 2))
+        self.assertEqual(stdout.getvalue(), "")
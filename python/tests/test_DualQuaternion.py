@@ -26,6 +26,39 @@ class TestDualQuaternion(unittest.TestCase):
             ValueError, DualQuaternion.__init__, self, np.array([1, 2, 3, 4, 5, 6])
         )
 
+    def test_from_numeric_array(self):
+        data = np.array([1., 2., 3., 4., 0.1, 0.2, 0.3, 0.4])
+        dq = DualQuaternion.from_numeric_array(data)
+        self.assertIs(dq.dq, data)
+        self.assertFalse(dq.is_rational)
+        self.assertEqual(dq, DualQuaternion(data))
+        self.assertEqual(dq.p, Quaternion([1, 2, 3, 4]))
+
+        # numeric results match the exact path of integer dual quaternions
+        dq_int = DualQuaternion([1, 2, 3, 4, 5, 6, 7, 8])
+        dq_float = DualQuaternion([1., 2., 3., 4., 5., 6., 7., 8.])
+        other = DualQuaternion([0.5, -1., 0., 2., 1., 0., -3., 0.25])
+        self.assertEqual(dq_int.array().dtype, np.int64)
+        self.assertTrue(np.allclose((dq_int * other).array(),
+                                    (dq_float * other).array()))
+        self.assertTrue(np.allclose(dq_float.inv().array(), dq_int.inv().array()))
+
+    def test_setstate(self):
+        import pickle
+
+        dq = DualQuaternion([1., 2., 3., 4., 0.1, 0.2, 0.3, 0.4])
+        restored = pickle.loads(pickle.dumps(dq))
+        self.assertEqual(restored, dq)
+
+        # state of older versions stores primal and dual quaternions
+        old = DualQuaternion.__new__(DualQuaternion)
+        old.__setstate__({'p': Quaternion([1., 2., 3., 4.]),
+                          'd': Quaternion([0.1, 0.2, 0.3, 0.4]),
+                          'dq': dq.array(),
+                          'is_rational': False})
+        self.assertEqual(old, dq)
+        self.assertEqual(old.d, Quaternion([0.1, 0.2, 0.3, 0.4]))
+
     def test_as_rational(self):
         dq = DualQuaternion.as_rational()
         self.assertTrue(dq.is_rational)
@@ -308,6 +341,41 @@ class TestDualQuaternion(unittest.TestCase):
             np.allclose(line_after_action.screw, line_from_acted_points.screw)
         )
 
+    def test_act_on_array(self):
+        from rational_linkages import DualQuaternionArray
+
+        dq = DualQuaternion([0, 0, 0, 1, 0, 0, 2, 0])
+
+        points = np.array([[1, 7, 0, 0], [1, 7, 0, 2], [2, 1, 2, 3]])
+        acted = dq.act(points)
+        self.assertEqual(acted.shape, (3, 4))
+        for pt, res in zip(points, acted):
+            expected = dq.act(PointHomogeneous(pt))
+            self.assertTrue(np.allclose(res / res[0], expected.normalize()))
+
+        lines = np.array([NormalizedLine([0, 0, 1, 0, -7, 0]).screw,
+                          NormalizedLine([1, 0, 0, 0, 2, -1]).screw])
+        acted = dq.act(lines)
+        self.assertEqual(acted.shape, (2, 6))
+        for line, res in zip(lines, acted):
+            self.assertTrue(np.allclose(res, dq.act(NormalizedLine(line)).screw))
+
+        # N poses acting on M points
+        dqs = DualQuaternionArray.from_dual_quaternions(
+            [dq, DualQuaternion([1, 2, 3, 4, 0.1, 0.2, 0.3, 0.4])])
+        acted = dq.act(np.zeros((0, 4)))
+        self.assertEqual(acted.shape, (0, 4))
+
+        from rational_linkages.DualQuaternionAction import DualQuaternionAction
+        action = DualQuaternionAction()
+        acted = action.act_on_array(dqs, points)
+        self.assertEqual(acted.shape, (2, 3, 4))
+        self.assertTrue(np.allclose(acted[1], dqs[1].act(points)))
+        self.assertTrue(np.allclose(action.act_on_array(dqs.array(), lines)[0],
+                                    dq.act(lines)))
+
+        self.assertRaises(ValueError, dq.act, np.zeros((2, 5)))
+
     def test__analyze_affected_object(self):
         dq = DualQuaternion()
         wrongly_initiated_line = [1, 2, 3, 4, 5, 6]
@@ -0,0 +1,98 @@
+from unittest import TestCase
+
+import numpy as np
+
+from rational_linkages import (DualQuaternion, DualQuaternionArray, NormalizedLine,
+                               PointHomogeneous)
+
+
+class TestDualQuaternionArray(TestCase):
+    def setUp(self):
+        self.dqs = [DualQuaternion([1, 2, 3, 4, 0.1, 0.2, 0.3, 0.4]),
+                    DualQuaternion([0.5, 0, -1, 2, 1, -3, 0.5, 2]),
+                    DualQuaternion([2, 1, 0, 0, 0, 0, 4, -1])]
+        self.dq_array = DualQuaternionArray.from_dual_quaternions(self.dqs)
+
+    def test_init(self):
+        data = np.arange(16, dtype='float64').reshape(2, 8)
+        dq_array = DualQuaternionArray(data)
+        self.assertEqual(len(dq_array), 2)
+        self.assertIs(dq_array.array(), data)
+
+        self.assertEqual(DualQuaternionArray(np.ones(8)).array().shape, (1, 8))
+        self.assertEqual(len(DualQuaternionArray()), 0)
+        self.assertTrue(np.allclose(DualQuaternionArray.identity(2).array(),
+                                    [[1, 0, 0, 0, 0, 0, 0, 0]] * 2))
+
+        self.assertRaises(ValueError, DualQuaternionArray, np.ones((2, 6)))
+
+    def test_getitem(self):
+        self.assertIsInstance(self.dq_array[1], DualQuaternion)
+        self.assertEqual(self.dq_array[1], self.dqs[1])
+        self.assertTrue(np.shares_memory(self.dq_array[1].dq,
+                                         self.dq_array.array()))
+        self.assertTrue(all(np.shares_memory(dq.dq, self.dq_array.array())
+                            for dq in self.dq_array))
+
+        sub = self.dq_array[1:]
+        self.assertIsInstance(sub, DualQuaternionArray)
+        self.assertTrue(np.shares_memory(sub.array(), self.dq_array.array()))
+        self.assertEqual(self.dq_array.to_list(), self.dqs)
+
+    def test_mul(self):
+        other = DualQuaternionArray(self.dq_array.array()[::-1].copy())
+        res = self.dq_array * other
+        for i, dq in enumerate(self.dqs):
+            self.assertTrue(np.allclose(res.array()[i],
+                                        (dq * self.dqs[2 - i]).array()))
+
+        res = self.dq_array * self.dqs[0]
+        for i, dq in enumerate(self.dqs):
+            self.assertTrue(np.allclose(res.array()[i], (dq * self.dqs[0]).array()))
+
+        self.assertTrue(np.allclose((2 * self.dq_array).array(),
+                                    2 * self.dq_array.array()))
+
+    def test_conjugates_inv_normalize(self):
+        conj = self.dq_array.conjugate()
+        eps_conj = self.dq_array.eps_conjugate()
+        inv = self.dq_array.inv()
+        norm = self.dq_array.norm()
+        normalized = self.dq_array.normalize()
+        for i, dq in enumerate(self.dqs):
+            self.assertTrue(np.allclose(conj.array()[i], dq.conjugate().array()))
+            self.assertTrue(np.allclose(eps_conj.array()[i],
+                                        dq.eps_conjugate().array()))
+            self.assertTrue(np.allclose(inv.array()[i], dq.inv().array()))
+            self.assertTrue(np.allclose(norm.array()[i], dq.norm().array()))
+            self.assertTrue(np.allclose(normalized.array()[i],
+                                        dq.normalize().array()))
+
+        self.assertRaises(ValueError, DualQuaternionArray(np.zeros(8)).normalize)
+
+    def test_dq2matrix(self):
+        mats = self.dq_array.dq2matrix()
+        vecs = self.dq_array.as_12d_vectors()
+        for i, dq in enumerate(self.dqs):
+            self.assertTrue(np.allclose(mats[i], dq.dq2matrix()))
+            self.assertTrue(np.allclose(vecs[i], dq.as_12d_vector()))
+
+    def test_act(self):
+        points = np.array([[1, 1, 2, 3], [2, -1, 0, 4], [1, 0, 0, 0]])
+        acted = self.dq_array.act_on_points(points)
+        for i, dq in enumerate(self.dqs):
+            expected = dq.act(PointHomogeneous(points[i]))
+            self.assertTrue(np.allclose(acted[i] / acted[i, 0],
+                                        expected.normalize()))
+
+        lines = np.array([NormalizedLine.from_direction_and_point(
+            [0, 0, 1], [0, -2, 0]).screw, NormalizedLine([1, 0, 0, 0, -2, 1]).screw,
+            NormalizedLine.from_direction_and_point([1, 1, 0], [3, 1, 2]).screw])
+        acted = self.dq_array.act_on_lines(lines)
+        for i, dq in enumerate(self.dqs):
+            expected = dq.act(NormalizedLine(lines[i]))
+            self.assertTrue(np.allclose(acted[i], expected.screw))
+
+        # every pose acting on every point
+        acted = self.dq_array.act_on_points(points[:, np.newaxis, :])
+        self.assertEqual(acted.shape, (3, 3, 4))
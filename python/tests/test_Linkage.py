@@ -1,6 +1,10 @@
 from unittest import TestCase
 
-from rational_linkages import LineSegment, Linkage, PointsConnection
+import numpy as np
+import sympy as sp
+
+from rational_linkages import (LineSegment, Linkage, NormalizedLine,
+                               PointHomogeneous, PointsConnection)
 
 
 class Test(TestCase):
@@ -12,3 +16,67 @@ class Test(TestCase):
 
     def test_line_segment(self):
         pass
+
+    def test_get_plucker_coeffs(self):
+        t = sp.Symbol("t")
+        line = NormalizedLine([1, 0, 0, 0, 1, 0.5 - t])
+        coeffs = LineSegment.get_plucker_coeffs(line)
+        expected = np.array([[1, 0], [0, 0], [0, 0], [0, 0], [1, 0], [0.5, -1]])
+        self.assertTrue(np.allclose(coeffs, expected))
+
+        line = NormalizedLine([0, 0, 2, 0, 0, 0])
+        coeffs = LineSegment.get_plucker_coeffs(line)
+        self.assertEqual(coeffs.shape, (6, 1))
+        self.assertTrue(np.allclose(coeffs[:, 0], [0, 0, 1, 0, 0, 0]))
+
+    def test_is_point_in_segment_batch(self):
+        t = sp.Symbol("t")
+        line = NormalizedLine([1, 0, 0, 0, 1, 0.5 - t])
+        p0 = PointHomogeneous([1, -1, t - 0.5, 1])
+        p1 = PointHomogeneous([2, 2, 2 * t - 1, 2])
+        segment = LineSegment(line, p0, p1, linkage_type="l", f_idx=0, idx=0)
+
+        t_vals = np.array([0., 0.5, 2.])
+        self.assertTrue(np.allclose(segment.evaluate_line(t_vals)[:, 5],
+                                    [0.5, 0., -1.5]))
+
+        pts0, pts1 = segment.evaluate_points(t_vals)
+        self.assertTrue(np.allclose(pts0, [[-1, -0.5, 1], [-1, 0, 1], [-1, 1.5, 1]]))
+        self.assertTrue(np.allclose(pts1, [[1, -0.5, 1], [1, 0, 1], [1, 1.5, 1]]))
+
+        points = np.array([[0, -0.5, 1], [2, 0, 1], [0.5, 0, 1]])
+        mask = segment.is_point_in_segment_batch(points, t_vals)
+        self.assertTrue(np.array_equal(mask, [True, False, False]))
+
+        self.assertTrue(np.array_equal(
+            segment.numeric.is_point_in_segment_batch(points, t_vals), mask))
+
+        for pt, t_val, res in zip(points, t_vals, mask):
+            self.assertEqual(
+                segment.is_point_in_segment(PointHomogeneous.from_3d_point(pt),
+                                            t_val), res)
+
+    def test_lazy_equations(self):
+        t = sp.Symbol("t")
+        line = NormalizedLine([1, 0, 0, 0, 1, 0.5 - t])
+        p0 = PointHomogeneous([1, -1, t - 0.5, 1])
+        p1 = PointHomogeneous([2, 2, 2 * t - 1, 2])
+        segment = LineSegment(line, p0, p1, linkage_type="l", f_idx=0, idx=0)
+
+        numeric_segment = LineSegment(None, None, None, linkage_type="l", f_idx=0,
+                                      idx=1, default_line=line,
+                                      plucker_coeffs=segment.plucker_coeffs,
+                                      points_coeffs=segment.points_coeffs)
+        self.assertIsNone(numeric_segment._equation)
+        self.assertIsNone(numeric_segment._point0)
+
+        self.assertTrue(np.allclose(
+            LineSegment.get_plucker_coeffs(numeric_segment.equation),
+            segment.plucker_coeffs))
+        for t_val in [-1., 0., 0.5, 2.]:
+            self.assertTrue(np.allclose(
+                numeric_segment.point0.evaluate(t_val).array(),
+                p0.evaluate(t_val).array()))
+            self.assertTrue(np.allclose(
+                numeric_segment.point1.evaluate(t_val).array(),
+                p1.evaluate(t_val).array()))
@@ -120,6 +120,37 @@ class TestMotionFactorization(TestCase):
         self.assertTrue(np.allclose(f1.act(point, 0.55).normalized_in_3d(),
                                     f2.act(point, 0.55).normalized_in_3d()))
 
+    def test_act_coeffs(self):
+        h1 = DualQuaternion([0, 1, 0, 0, 0, 0, 0, 0])
+        h2 = DualQuaternion([0, 0, 3, 0, 0, 0, 0, 1])
+        h3 = DualQuaternion([0, 1, 1, 0, 0, 0, 0, -2])
+        f1 = MotionFactorization([h1, h2, h3])
+
+        point = PointHomogeneous([2, -3, 7, 5])
+        line = NormalizedLine.from_two_points(PointHomogeneous([1, 0, 0, 1]), point)
+
+        for end_idx in [0, 1, None]:
+            pt_coeffs = f1.act_coeffs(point, end_idx=end_idx)
+            line_coeffs = f1.act_coeffs(line, end_idx=end_idx)
+
+            for t in [-2.5, 0.55, 10.]:
+                pt_t = np.polynomial.polynomial.polyval(t, pt_coeffs.T)
+                line_t = np.polynomial.polynomial.polyval(t, line_coeffs.T)
+
+                expected_pt = f1.act(point, t, end_idx=end_idx)
+                expected_line = f1.act(line, t, end_idx=end_idx)
+
+                self.assertTrue(np.allclose(pt_t / pt_t[0],
+                                            expected_pt.normalize()))
+                self.assertTrue(np.allclose(NormalizedLine(line_t).screw,
+                                            expected_line.screw))
+
+        # cached actions
+        self.assertIs(f1.get_action_coeffs(1), f1.get_action_coeffs(1))
+
+        with self.assertRaises(TypeError):
+            f1.act_coeffs(h1)
+
     def test_direct_kinematics(self):
         h1 = DualQuaternion([0, 0, 0, 1, 0, 0, 0, 0])
         h2 = DualQuaternion([0, 0, 0, 2, 0, 0, -1, 0])
@@ -131,6 +162,47 @@ class TestMotionFactorization(TestCase):
                                     np.array([[0., 0., 0.], [0., 0., 0.0001],
                                               [0.5, 0., 0.], [0.5, 0.,  0.0001]])))
 
+    def test_direct_kinematics_batch(self):
+        h1 = DualQuaternion([0, 1, 0, 0, 0, 0, 0, 0])
+        h2 = DualQuaternion([0, 0, 3, 0, 0, 0, 0, 1])
+        h3 = DualQuaternion([0, 1, 1, 0, 0, 0, 0, -2])
+        f = MotionFactorization([h1, h2, h3])
+        f.set_joint_connection_points_by_parameters([[0.1, 0.5], [-0.2], [0.3, 1.]])
+
+        t_vals = np.array([-2., 0., 0.4, 10.])
+        points = f.direct_kinematics_batch(t_vals)
+        self.assertEqual(points.shape, (4, 6, 3))
+
+        for i, t in enumerate(t_vals):
+            # compare with the action of symbolic factors
+            expected = [f.linkage[0].points[0].normalized_in_3d(),
+                        f.linkage[0].points[1].normalized_in_3d()]
+            for j in range(1, 3):
+                for k in range(2):
+                    pt = f.act(f.linkage[j].points[k], sp.Symbol("t"), end_idx=j - 1)
+                    expected.append(pt.evaluate(t).normalized_in_3d())
+            self.assertTrue(np.allclose(points[i], expected))
+            self.assertTrue(np.allclose(f.direct_kinematics(t), expected))
+
+        points_inv = f.direct_kinematics_batch(t_vals, inverted_part=True)
+        self.assertTrue(np.allclose(points_inv[2], f.direct_kinematics(1 / 0.4)))
+        self.assertTrue(np.allclose(points_inv[1],
+                                    f.direct_kinematics(0, inverted_part=True)))
+
+        # prefix products are cached for scalar parameters
+        self.assertIs(f.get_prefix_products(0.4), f.get_prefix_products(0.4))
+        self.assertTrue(np.allclose(f.get_prefix_products(t_vals)[2],
+                                    f.get_prefix_products(0.4)))
+
+        # the recently used parameter is kept when the cache is full
+        products = f.get_prefix_products(0.4)
+        for t in np.linspace(1.0, 2.0, 63):
+            f.get_prefix_products(t)
+        f.get_prefix_products(0.4)
+        f.get_prefix_products(5.0)
+        self.assertIs(f.get_prefix_products(0.4), products)
+        self.assertNotIn(1.0, f._prefix_products)
+
     def test_direct_kinematics_of_tool(self):
         h1 = DualQuaternion([0, 0, 0, 1, 0, 0, 0, 0])
         h2 = DualQuaternion([0, 0, 0, 2, 0, 0, -1, 0])
@@ -154,6 +226,12 @@ class TestMotionFactorization(TestCase):
         t = f.joint_angle_to_t_param(2 * np.pi)
         self.assertTrue(np.allclose(np.array([1 / t]), np.array([0])))
 
+        angles = np.array([0.0, 1.0, -2.0, 4.0])
+        t_vals = f.joint_angle_to_t_param(angles)
+        self.assertEqual(t_vals.shape, (4,))
+        self.assertTrue(np.allclose(
+            t_vals, [f.joint_angle_to_t_param(angle) for angle in angles]))
+
     def test_t_param_to_joint_angle(self):
         h1 = DualQuaternion([0, 0, 0, 1, 0, 0, 0, 0])
         h2 = DualQuaternion([0, 0, 0, 2, 0, 0, -1, 0])
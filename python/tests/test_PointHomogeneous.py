@@ -173,3 +173,27 @@ class TestPointHomogeneous(TestCase):
         obj = PointHomogeneous(np.array([4, 1, 2, 3]))
         expected_plot_data = np.array([0.25, 0.5, 0.75])
         self.assertTrue(np.allclose(obj.get_plot_data(), expected_plot_data))
+
+    def test_get_points_orbits(self):
+        from rational_linkages.models import bennett_ark24
+
+        metric = bennett_ark24().metric
+
+        rng = np.random.default_rng(0)
+        points = np.column_stack((rng.random(3) + 1, rng.random((3, 3))))
+        acting_centers = np.column_stack((rng.random(4) + 1, rng.random((4, 12))))
+        acting_radii = rng.random(4)
+
+        centers, radii = PointHomogeneous.get_points_orbits(points,
+                                                            acting_centers,
+                                                            acting_radii,
+                                                            metric)
+        self.assertEqual(centers.shape, (4, 3, 4))
+        self.assertEqual(radii.shape, (4, 3))
+
+        for i, acting_center in enumerate(acting_centers):
+            for j, point in enumerate(points):
+                center, radius = PointHomogeneous(point).get_point_orbit(
+                    PointHomogeneous(acting_center), acting_radii[i], metric)
+                self.assertTrue(np.allclose(centers[i, j], center))
+                self.assertTrue(np.isclose(radii[i, j], radius))
@@ -95,6 +95,37 @@ class TestRationalBezier(TestCase):
                 )
             )
 
+    def test_de_casteljau(self):
+        control_points = np.array([[[4.0, 0.0, -2.0, 4.0],
+                                    [0.0, 1.0, -2.0, 0.0],
+                                    [4.0, 0.0, 2.0, 4.0]],
+                                   [[1.0, 0.0, 0.0, 0.0],
+                                    [1.0, 1.0, 0.0, 0.0],
+                                    [1.0, 2.0, 0.0, 0.0]]])
+
+        left, right = BezierSegment.de_casteljau(control_points)
+        self.assertEqual(left.shape, (2, 3, 4))
+        self.assertTrue(np.allclose(left[0], [[4.0, 0.0, -2.0, 4.0],
+                                              [2.0, 0.5, -2.0, 2.0],
+                                              [2.0, 0.5, -1.0, 2.0]]))
+        self.assertTrue(np.allclose(right[1], [[1.0, 1.0, 0.0, 0.0],
+                                               [1.0, 1.5, 0.0, 0.0],
+                                               [1.0, 2.0, 0.0, 0.0]]))
+
+        self.assertTrue(np.array_equal(BezierSegment.invalid_weights(control_points),
+                                       [True, False]))
+        self.assertTrue(np.array_equal(BezierSegment.invalid_weights(right),
+                                       [False, False]))
+
+        segment = BezierSegment(control_points[0], t_param=(True, [-1.0, 1.0]))
+        self.assertTrue(segment.check_for_control_points_at_infinity())
+        self.assertFalse(segment.check_for_negative_weights())
+        self.assertIsInstance(segment.control_points[1], PointHomogeneous)
+
+        left_curve, right_curve = segment.split_de_casteljau()
+        self.assertEqual(left_curve.t_param_of_motion_curve, (True, [-1.0, 0.0]))
+        self.assertEqual(right_curve.t_param_of_motion_curve, (True, [0.0, 1.0]))
+
 
 class TestRationalSoo(TestCase):
 
@@ -5,6 +5,7 @@ import sympy as sp
 
 from rational_linkages import (PointHomogeneous, RationalCurve, RationalMechanism,
                                DualQuaternion)
+from rational_linkages.models import bennett_ark24
 
 
 class TestRationalCurve(TestCase):
@@ -229,11 +230,59 @@ class TestRationalCurve(TestCase):
         self.assertIsInstance(inversed_curve, RationalCurve)
         self.assertTrue(np.allclose(inversed_curve.coeffs, expected_coeffs))
 
+    def test_cached_views(self):
+        coeffs = np.array([[1.0, 0.0, 2.0, 0.0, 1.0],
+                           [0.5, 0.0, -2.0, 0.0, 1.5],
+                           [0.0, -1.0, 0.0, 3.0, 0.0],
+                           [1.0, 0.0, 2.0, 0.0, 1.0]])
+        obj = RationalCurve.from_coeffs(coeffs)
+
+        # sympy polynomials are created on demand
+        self.assertIsNone(obj._set_of_polynomials)
+        self.assertEqual(obj.set_of_polynomials[2],
+                         sp.Poly(-1.0 * sp.Symbol("t") ** 3 + 3.0 * sp.Symbol("t"),
+                                 sp.Symbol("t")))
+
+        self.assertIs(obj._cached_inverse_curve(), obj._cached_inverse_curve())
+        self.assertIs(obj._cached_curve(), obj._cached_curve())
+        symbolic = obj.symbolic
+
+        # public views are independent copies
+        self.assertIsNot(obj.curve(), obj.curve())
+        obj.curve().coeffs[0, -1] += 1.0
+        obj.inverse_curve().coeffs[0, 0] += 1.0
+        self.assertTrue(np.array_equal(obj.coeffs, coeffs))
+
+        # new coefficients invalidate the views
+        obj.coeffs = np.array([[1.0, 0.0, 1.0], [0.0, 2.0, 0.0]])
+        self.assertEqual(obj.degree, 2)
+        self.assertEqual(obj.dimension, 1)
+        self.assertIsNot(obj.symbolic, symbolic)
+        self.assertTrue(np.allclose(obj._cached_inverse_curve().coeffs,
+                                    [[1.0, 0.0, 1.0], [0.0, 2.0, 0.0]]))
+        self.assertTrue(np.allclose(obj.coeffs_inversed,
+                                    [[1.0, 0.0, 1.0], [0.0, 2.0, 0.0]]))
+        self.assertEqual(len(obj.curve().set_of_polynomials), 2)
+
     def test_evaluate(self):
         coeffs = np.array([[1.0, 0.0, 2.0], [0.5, -2.0, 0.0]])
         curve = RationalCurve.from_coeffs(coeffs)
 
         self.assertTrue(np.allclose(curve.evaluate(2), np.array([6, -2.0])))
+        self.assertTrue(np.allclose(curve.evaluate(2, inverted_part=True),
+                                    np.array([9, -3.5])))
+
+        t_space = np.array([-1.0, 0.0, 2.0])
+        expected = np.array([[3.0, 2.5], [2.0, 0.0], [6.0, -2.0]])
+        self.assertEqual(curve.evaluate(t_space).shape, (3, 2))
+        self.assertTrue(np.allclose(curve.evaluate(t_space), expected))
+
+        mech = bennett_ark24()
+        t = sp.Symbol("t")
+        for t_val in [-2.5, 0.0, 0.3, 100.0]:
+            expected = np.array([p.subs(t, t_val).evalf()
+                                 for p in mech.set_of_polynomials], dtype="float64")
+            self.assertTrue(np.allclose(mech.evaluate(t_val), expected))
 
     def test_evaluate_as_matrix(self):
         t = sp.Symbol("t")
@@ -326,6 +375,53 @@ class TestRationalCurve(TestCase):
         self.assertTrue(np.allclose(y, (0., 0.8)))
         self.assertTrue(np.allclose(z, (0., 0.)))
 
+    def test_get_plot_data_per_sample(self):
+        def pose2point(pose):
+            return DualQuaternion(pose).dq2point_via_matrix()
+
+        # motion curve, compared with the evaluation of single samples
+        m = bennett_ark24()
+        x, y, z = m.get_plot_data((-1, 2), 7)
+        for t_val, point in zip(np.linspace(-1, 2, 7), np.array([x, y, z]).T):
+            self.assertTrue(np.allclose(point, pose2point(m.evaluate(t_val))))
+
+        # closed curve, the first sample at infinity is the inverted part at zero
+        x, y, z = m.get_plot_data('closed', 9)
+        self.assertEqual(len(x), 9)
+        t_space = np.tan(np.linspace(-np.pi/2, np.pi/2, 10))[:9]
+        for t_val, point in zip(t_space[1:], np.array([x, y, z]).T[1:]):
+            self.assertTrue(np.allclose(point, pose2point(m.evaluate(t_val))))
+        self.assertTrue(np.allclose([x[0], y[0], z[0]],
+                                    pose2point(m.evaluate(0., inverted_part=True))))
+
+        # point curve
+        curve = RationalCurve.from_coeffs(np.array(
+            [[1., 0., 2., 0., 1.],
+             [0.5, 0., -2., 0., 1.5],
+             [0., -1., 0., 3., 0.],
+             [1., 0., 2., 0., 1.]]))
+        x, y, z = curve.get_plot_data('closed', 5)
+        t_space = np.tan(np.linspace(-np.pi/2, np.pi/2, 6))[:5]
+        for t_val, point in zip(t_space[1:], np.array([x, y, z]).T[1:]):
+            self.assertTrue(np.allclose(
+                point, PointHomogeneous(curve.evaluate(t_val)).normalized_in_3d()))
+        point_inf = PointHomogeneous(curve.evaluate(0., inverted_part=True))
+        self.assertTrue(np.allclose([x[0], y[0], z[0]], point_inf.normalized_in_3d()))
+
+    def test_get_path_length(self):
+        m = bennett_ark24()
+
+        # per-sample evaluation, the end samples at infinity by the inverted part
+        t_space = np.tan(np.linspace(-np.pi/2, np.pi/2, 50))[1:-1]
+        poses = ([m.evaluate(0., inverted_part=True)]
+                 + [m.evaluate(t_val) for t_val in t_space]
+                 + [m.evaluate(0., inverted_part=True)])
+        points = np.array([DualQuaternion(pose).dq2point_via_matrix()
+                           for pose in poses])
+        expected = np.sum(np.linalg.norm(np.diff(points, axis=0), axis=1))
+
+        self.assertTrue(np.isclose(m.get_path_length(50), expected))
+
     def test_get_curve_in_pr12(self):
         t = sp.Symbol("t")
         curve = RationalCurve([sp.Poly(1.0 * t ** 2 - 2.0, t),
@@ -410,4 +506,30 @@ class TestRationalCurve(TestCase):
         self.assertRaises(ValueError, curve.split_in_equal_segments, [1., 0.])
         self.assertRaises(ValueError,
                           curve.split_in_equal_segments, [0., 2.],
-                          num_segments=-2)
\ No newline at end of file
+                          num_segments=-2)
+
+    def test_arc_length_table(self):
+        # translation along x-axis, x(t) = t ** 2
+        curve = RationalCurve.from_coeffs(np.array([[0., 0., 1.],
+                                                    [0., 0., 0.],
+                                                    [0., 0., 0.],
+                                                    [0., 0., 0.],
+                                                    [0., 0., 0.],
+                                                    [-0.5, 0., 0.],
+                                                    [0., 0., 0.],
+                                                    [0., 0., 0.]]))
+
+        speed = curve.point_path_speed(np.array([0., 1., 2.]))
+        self.assertTrue(np.allclose(speed, [0., 2., 4.]))
+
+        breakpoints, cumulative = curve.arc_length_table([0., 2.])
+        self.assertEqual(breakpoints[0], 0.)
+        self.assertEqual(breakpoints[-1], 2.)
+        self.assertTrue(np.allclose(cumulative, breakpoints ** 2))
+
+        t = curve.arc_length_to_t(np.array([0., 1., 2.25, 4.]),
+                                  (breakpoints, cumulative))
+        self.assertTrue(np.allclose(t, [0., 1., 1.5, 2.]))
+
+        t_segments = curve.split_in_equal_segments([0., 2.], num_segments=4)
+        self.assertTrue(np.allclose(t_segments, np.sqrt([0., 1., 2., 3., 4.])))
@@ -2,8 +2,10 @@ from unittest import TestCase
 import os
 
 import numpy as np
+import sympy as sp
 
-from rational_linkages import (DualQuaternion, MotionFactorization, NormalizedLine,
+from rational_linkages import (DualQuaternion, LineSegment, MotionFactorization,
+                               NormalizedLine,
                                RationalMechanism, CollisionFreeOptimization,
                                PointHomogeneous, RationalCurve,
                                TransfMatrix)
@@ -190,10 +192,62 @@ class TestRationalMechanism(TestCase):
         res = m.collision_check(parallel=False, terminate_on_first=True)
         self.assertTrue(np.allclose(res, [0]))
 
+        res = m.collision_check(parallel=False, broad_phase=True)
+        res[1] = 1 / res[1]
+        self.assertTrue(np.allclose(res, [0, 0]))
+
+        # the analyser is reused, its orbits only while the design does not change
+        analyser = m.collision_analyser
+        splits = analyser.bezier_splits
+        orbit_arrays = dict(analyser.segment_orbit_arrays)
+        self.assertTrue(orbit_arrays)
+
+        m.collision_check(parallel=False, broad_phase=True)
+        self.assertIs(m.collision_analyser, analyser)
+        self.assertIs(analyser.bezier_splits, splits)
+        for key, arrays in orbit_arrays.items():
+            self.assertIs(analyser.segment_orbit_arrays[key], arrays)
+        self.assertIs(analyser.segments['l_00'], m.segments[0])
+
+        f2.set_joint_connection_points([PointHomogeneous([1, -0.16666667, 0, 0]),
+                                        PointHomogeneous([1, -0.16666667, 0, -0.1]),
+                                        PointHomogeneous([1, -0.66666667, 0, 0.2]),
+                                        PointHomogeneous([1, -0.66666667, 0, 0])])
+        m.collision_check(parallel=False, broad_phase=True)
+        self.assertIs(analyser.bezier_splits, splits)
+        self.assertFalse(any(analyser.segment_orbit_arrays.get(key) is arrays
+                             for key, arrays in orbit_arrays.items()))
+
         res = m.collision_check(parallel=True, only_links=True)
         isnone = res is None
         self.assertTrue(isnone)
 
+    def test_colliding_lines(self):
+        t = sp.Symbol("t")
+        m = bennett_ark24()
+        l0 = NormalizedLine()
+        l1 = NormalizedLine([1, 0, 0, 0, 1, 0.5 - t])
+
+        sol, pts = m.colliding_lines(l0, l1)
+        self.assertTrue(np.allclose(sol, [0.5]))
+        self.assertEqual(len(pts), 1)
+        self.assertTrue(np.allclose(pts[0].normalized_in_3d(), [0, 0, 1]))
+
+        sol = m.collision_polynomial_roots(LineSegment.get_plucker_coeffs(l0),
+                                           LineSegment.get_plucker_coeffs(l1))
+        self.assertTrue(np.allclose(sol, [0.5]))
+
+        pts = m.get_intersection_points_batch(
+            np.array([l0.screw, l0.screw]), np.array([[1, 0, 0, 0, 1, 0],
+                                                      [0, 0, 2, 0, 2, 0]]))
+        self.assertTrue(np.allclose(pts, [[0, 0, 1], [0, 0, 0]]))
+
+        # no collision of parallel lines
+        l2 = NormalizedLine([0, 0, 1, 0, 1, 0])
+        sol = m.collision_polynomial_roots(LineSegment.get_plucker_coeffs(l0),
+                                           LineSegment.get_plucker_coeffs(l2))
+        self.assertEqual(len(sol), 0)
+
     def test_get_motion_curve(self):
         mech = bennett_ark24()
         curve = mech.get_motion_curve()
@@ -394,6 +448,51 @@ class TestRationalMechanism(TestCase):
         ik_t = m.factorizations[0].joint_angle_to_t_param(ik_angle)
         self.assertTrue(np.allclose(ik_t, expexted_t))
 
+    def test_inverse_kinematics_batch(self):
+        m = bennett_ark24()
+
+        joint_angles = np.linspace(0., 6., 7)
+        poses = [m.forward_kinematics(angle) for angle in joint_angles]
+
+        ik_batch = m.inverse_kinematics_batch(poses)
+        self.assertEqual(ik_batch.shape, (7,))
+        self.assertTrue(np.allclose(ik_batch, joint_angles))
+
+        ik_single = [m.inverse_kinematics(pose) for pose in poses]
+        self.assertTrue(np.allclose(ik_batch, ik_single))
+
+        ik_deg = m.inverse_kinematics_batch(poses, unit='deg')
+        self.assertTrue(np.allclose(ik_deg, np.rad2deg(joint_angles)))
+
+        t_params = m.ik_solver.solve(poses)
+        self.assertTrue(np.allclose(
+            m.factorizations[0].t_param_to_joint_angle(t_params), joint_angles))
+
+    def test_inverse_kinematics_algebraic(self):
+        m = collisions_free_6r()
+
+        joint_angles = np.linspace(0., 6., 7)
+        poses = [m.forward_kinematics(angle) for angle in joint_angles]
+
+        ik_res = m.inverse_kinematics(poses[2], method='algebraic')
+        self.assertTrue(np.isclose(ik_res, joint_angles[2]))
+
+        ik_batch = m.inverse_kinematics_batch(poses, method='algebraic')
+        self.assertTrue(np.allclose(ik_batch, joint_angles))
+
+        ik_all = m.inverse_kinematics_all(poses, unit='t')
+        self.assertEqual(len(ik_all), 7)
+        for t_solutions, pose in zip(ik_all, poses):
+            self.assertEqual(len(t_solutions), 1)
+            fk = DualQuaternion(m.evaluate(t_solutions[0])) * m.tool_frame
+            self.assertTrue(np.allclose(fk.array() / fk[0], pose.array() / pose[0]))
+
+        # pose out of the Study quadric is not reachable
+        unreachable = DualQuaternion([1, 0, 0, 0, 1, 0, 0, 0])
+        self.assertEqual(len(m.inverse_kinematics_all([unreachable])[0]), 0)
+        self.assertRaises(ValueError, m.inverse_kinematics, unreachable,
+                          method='algebraic')
+
     def test_forward_kinematics(self):
         m = bennett_ark24()
 
@@ -477,3 +576,30 @@ class TestRationalMechanism(TestCase):
         fk_res = m.forward_kinematics(joint_angle)
         ik_res = m.inverse_kinematics(fk_res)
         self.assertTrue(np.allclose(ik_res, joint_angle))
+
+    def test_forward_kinematics_batch(self):
+        m = bennett_ark24()
+
+        joint_angles = np.array([0.0, 1.5707963267948966, np.pi, -2.0, 4.0])
+        fk_batch = m.forward_kinematics_batch(joint_angles)
+        self.assertEqual(fk_batch.shape, (5, 8))
+
+        for i, angle in enumerate(joint_angles):
+            fk = m.forward_kinematics(angle)
+            self.assertTrue(np.allclose(fk_batch[i], fk.array()))
+
+        fk_mat = m.forward_kinematics_batch(np.rad2deg(joint_angles),
+                                            unit='deg',
+                                            as_matrix=True)
+        self.assertEqual(fk_mat.shape, (5, 4, 4))
+        for i, angle in enumerate(joint_angles):
+            fk = m.forward_kinematics(angle)
+            self.assertTrue(np.allclose(fk_mat[i], fk.dq2matrix()))
+
+        t_vals = np.array([-1.0, 0.5, 3.0])
+        fk_t = m.forward_kinematics_batch(t_vals, unit='t')
+        for i, t_val in enumerate(t_vals):
+            fk = DualQuaternion(m.evaluate(t_val)) * m.tool_frame
+            self.assertTrue(np.allclose(fk_t[i], fk.array()))
+
+        self.assertRaises(ValueError, m.forward_kinematics_batch, t_vals, unit='m')
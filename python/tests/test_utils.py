@@ -1,7 +1,12 @@
 from unittest import TestCase
+import numpy as np
 import sympy
 
-from rational_linkages.utils import is_package_installed, sum_of_squares, dq_algebraic2vector, extract_coeffs
+from rational_linkages import DualQuaternion, PointHomogeneous
+from rational_linkages.utils import (is_package_installed, sum_of_squares,
+                                     dq_algebraic2vector, extract_coeffs,
+                                     dq_array_mul, dq_array2matrix, dq_poly_mul,
+                                     dq_array_act_on_points)
 
 
 class TestUtils(TestCase):
@@ -81,3 +86,59 @@ class TestUtils(TestCase):
         eq = 5 * x ** 4 - 3 * x
         expected_coeffs = [5, 0, 0, -3, 0]
         self.assertEqual(extract_coeffs(eq, x, 4), expected_coeffs)
+
+    def test_dq_array_mul(self):
+        a = np.random.uniform(-1, 1, (5, 8))
+        b = np.random.uniform(-1, 1, (5, 8))
+
+        res = dq_array_mul(a, b)
+        self.assertEqual(res.shape, (5, 8))
+        for i in range(5):
+            expected = DualQuaternion(a[i]) * DualQuaternion(b[i])
+            self.assertTrue(np.allclose(res[i], expected.array()))
+
+        # broadcasting of a single dual quaternion
+        res = dq_array_mul(a, b[0])
+        for i in range(5):
+            expected = DualQuaternion(a[i]) * DualQuaternion(b[0])
+            self.assertTrue(np.allclose(res[i], expected.array()))
+
+    def test_dq_array_act_on_points(self):
+        dqs = np.random.uniform(-1, 1, (5, 8))
+        points = np.random.uniform(-1, 1, (5, 4))
+        points[:, 0] = 1.
+
+        res = dq_array_act_on_points(dqs, points)
+        self.assertEqual(res.shape, (5, 4))
+        for i in range(5):
+            expected = DualQuaternion(dqs[i]).act(PointHomogeneous(points[i]))
+            self.assertTrue(np.allclose(res[i] / res[i, 0],
+                                        expected.normalize()))
+
+    def test_dq_poly_mul(self):
+        a = np.random.uniform(-1, 1, (3, 8))
+        b = np.random.uniform(-1, 1, (2, 8))
+
+        res = dq_poly_mul(a, b)
+        self.assertEqual(res.shape, (4, 8))
+
+        # evaluate both sides at a given parameter
+        t = 0.7
+        a_t = sum(a[i] * t ** i for i in range(3))
+        b_t = sum(b[i] * t ** i for i in range(2))
+        res_t = sum(res[i] * t ** i for i in range(4))
+        expected = DualQuaternion(a_t) * DualQuaternion(b_t)
+        self.assertTrue(np.allclose(res_t, expected.array()))
+
+    def test_dq_array2matrix(self):
+        dqs = np.random.uniform(-1, 1, (4, 8))
+
+        res = dq_array2matrix(dqs)
+        self.assertEqual(res.shape, (4, 4, 4))
+        for i in range(4):
+            self.assertTrue(np.allclose(res[i], DualQuaternion(dqs[i]).dq2matrix()))
+
+        res = dq_array2matrix(dqs, normalize=False)
+        for i in range(4):
+            self.assertTrue(np.allclose(
+                res[i], DualQuaternion(dqs[i]).dq2matrix(normalize=False)))